@@ -0,0 +1,53 @@
+"""Núcleo dos tradutores do Emperor, sem interface gráfica
+
+Formatos .eng, arquivo _TRADUZIR.txt, memória de tradução, índices de pesquisa, glossário,
+validação de códigos e a sessão que junta tudo. Importar o pacote não abre janela nem lê
+arquivos; Emperor_tradutor.py e zeus_tradutor.py (EmperorMM) são só a configuração de
+cada formato em cima dele (a interface Tk é o módulo interface; a linha de comando, o cli).
+
+    from nucleo_traducao import EmperorTextFile, TranslatorSession
+
+    sessao = TranslatorSession(EmperorTextFile, "EmperorText.eng", "EmperorText_TRADUZIR.txt")
+    print(sessao.status().summary())
+    updates, rejeitadas = sessao.validate_paste(open("lote.txt", encoding="utf-8"))
+    sessao.merge(updates)
+    sessao.apply_updates(updates)
+    sessao.build()
+
+Módulos:
+    binario        tabela de células e gravação incremental comuns aos .eng
+    emperor_text   formato do EmperorText.eng (EmperorTextFile)
+    emperor_mm     formato do EmperorMM.eng (EmperorMMFile)
+    registros      leitor do _TRADUZIR, TranslationStore e TranslationStatus
+    memoria        memória de tradução exata, aproximada e compartilhada
+    indices        índices de palavras e de trigramas
+    glossario      glossário EN → PT
+    validacao      códigos de controle
+    banco          banco SQLite opcional (TranslationDB; linha de comando em traducao_db.py)
+    sessao         TranslatorSession
+    cli            linha de comando dos tradutores (executar_cli)
+    interface      interface Tk dos tradutores (abrir_interface; importa tkinter e pyperclip)
+"""
+from .binario import CP1252_CHARS, DeltaPlan, descrever_analise
+from .emperor_text import ZeusTextFile as EmperorTextFile
+from .emperor_mm import ZeusTextFile as EmperorMMFile
+from .registros import (ler_registros, formatar_bloco, TranslationStore, TranslationStatus,
+                        anotar_bloco, anotar_sugestoes)
+from .memoria import (hash_original, distancia_edicao, TranslationMemory, FuzzyMemory,
+                      FileLock, SharedMemory)
+from .indices import remover_acentos, WordIndex, TrigramIndex
+from .glossario import AhoCorasick, Glossary, descrever_termos, anotar_glossario
+from .validacao import codigos_de_controle, validar_codigos, anotar_codigos
+from .banco import TranslationDB
+from .sessao import abrir_banco, TranslatorSession
+
+__all__ = [
+    'CP1252_CHARS', 'DeltaPlan', 'descrever_analise',
+    'EmperorTextFile', 'EmperorMMFile',
+    'ler_registros', 'formatar_bloco', 'TranslationStore', 'TranslationStatus', 'anotar_bloco', 'anotar_sugestoes',
+    'hash_original', 'distancia_edicao', 'TranslationMemory', 'FuzzyMemory', 'FileLock', 'SharedMemory',
+    'remover_acentos', 'WordIndex', 'TrigramIndex',
+    'AhoCorasick', 'Glossary', 'descrever_termos', 'anotar_glossario',
+    'codigos_de_controle', 'validar_codigos', 'anotar_codigos',
+    'TranslationDB', 'abrir_banco', 'TranslatorSession',
+]
@@ -0,0 +1,219 @@
+"""Banco SQLite opcional com as células de tradução do Emperor
+
+Guarda as células de EmperorText, EmperorMM e EmperorEventmsg em um único arquivo
+SQLite, indexado por (asset, cell_id), pelo hash do texto original e pelo status da
+tradução. Os conversores importam/exportam o formato _TRADUZIR.txt (OFFSET / CELULA /
+ORIGINAL [N chars] / TRADUÇÃO), então o fluxo de copiar/colar com o LLM continua igual.
+A linha de comando fica em traducao_db.py, na raiz do projeto.
+"""
+import re
+import sqlite3
+
+from .registros import ler_registros, formatar_bloco
+from .memoria import hash_original
+
+EVENTMSG_RE = re.compile(r'^(\s*)(PHRASE_\w+)(\s+)"(.*)"(\s*)$')
+
+EVENTMSG_ASSET = "EmperorEventmsg"
+
+# Status da célula (coluna status)
+STATUS_NAO_TRADUZIDA = 0
+STATUS_TRADUZIDA = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cells (
+    asset TEXT NOT NULL,
+    cell_id INTEGER NOT NULL,
+    offset INTEGER,
+    refs TEXT,
+    original_length INTEGER,
+    original TEXT NOT NULL,
+    original_hash TEXT NOT NULL,
+    translation TEXT NOT NULL DEFAULT '',
+    status INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (asset, cell_id)
+);
+CREATE INDEX IF NOT EXISTS idx_cells_hash ON cells(original_hash);
+CREATE INDEX IF NOT EXISTS idx_cells_status ON cells(asset, status, cell_id);
+CREATE TABLE IF NOT EXISTS assets (
+    asset TEXT PRIMARY KEY,
+    header TEXT NOT NULL DEFAULT ''
+);
+"""
+
+# ---------------- BANCO ---------------- #
+
+class TranslationDB:
+    """Células de tradução de vários assets em um arquivo SQLite"""
+
+    COLUMNS = "asset, cell_id, offset, refs, original_length, original, translation, status"
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.create_function("py_lower", 1, str.lower)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _record(self, row):
+        """Linha do banco como o dict de registro dos tradutores (com o bloco já formatado)"""
+        if row is None:
+            return None
+        record = dict(row)
+        record['block'] = formatar_bloco(record)
+        return record
+
+    def import_records(self, asset, records, header=None):
+        """Grava (insere ou substitui) as células de um asset; retorna quantas foram gravadas"""
+        rows = []
+        for record in records:
+            if record['cell_id'] is None or record['original'] is None:
+                continue
+            translation = record['translation'] or ''
+            rows.append((
+                asset, record['cell_id'], record['offset'], record['refs'],
+                record['original_length'], record['original'], hash_original(record['original']),
+                translation, STATUS_TRADUZIDA if translation else STATUS_NAO_TRADUZIDA
+            ))
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO cells (asset, cell_id, offset, refs, original_length, "
+                "original, original_hash, translation, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows)
+            if header is not None:
+                self.conn.execute("INSERT OR REPLACE INTO assets (asset, header) VALUES (?, ?)",
+                                  (asset, header))
+        return len(rows)
+
+    def has_asset(self, asset):
+        row = self.conn.execute("SELECT 1 FROM cells WHERE asset = ? LIMIT 1", (asset,)).fetchone()
+        return row is not None
+
+    def get(self, asset, cell_id):
+        row = self.conn.execute(f"SELECT {self.COLUMNS} FROM cells WHERE asset = ? AND cell_id = ?",
+                                (asset, cell_id)).fetchone()
+        return self._record(row)
+
+    def iter_records(self, asset):
+        """Todas as células do asset em ordem de cell_id"""
+        cursor = self.conn.execute(f"SELECT {self.COLUMNS} FROM cells WHERE asset = ? ORDER BY cell_id",
+                                   (asset,))
+        for row in cursor:
+            yield self._record(row)
+
+    def untranslated(self, asset, limit, distinct=False):
+        """As `limit` primeiras células não traduzidas (índice por status)
+        
+        distinct=True devolve só a primeira célula de cada original repetido.
+        """
+        query = f"SELECT {self.COLUMNS} FROM cells WHERE asset = ? AND status = ?"
+        params = [asset, STATUS_NAO_TRADUZIDA]
+        if distinct:
+            query += (" AND cell_id IN (SELECT MIN(cell_id) FROM cells WHERE asset = ? AND status = ?"
+                      " GROUP BY original_hash)")
+            params += [asset, STATUS_NAO_TRADUZIDA]
+        rows = self.conn.execute(query + " ORDER BY cell_id LIMIT ?", params + [limit]).fetchall()
+        return [self._record(row) for row in rows]
+
+    def search(self, asset, palavra):
+        """Células com `palavra` (minúsculas) no original ou na tradução"""
+        # py_lower: o lower() do SQLite só trata ASCII
+        rows = self.conn.execute(
+            f"SELECT {self.COLUMNS} FROM cells WHERE asset = ? AND "
+            f"(instr(py_lower(original), ?) > 0 OR instr(py_lower(translation), ?) > 0) ORDER BY cell_id",
+            (asset, palavra.lower(), palavra.lower())).fetchall()
+        return [self._record(row) for row in rows]
+
+    def find_by_original(self, original, asset=None):
+        """Células (de qualquer asset, ou só de `asset`) com exatamente esse texto original"""
+        query = f"SELECT {self.COLUMNS} FROM cells WHERE original_hash = ?"
+        params = [hash_original(original)]
+        if asset is not None:
+            query += " AND asset = ?"
+            params.append(asset)
+        rows = self.conn.execute(query + " ORDER BY asset, cell_id", params).fetchall()
+        return [self._record(row) for row in rows if row['original'] == original]
+
+    def set_translations(self, asset, updates):
+        """Grava {cell_id: tradução}; retorna quantas células existiam no banco"""
+        with self.conn:
+            cursor = self.conn.executemany(
+                "UPDATE cells SET translation = ?, status = ? WHERE asset = ? AND cell_id = ?",
+                [(text, STATUS_TRADUZIDA if text else STATUS_NAO_TRADUZIDA, asset, cell_id)
+                 for cell_id, text in updates.items()])
+        return cursor.rowcount
+
+    def stats(self, asset=None):
+        """{asset: (total, traduzidas)}"""
+        query = "SELECT asset, COUNT(*) AS total, SUM(status = ?) AS traduzidas FROM cells"
+        params = [STATUS_TRADUZIDA]
+        if asset is not None:
+            query += " WHERE asset = ?"
+            params.append(asset)
+        rows = self.conn.execute(query + " GROUP BY asset ORDER BY asset", params).fetchall()
+        return {row['asset']: (row['total'], row['traduzidas'] or 0) for row in rows}
+
+    # ---- Conversores ---- #
+
+    def import_traduzir(self, asset, path):
+        """Importa um arquivo _TRADUZIR.txt (o cabeçalho de comentários é guardado para a exportação)"""
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        header = content.split("\n\n", 1)[0] + "\n\n" if content.startswith("#") else ""
+        return self.import_records(asset, ler_registros(content.splitlines()), header=header)
+
+    def export_traduzir(self, asset, path):
+        """Gera o arquivo _TRADUZIR.txt do asset (um bloco por célula, em ordem de cell_id)"""
+        row = self.conn.execute("SELECT header FROM assets WHERE asset = ?", (asset,)).fetchone()
+        count = 0
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(row['header'] if row is not None else "")
+            for record in self.iter_records(asset):
+                f.write(formatar_bloco(record) + "\n\n")
+                count += 1
+        return count
+
+    def import_eventmsg(self, path, asset=EVENTMSG_ASSET):
+        """Importa as linhas PHRASE_x "texto" do EmperorEventmsg.txt (cell_id = número da linha)"""
+        records = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                match = EVENTMSG_RE.match(line.rstrip('\r\n'))
+                if match:
+                    records.append({
+                        'cell_id': line_num,
+                        'offset': None,
+                        'refs': match.group(2),
+                        'original_length': len(match.group(4)),
+                        'original': match.group(4),
+                        'translation': ''
+                    })
+        return self.import_records(asset, records)
+
+    def export_eventmsg(self, path, asset=EVENTMSG_ASSET):
+        """Reescreve o EmperorEventmsg.txt trocando o texto entre aspas das linhas traduzidas"""
+        translations = {r['cell_id']: (r['refs'], r['translation'])
+                        for r in self.iter_records(asset) if r['translation']}
+
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            lines = f.readlines()
+
+        count = 0
+        for index, line in enumerate(lines):
+            entry = translations.get(index + 1)
+            if entry is None:
+                continue
+            body = line.rstrip('\r\n')
+            match = EVENTMSG_RE.match(body)
+            if match and match.group(2) == entry[0]:
+                lines[index] = (f'{match.group(1)}{match.group(2)}{match.group(3)}"{entry[1]}"'
+                                f'{match.group(5)}{line[len(body):]}')
+                count += 1
+
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.writelines(lines)
+        return count
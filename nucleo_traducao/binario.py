@@ -0,0 +1,419 @@
+"""Tabela de células e gravação incremental comuns aos arquivos .eng do Emperor"""
+import os
+import mmap
+import zlib
+import bisect
+import pickle
+import struct
+from array import array
+
+# Cache da estrutura parseada (arquivo ao lado do .eng)
+CACHE_SUFFIX = ".cache"
+CACHE_VERSION = 1
+# Cache ausente, truncado, de outra versão ou de outro programa: volta ao parse normal
+# (um pickle estranho pode falhar com quase qualquer erro ao carregar ou ao restaurar)
+CACHE_ERRORS = (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError, ValueError,
+                AttributeError, IndexError, ImportError)
+
+# Caracteres que o cp1252 grava (1 byte cada); o null separa as células no Data block
+CP1252_CHARS = frozenset(bytes([code]).decode('cp1252', errors='ignore') for code in range(1, 256)) - {''}
+
+# ---------------- CACHE ---------------- #
+
+def ler_cache(path, signature, restore):
+    """Chama restore(payload) com o cache de `path` se a versão e a assinatura baterem
+    
+    Retorna False (parse normal) se o cache não existe, não vale mais ou está corrompido.
+    """
+    try:
+        with open(path, 'rb') as f:
+            cached = pickle.load(f)
+        if (not isinstance(cached, dict) or cached.get('version') != CACHE_VERSION
+                or cached['signature'] != signature):
+            return False
+        restore(cached['payload'])
+    except CACHE_ERRORS:
+        return False
+    return True
+
+def gravar_cache(path, signature, payload):
+    """Grava o cache da estrutura parseada (falha só gera aviso)"""
+    try:
+        with open(path, 'wb') as f:
+            pickle.dump({'version': CACHE_VERSION, 'signature': signature, 'payload': payload},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (OSError, pickle.PicklingError) as e:
+        print(f"⚠️ Não foi possível gravar o cache: {e}")
+
+# ---------------- TABELA DE CÉLULAS ---------------- #
+
+class CellView:
+    """Acesso estilo dicionário a uma célula da CellTable (compatível com o formato antigo)
+    
+    Aqui ficam os campos comuns; cada formato acrescenta os seus em KEYS e no __getitem__.
+    """
+    __slots__ = ('table', 'index')
+    KEYS = ('cell_id', 'original_bytes', 'modified', 'new_text')
+    
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+    
+    def __getitem__(self, key):
+        table, index = self.table, self.index
+        if key == 'cell_id':
+            return index + 1
+        if key == 'original_bytes':
+            return table.get_bytes(index)
+        if key == 'modified':
+            return table.is_modified(index)
+        if key == 'new_text':
+            return table.new_texts.get(index)
+        return table.extras.get(index, {})[key]
+    
+    def __setitem__(self, key, value):
+        table, index = self.table, self.index
+        if key == 'modified':
+            table.set_modified(index, value)
+        elif key == 'new_text':
+            if value is None:
+                table.new_texts.pop(index, None)
+            else:
+                table.new_texts[index] = value
+        elif key in self.KEYS:
+            raise KeyError(f"Campo somente leitura: {key}")
+        else:
+            table.extras.setdefault(index, {})[key] = value
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __contains__(self, key):
+        return key in self.KEYS or key in self.table.extras.get(self.index, {})
+    
+    def keys(self):
+        return list(self.KEYS) + list(self.table.extras.get(self.index, {}))
+    
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+    
+    def __repr__(self):
+        return f"<Célula {self.index + 1} offset=0x{self.table.offsets[self.index]:X}>"
+
+class CellTable:
+    """Tabela compacta de células: offsets/tamanhos em arrays, bitset de modificadas e dicionários esparsos
+    
+    Cada formato (emperor_text, emperor_mm) estende a tabela com os seus campos e a sua
+    CellView (view_class).
+    """
+    view_class = None
+    
+    def __init__(self, source, data_start):
+        self.source = source          # Buffer do arquivo (bytes ou mmap)
+        self.data_start = data_start
+        self.offsets = array('I')     # Offset de cada célula relativo ao Data block
+        self.lengths = array('I')     # Tamanho em bytes (sem o null)
+        self.modified_bits = bytearray()
+        self.new_texts = {}           # índice → texto novo (apenas células traduzidas)
+        self.extras = {}              # índice → {chave: valor} para campos avulsos
+    
+    def append(self, data_offset, length):
+        index = len(self.offsets)
+        self.offsets.append(data_offset)
+        self.lengths.append(length)
+        if index % 8 == 0:
+            self.modified_bits.append(0)
+        return index
+    
+    def __len__(self):
+        return len(self.offsets)
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.offsets)
+        if not 0 <= index < len(self.offsets):
+            raise IndexError(index)
+        return self.view_class(self, index)
+    
+    def __iter__(self):
+        for index in range(len(self.offsets)):
+            yield self.view_class(self, index)
+    
+    def get_bytes(self, index):
+        start = self.data_start + self.offsets[index]
+        return self.source[start:start + self.lengths[index]]
+    
+    def is_modified(self, index):
+        return bool(self.modified_bits[index >> 3] & (1 << (index & 7)))
+    
+    def set_modified(self, index, flag):
+        if flag:
+            self.modified_bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.modified_bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+    
+    def modified_count(self):
+        return bin(int.from_bytes(self.modified_bits, 'little')).count('1')
+    
+    def encode_new_text(self, index):
+        """Bytes do texto novo de uma célula (cp1252, com fallback para latin-1)"""
+        text = self.new_texts[index]
+        try:
+            return text.encode('cp1252')
+        except:
+            return text.encode('latin-1', errors='replace')
+    
+    def encode_many(self, indices):
+        """Codifica os textos novos de várias células num encode só
+        
+        Retorna ({índice: bytes}, {índice: caracteres fora do cp1252}). As células com
+        caracteres inválidos usam o fallback do encode_new_text ('?' no lugar deles).
+        """
+        texts = [self.new_texts[index] for index in indices]
+        joined = '\x00'.join(texts)
+        invalid = {}
+        if not set(joined) - {'\x00'} <= CP1252_CHARS or joined.count('\x00') != max(len(texts) - 1, 0):
+            for index, text in zip(indices, texts):
+                chars = set(text) - CP1252_CHARS
+                if chars:
+                    invalid[index] = ''.join(sorted(chars))
+            valid = [index for index in indices if index not in invalid]
+            joined = '\x00'.join(self.new_texts[index] for index in valid)
+        else:
+            valid = indices
+        
+        encoded = dict(zip(valid, joined.encode('cp1252').split(b'\x00'))) if valid else {}
+        for index in invalid:
+            encoded[index] = self.encode_new_text(index)
+        return encoded, invalid
+    
+    def rebase(self, source, offsets, lengths):
+        """Passa a apontar para o arquivo salvo: novos offsets/tamanhos, sem modificações pendentes"""
+        self.source = source
+        self.offsets = array('I', offsets)
+        self.lengths = array('I', lengths)
+        self.modified_bits = bytearray(len(self.modified_bits))
+        self.new_texts = {}
+
+class DeltaPlan:
+    """Plano de gravação incremental: novos bytes das células modificadas e soma acumulada dos deltas"""
+    def __init__(self, cells):
+        self.cells = cells
+        self.modified = sorted(i for i, text in cells.new_texts.items() if text and cells.is_modified(i))
+        # Todas as células num encode só; invalid = {índice: caracteres fora do cp1252}
+        self.encoded, self.invalid = cells.encode_many(self.modified)
+        # O null iria cru para o arquivo e dividiria a célula no Data block: não pode ser gravado
+        self.nulls = sorted(index for index, chars in self.invalid.items() if '\x00' in chars)
+        self.starts = []        # Offsets (no Data block) das células modificadas, em ordem
+        self.cumulative = [0]   # cumulative[k] = soma dos deltas das k primeiras modificadas
+        for index in self.modified:
+            self.starts.append(cells.offsets[index])
+            self.cumulative.append(self.cumulative[-1] + len(self.encoded[index]) - cells.lengths[index])
+    
+    def shift(self, data_offset):
+        """Deslocamento de um offset do Data block (só as modificadas ANTES dele contam)"""
+        return self.cumulative[bisect.bisect_left(self.starts, data_offset)]
+    
+    def build_tail(self, data):
+        """Retorna (início da cauda no arquivo, bytes novos da cauda até o fim do arquivo)"""
+        cells = self.cells
+        tail_start = cells.data_start + self.starts[0]
+        tail = bytearray()
+        pos = tail_start
+        for index in self.modified:
+            start = cells.data_start + cells.offsets[index]
+            tail += data[pos:start]
+            tail += self.encoded[index]
+            pos = start + cells.lengths[index]
+        tail += data[pos:]
+        return tail_start, tail
+    
+    def new_offsets(self):
+        return [offset + self.shift(offset) for offset in self.cells.offsets]
+    
+    def new_lengths(self):
+        lengths = array('I', self.cells.lengths)
+        for index, encoded in self.encoded.items():
+            lengths[index] = len(encoded)
+        return lengths
+
+# ---------------- ARQUIVO .ENG ---------------- #
+
+class EngFile:
+    """Partes comuns aos arquivos .eng: leitura (mmap e cache), análise e gravação incremental
+    
+    Cada formato define DATA_START, POINTER_LABEL, o parse em load(), o conteúdo do cache
+    (_cache_payload/_restore_cache), os ponteiros que mudam (_offset_patches) e como
+    relê esses ponteiros depois de gravar (_rebase_pointers).
+    """
+    DATA_START = None     # Início do Data block no arquivo
+    POINTER_LABEL = None  # O que o save_incremental desloca neste formato
+    
+    def __init__(self, filename):
+        self.filename = filename
+        self.data = None
+        self.header = None
+        self.groups = []
+        self.strings = []    # CellTable após o load
+        self._file = None
+        self._mmap = None
+    
+    def _read_data(self, use_mmap):
+        """self.data com o conteúdo do arquivo (use_mmap=True: o próprio arquivo mapeado)"""
+        if use_mmap:
+            self._file = open(self.filename, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.data = self._mmap
+        else:
+            with open(self.filename, 'rb') as f:
+                self.data = f.read()
+
+    def cache_path(self):
+        return self.filename + CACHE_SUFFIX
+
+    def _file_signature(self):
+        """(tamanho, mtime, crc32) do arquivo - o crc32 é calculado sobre self.data já lido"""
+        st = os.stat(self.filename)
+        return (st.st_size, st.st_mtime_ns, zlib.crc32(self.data))
+
+    def load_cache(self):
+        """Restaura a estrutura do cache se ele bater com o arquivo (tamanho, mtime e hash)"""
+        if not ler_cache(self.cache_path(), self._file_signature(), self._restore_cache):
+            return False
+        print(f"✓ Estrutura carregada do cache: {self.cache_path()} ({len(self.strings)} células)")
+        return True
+
+    def write_cache(self):
+        """Grava a estrutura já parseada em um arquivo ao lado do binário"""
+        gravar_cache(self.cache_path(), self._file_signature(), self._cache_payload())
+
+    def close(self, keep_data=False):
+        """Libera o mmap do modo use_mmap (keep_data=True mantém uma cópia em memória para as células)"""
+        if self._mmap is None:
+            return
+        if keep_data:
+            self.data = self._mmap[:]
+        else:
+            self.data = None
+        if isinstance(self.strings, CellTable):
+            self.strings.source = self.data
+        self._mmap.close()
+        self._file.close()
+        self._mmap = None
+        self._file = None
+
+    def get_string_by_cell_id(self, cell_id):
+        """Retorna string pelo ID (1-based)"""
+        if 1 <= cell_id <= len(self.strings):
+            return self.strings[cell_id - 1]
+        return None
+
+    def analyze_build(self):
+        """Analisa a próxima gravação sem gravar nada
+        
+        Retorna (plan, relatório): caracteres fora do cp1252 e crescimento por célula,
+        tamanho final do Data block e quantos ponteiros mudam. O plan pode ir direto
+        para o save_incremental, então cada célula é codificada uma vez só.
+        """
+        plan = DeltaPlan(self.strings)
+        cells = self.strings
+        delta = plan.cumulative[-1]
+        data_size = len(self.data) - cells.data_start
+        report = {
+            'growth': [(index + 1, cells.lengths[index], len(plan.encoded[index])) for index in plan.modified],
+            'invalid': {index + 1: chars.replace('\x00', '') for index, chars in plan.invalid.items()
+                        if chars != '\x00'},
+            'null': [index + 1 for index in plan.nulls],
+            'delta': delta,
+            'data_size': (data_size, data_size + delta),
+            'file_size': (len(self.data), len(self.data) + delta),
+            'pointer_label': self.POINTER_LABEL,
+            'pointer_shifts': len(self._offset_patches(plan)) if plan.modified else 0,
+        }
+        return plan, report
+    
+    def save_incremental(self, plan=None):
+        """Salva só o que mudou: mantém o prefixo até a primeira célula modificada,
+        desloca os ponteiros afetados (_offset_patches) e reescreve apenas a cauda do arquivo"""
+        print("\n" + "="*60)
+        print("SALVANDO ARQUIVO BINÁRIO (INCREMENTAL)")
+        print("="*60)
+        
+        plan = plan or DeltaPlan(self.strings)
+        if not plan.modified:
+            print("Nenhuma célula modificada - nada a salvar")
+            return True
+        if plan.nulls:
+            print(f"✗ Células com caractere nulo (\\x00), que dividiria a célula: "
+                  f"{', '.join(str(index + 1) for index in plan.nulls)} - nada foi gravado")
+            return False
+        
+        # 1. Cauda do Data block a partir da primeira célula modificada
+        tail_start, tail = plan.build_tail(self.data)
+        print(f"Células modificadas: {len(plan.modified)}")
+        print(f"Prefixo mantido: {tail_start} bytes | Cauda reescrita: {len(tail)} bytes")
+        
+        # 2. Ponteiros que mudam (uint32 little-endian no arquivo)
+        patches = self._offset_patches(plan)
+        print(f"{self.POINTER_LABEL} deslocados: {len(patches)}")
+        
+        # 3. Grava no lugar
+        self.close(keep_data=True)
+        
+        try:
+            with open(self.filename, 'r+b') as f:
+                for position, value in patches:
+                    f.seek(position)
+                    f.write(struct.pack('<I', value))
+                f.seek(tail_start)
+                f.write(tail)
+                f.truncate()
+        except Exception as e:
+            print(f"✗ ERRO ao salvar: {e}")
+            return False
+        
+        # 4. Atualiza o modelo em memória para refletir o arquivo gravado
+        new_data = bytearray(self.data[:tail_start])
+        new_data += tail
+        for position, value in patches:
+            struct.pack_into('<I', new_data, position, value)
+        
+        print(f"Arquivo salvo: {self.filename}")
+        print(f"Tamanho original: {len(self.data)} bytes")
+        print(f"Tamanho novo: {len(new_data)} bytes")
+        
+        self._rebase(new_data, plan.new_offsets(), plan.new_lengths())
+        self.verify_saved_file(self.data)
+        
+        return True
+
+    def _rebase(self, new_data, offsets, lengths):
+        """Após salvar: dados, células e ponteiros passam a ser os do arquivo gravado"""
+        self.data = bytes(new_data)
+        self.strings.rebase(self.data, offsets, lengths)
+        self._rebase_pointers()
+        self.write_cache()
+
+def descrever_analise(report):
+    """Linhas de texto com o resultado do ZeusTextFile.analyze_build"""
+    old_data, new_data = report['data_size']
+    old_file, new_file = report['file_size']
+    lines = [
+        f"Células a gravar: {len(report['growth'])}",
+        f"Crescimento total: {report['delta']:+d} bytes",
+        f"Data block: {old_data} → {new_data} bytes",
+        f"Arquivo: {old_file} → {new_file} bytes",
+        f"{report['pointer_label']} deslocados: {report['pointer_shifts']}",
+    ]
+    maiores = sorted(report['growth'], key=lambda item: item[2] - item[1], reverse=True)[:5]
+    for cell_id, old_len, new_len in maiores:
+        if new_len > old_len:
+            lines.append(f"  Célula {cell_id}: {old_len} → {new_len} bytes ({new_len - old_len:+d})")
+    for cell_id, chars in sorted(report['invalid'].items()):
+        lines.append(f"  ✗ Célula {cell_id}: caracteres fora do cp1252 (viram '?'): {chars!r}")
+    for cell_id in report['null']:
+        lines.append(f"  ✗ Célula {cell_id}: caractere nulo (\\x00) dividiria a célula no Data block - não grava")
+    return lines
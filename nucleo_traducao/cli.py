@@ -0,0 +1,228 @@
+"""Linha de comando dos tradutores: os mesmos arquivos da interface, sem tkinter/pyperclip
+
+Cada script chama executar_cli com o ZeusTextFile do seu formato, o BASE e o nome do
+arquivo (asset); os subcomandos são os mesmos para todos os formatos.
+"""
+import re
+import os
+import sys
+import argparse
+import contextlib
+
+from .sessao import TranslatorSession
+
+MAX_LOTE = 50  # Células por lote (padrão do subcomando 'lote')
+SHARED_TM_FILE = "memoria_traducao.jsonl"  # Memória de tradução compartilhada entre os formatos
+GLOSSARY_FILE = "glossario.txt"  # Termos EN → PT exigidos
+
+# ---------------- SAÍDA E GRAVAÇÃO ---------------- #
+
+def escrever_saida_cli(texto, saida, out):
+    """Grava `texto` no arquivo `saida` ou, sem ele, em `out` (stdout)"""
+    if saida:
+        with open(saida, "w", encoding="utf-8") as f:
+            f.write(texto)
+        print(f"✓ Gravado em {saida}")
+    else:
+        out.write(texto)
+        out.flush()
+
+def gravar_pendentes_cli(session, forcar=False):
+    """Grava no binário as células pendentes da sessão ("Gravar binário" sem perguntas)
+    
+    Sem `forcar`, não grava se alguma célula tiver códigos de controle diferentes do
+    original ou caracteres fora do cp1252; com caractere nulo não grava nem com `forcar`.
+    Retorna True se gravou ou não havia pendências.
+    """
+    if not session.has_pending():
+        return True
+    
+    problems, plan, report = session.prepare_build()
+    if report['null']:
+        print(f"✗ {session.bin_file} não foi gravado: corrija as células com caractere nulo acima")
+        return False
+    if (problems or report['invalid']) and not forcar:
+        print(f"✗ {session.bin_file} não foi gravado: corrija as células acima ou use --forcar")
+        return False
+    
+    pending = len(session.pending_cells)
+    try:
+        ok = session.build(plan)
+    except Exception as e:
+        print(f"✗ Erro ao gravar {session.bin_file}: {e}")
+        return False
+    if ok:
+        print(f"✓ {pending} células gravadas em {session.bin_file}")
+    else:
+        print(f"✗ Erro ao gravar {session.bin_file}")
+    return ok
+
+# ---------------- SUBCOMANDOS ---------------- #
+
+def cli_extrair_tudo(session, args, out):
+    if not os.path.exists(session.bin_file):
+        print(f"✗ Arquivo binário não encontrado: {session.bin_file}")
+        return 1
+    total_cells, existing_count, added = session.add_missing_cells()
+    out.write(f"{session.asset}: {added} células adicionadas, {existing_count + added}/{total_cells} no {session.base_file}\n")
+    return 0
+
+def cli_lote(session, args, out):
+    if not os.path.exists(session.base_file):
+        print(f"✗ Arquivo {session.base_file} não encontrado. Execute 'extrair-tudo' primeiro.")
+        return 1
+    
+    total_blocks, translated_count, untranslated_count, selected_blocks = session.untranslated_batch(args.quantidade)
+    print(f"Total de células: {total_blocks}")
+    print(f"Células traduzidas: {translated_count}")
+    print(f"Células não traduzidas: {untranslated_count}")
+    print(f"Células no lote: {len(selected_blocks)}")
+    
+    escrever_saida_cli(session.batch_text(selected_blocks), args.saida, out)
+    return 0
+
+def cli_mesclar(session, args, out):
+    session.create_base()
+    if args.arquivo == "-":
+        cola_lines = sys.stdin.read().splitlines()
+    else:
+        with open(args.arquivo, "r", encoding="utf-8") as f:
+            cola_lines = f.read().splitlines()
+    
+    updates, rejected = session.validate_paste(cola_lines)
+    print(f"\nRESUMO DA MESCLAGEM:")
+    print(f"Células validadas: {len(updates)}")
+    print(f"Células com erro: {len(rejected)}")
+    
+    if updates:
+        session.merge_batch(updates)
+        
+        if args.sem_binario:
+            print(f"Binário não atualizado (--sem-binario): use 'gravar' depois")
+        elif os.path.exists(session.bin_file):
+            success_count, error_count = session.apply_updates(updates)
+            if not gravar_pendentes_cli(session, args.forcar) or error_count:
+                return 1
+        else:
+            print(f"⚠️ Arquivo binário {session.bin_file} não encontrado")
+    else:
+        print("✗ Nenhuma tradução aplicada. Verifique o formato.")
+    
+    out.write(f"{session.asset}: {len(updates)} células mescladas, {len(rejected)} rejeitadas\n")
+    return 1 if rejected or not updates else 0
+
+def cli_gravar(session, args, out):
+    if not os.path.exists(session.bin_file):
+        print(f"✗ Arquivo binário não encontrado: {session.bin_file}")
+        return 1
+    
+    # Só as traduções validadas que ainda não estão no .eng (rascunhos precisam ser mesclados)
+    updates = session.validated_updates()
+    if not updates:
+        out.write(f"{session.asset}: nenhuma tradução pendente para {session.bin_file}\n")
+        return 0
+    
+    print(f"{len(updates)} traduções para gravar em {session.bin_file}")
+    success_count, error_count = session.apply_updates(updates)
+    ok = gravar_pendentes_cli(session, args.forcar)
+    out.write(f"{session.asset}: {success_count if ok else 0} células gravadas em {session.bin_file}, {error_count} erros\n")
+    return 0 if ok and not error_count else 1
+
+def cli_preencher(session, args, out):
+    if not os.path.exists(session.base_file):
+        print(f"✗ Arquivo {session.base_file} não encontrado. Execute 'extrair-tudo' primeiro.")
+        return 1
+    filled = len(session.fill_from_memory(args.quantidade))
+    out.write(f"{session.asset}: {filled} células preenchidas como rascunho pela memória de tradução\n")
+    return 0
+
+def cli_pesquisar(session, args, out):
+    field = {"original": "original", "traducao": "translation"}.get(args.campo)
+    try:
+        if args.trecho or args.regex:
+            total_blocks, resultados = session.search_fragment(args.texto, args.regex, field)
+        else:
+            total_blocks, resultados = session.search(args.texto.strip(), field)
+    except FileNotFoundError:
+        print(f"✗ Arquivo {session.base_file} não encontrado. Execute 'extrair-tudo' primeiro.")
+        return 1
+    except re.error as e:
+        print(f"✗ Expressão regular inválida: {e}")
+        return 1
+    
+    matching_blocks = [block for cell_id, block in resultados]
+    print(f"Total de células: {total_blocks}")
+    print(f"Células encontradas: {len(matching_blocks)}")
+    escrever_saida_cli("".join(block + "\n\n" for block in matching_blocks), args.saida, out)
+    return 0
+
+def cli_estatisticas(session, args, out):
+    try:
+        status = session.status()
+    except FileNotFoundError:
+        print(f"✗ Arquivo {session.base_file} não encontrado. Execute 'extrair-tudo' primeiro.")
+        return 1
+    out.write(f"{session.asset}: {status.summary()}\n")
+    return 0
+
+# ---------------- ENTRADA ---------------- #
+
+def executar_cli(file_class, base_file, asset, argv, bin_file=None, db_file=None,
+                 shared_file=SHARED_TM_FILE, glossary_file=GLOSSARY_FILE, lote=MAX_LOTE):
+    """Roda um subcomando para o formato `file_class` (ZeusTextFile); retorna o código de saída
+    
+    Sem `bin_file`, o binário é `asset` + ".eng" na pasta do `base_file`. O log vai para o
+    stderr; o stdout (ou --saida) fica só com o resultado (blocos do lote/pesquisa ou o
+    resumo do comando).
+    """
+    if bin_file is None:
+        bin_file = os.path.join(os.path.dirname(base_file), asset + ".eng")
+    
+    parser = argparse.ArgumentParser(
+        prog=os.path.basename(sys.argv[0]),
+        description=f"Tradutor do {asset} pela linha de comando (sem argumentos abre a interface gráfica).")
+    parser.add_argument("--bin", default=bin_file, help=f"arquivo .eng (padrão: {bin_file})")
+    parser.add_argument("--base", default=base_file, help=f"arquivo de tradução (padrão: {base_file})")
+    parser.add_argument("--asset", default=asset, help=f"nome do arquivo no banco e na memória compartilhada (padrão: {asset})")
+    commands = parser.add_subparsers(dest="comando", required=True)
+    
+    command = commands.add_parser("extrair-tudo", help="acrescenta ao BASE as células do binário que ainda não estão nele")
+    command.set_defaults(func=cli_extrair_tudo)
+    
+    command = commands.add_parser("lote", help="próximas células não traduzidas, com as sugestões da memória de tradução")
+    command.add_argument("quantidade", nargs="?", type=int, default=lote, help=f"células no lote (padrão: {lote})")
+    command.add_argument("--saida", help="grava o lote neste arquivo em vez do stdout")
+    command.set_defaults(func=cli_lote)
+    
+    command = commands.add_parser("mesclar", help="valida e mescla os blocos traduzidos de um arquivo e grava o binário")
+    command.add_argument("arquivo", help="blocos no formato do BASE ('-' lê do stdin)")
+    command.add_argument("--sem-binario", action="store_true", help="só grava o BASE (o binário fica para 'gravar')")
+    command.add_argument("--forcar", action="store_true", help="grava o binário mesmo com códigos de controle divergentes ou caracteres fora do cp1252")
+    command.set_defaults(func=cli_mesclar)
+    
+    command = commands.add_parser("preencher", help="preenche como rascunho (no BASE, não no binário) as células cujo original já foi traduzido")
+    command.add_argument("quantidade", nargs="?", type=int, help="no máximo esta quantidade de células (padrão: todas)")
+    command.set_defaults(func=cli_preencher)
+    
+    command = commands.add_parser("gravar", help="grava no binário as traduções validadas que ainda não estão nele")
+    command.add_argument("--forcar", action="store_true", help="grava mesmo com códigos de controle divergentes ou caracteres fora do cp1252")
+    command.set_defaults(func=cli_gravar)
+    
+    command = commands.add_parser("pesquisar", help="células com as palavras, o trecho ou o regex")
+    command.add_argument("texto", help="palavras sem acento; palavra* = prefixo; a | b = qualquer uma")
+    mode = command.add_mutually_exclusive_group()
+    mode.add_argument("--trecho", action="store_true", help="trecho literal (@101, \\x0E...) em vez de palavras")
+    mode.add_argument("--regex", action="store_true", help="expressão regular")
+    command.add_argument("--campo", choices=("original", "traducao"), help="pesquisa só neste campo")
+    command.add_argument("--saida", help="grava os blocos encontrados neste arquivo em vez do stdout")
+    command.set_defaults(func=cli_pesquisar)
+    
+    command = commands.add_parser("estatisticas", help="progresso da tradução")
+    command.set_defaults(func=cli_estatisticas)
+    
+    args = parser.parse_args(argv)
+    
+    out = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        session = TranslatorSession(file_class, args.bin, args.base, db_file, args.asset, shared_file, glossary_file)
+        return args.func(session, args, out)
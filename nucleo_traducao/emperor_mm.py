@@ -0,0 +1,720 @@
+"""Formato do EmperorMM.eng: textos com escapes e ponteiros S1/S2/S3 na table"""
+import re
+import sys
+import struct
+from array import array
+
+from . import binario
+
+NON_NULL_RE = re.compile(rb"[^\x00]+")  # Uma string do Data block (até o null)
+
+# ---------------- CODEC DE ESCAPES ---------------- #
+
+class EscapeCodec:
+    """Converte bytes do Data block em texto com escapes e vice-versa, via tabelas pré-calculadas"""
+    UNESCAPE_RE = re.compile(r"\\(x[0-9A-Fa-f]{2}|[\\nrt])")
+    LEGACY_HEX_RE = re.compile(r"\\x([0-9A-Fa-f]{2})")
+    SIMPLE_ESCAPES = {'\\': '\\', 'n': '\n', 'r': '\r', 't': '\t'}
+    
+    def __init__(self, encoding='cp1252'):
+        self.encoding = encoding
+        
+        # Tabela de 256 entradas: byte (via latin-1) → texto de exibição
+        self.escape_table = {}
+        for char_code in range(256):
+            if char_code < 32 and char_code not in (9, 10, 13):  # Não TAB, LF, CR
+                # Caractere de controle - representa como hex
+                self.escape_table[char_code] = f"\\x{char_code:02X}"
+            elif char_code == 92:  # Backslash
+                self.escape_table[char_code] = "\\\\"
+            elif char_code == 10:  # Line feed
+                self.escape_table[char_code] = "\\n"
+            elif char_code == 13:  # Carriage return
+                self.escape_table[char_code] = "\\r"
+            elif char_code == 9:   # Tab
+                self.escape_table[char_code] = "\\t"
+            elif 32 <= char_code <= 126:  # ASCII imprimível
+                self.escape_table[char_code] = chr(char_code)
+            else:
+                # Tenta decodificar como CP1252, se falhar usa hex
+                try:
+                    self.escape_table[char_code] = bytes([char_code]).decode(encoding)
+                except UnicodeDecodeError:
+                    self.escape_table[char_code] = f"\\x{char_code:02X}"
+        
+        # Variante que preserva o null como separador para conversões em lote
+        self.block_escape_table = dict(self.escape_table)
+        self.block_escape_table[0] = '\x00'
+    
+    def escape(self, raw):
+        """Bytes → texto com escapes"""
+        return raw.decode('latin-1').translate(self.escape_table)
+    
+    def escape_many(self, raws):
+        """Converte várias strings de uma vez (nenhuma contém null)"""
+        if not raws:
+            return []
+        joined = b'\x00'.join(raws).decode('latin-1')
+        return joined.translate(self.block_escape_table).split('\x00')
+    
+    def _replace(self, match):
+        seq = match.group(1)
+        if seq[0] == 'x':
+            return chr(int(seq[1:], 16))
+        return self.SIMPLE_ESCAPES[seq]
+    
+    def unescape(self, text):
+        """Texto com escapes → texto com os caracteres especiais restaurados
+        
+        Uma passada só, da esquerda para a direita: "\\\\" é sempre uma barra literal, então
+        "\\\\x0E" volta como a barra seguida de "x0E" (o inverso exato do escape). O
+        _process_special_sequences antigo trocava primeiro "\\\\" por "\\" e só depois os
+        \\xHH/\\n/\\r/\\t, então ali o mesmo texto virava o código 0x0E. Traduções escritas
+        contando com a regra antiga mudam de bytes: veja legacy_differs.
+        """
+        return self.UNESCAPE_RE.sub(self._replace, text)
+    
+    def unescape_legacy(self, text):
+        """Texto com escapes → caracteres, pela regra antiga (barras duplas primeiro)"""
+        text = text.replace('\\\\', '\\')
+        text = self.LEGACY_HEX_RE.sub(lambda match: chr(int(match.group(1), 16)), text)
+        return text.replace('\\n', '\n').replace('\\r', '\r').replace('\\t', '\t')
+    
+    def legacy_differs(self, text):
+        """Se o texto com escapes dá bytes diferentes na regra antiga ("\\\\" antes de x/n/r/t)"""
+        return '\\\\' in text and self.unescape(text) != self.unescape_legacy(text)
+    
+    def unescape_many(self, texts):
+        """Restaura várias strings de uma vez (texto escapado nunca contém null)"""
+        if not texts:
+            return []
+        return self.unescape('\x00'.join(texts)).split('\x00')
+
+CODEC = EscapeCodec()
+
+# ---------------- TABELA DE CÉLULAS ---------------- #
+
+class CellView(binario.CellView):
+    """CellView do EmperorMM: offsets, texto com escapes e linhas da table que apontam para a célula"""
+    __slots__ = ()
+    KEYS = ('cell_id', 'data_offset', 'file_offset', 'original_bytes', 'safe_text',
+            'restored_text', 'modified', 'new_text', 'referenced_by')
+    
+    def __getitem__(self, key):
+        table, index = self.table, self.index
+        if key == 'data_offset':
+            return table.offsets[index]
+        if key == 'file_offset':
+            return table.data_start + table.offsets[index]
+        if key == 'safe_text':
+            return CODEC.escape(table.get_bytes(index))
+        if key == 'restored_text':
+            return CODEC.unescape(self['safe_text'])
+        if key == 'referenced_by':
+            return table.references.get(index, ())
+        return super().__getitem__(key)
+
+class CellTable(binario.CellTable):
+    """CellTable do EmperorMM: linhas da table que apontam para cada célula e textos com escapes"""
+    view_class = CellView
+    
+    def __init__(self, source, data_start):
+        super().__init__(source, data_start)
+        self.references = {}          # índice → [(line_id, 'S1'), ...]
+    
+    def add_reference(self, index, reference):
+        self.references.setdefault(index, []).append(reference)
+    
+    def safe_texts(self, indices=None):
+        """Textos com escapes de várias células, convertidos em lote"""
+        if indices is None:
+            indices = range(len(self.offsets))
+        return CODEC.escape_many([self.get_bytes(index) for index in indices])
+
+# ---------------- ESTRUTURA CORRIGIDA ---------------- #
+
+class ZeusTextFile(binario.EngFile):
+    # Layout da table: linhas de 80 bytes = 20 valores uint32 little-endian
+    TABLE_START = 0x28
+    DATA_START = 0x138A8
+    LINE_SIZE = 0x50
+    LINE_WORDS = LINE_SIZE // 4
+    POINTER_COLUMNS = [(13, 'S1'), (14, 'S2'), (15, 'S3')]  # Bytes 0x34, 0x38, 0x3C da linha
+    POINTER_LABEL = "Ponteiros S1/S2/S3"
+    BASE_TITLE = "Emperor MM"  # Cabeçalho do arquivo _TRADUZIR
+    
+    def __init__(self, filename):
+        super().__init__(filename)
+        self.strings_by_file_offset = {}  # Índice file_offset → célula (montado no load)
+    
+    def load(self, use_mmap=False, use_cache=True):
+        """Carrega arquivo binário seguindo a estrutura CORRETA
+        
+        use_mmap=True mapeia o arquivo em vez de lê-lo; as células (CellTable)
+        leem os bytes direto do mapeamento quando acessados.
+        use_cache=True reaproveita a estrutura do arquivo .cache se o binário não mudou.
+        """
+        self._read_data(use_mmap)
+        
+        if use_cache and self.load_cache():
+            return True
+        
+        print(f"Tamanho do arquivo: {len(self.data)} bytes")
+        
+        # 1. File signature (bytes 0-15 / 0x00-0x0F)
+        signature = self.data[0:16].decode('ascii', errors='ignore').rstrip('\x00')
+        print(f"Assinatura: {signature}")
+        
+        # 2. Table header (bytes 16-39 / 0x10-0x27) - 6 valores de 4 bytes
+        header_offset = 16
+        print(f"\nTable header (bytes 0x{header_offset:02X}-0x{header_offset+23:02X}):")
+        
+        header_values = []
+        for i in range(6):  # 6 valores de 4 bytes
+            value_offset = header_offset + (i * 4)
+            value = struct.unpack('<I', self.data[value_offset:value_offset+4])[0]
+            header_values.append(value)
+            print(f"  Valor {i}: 0x{value:08X} ({value})")
+        
+        self.header = {
+            'num_count_values': header_values[0],
+            'total_cells': header_values[1],
+            'mystery_value': header_values[2],
+            'reserved': header_values[3],
+            'extra1': header_values[4],
+            'extra2': header_values[5]
+        }
+        
+        # 3. Table block (bytes 40-80040 / 0x28-0x138A7)
+        table_start = 0x28  # 40 decimal
+        data_start = self.DATA_START  # 80041 decimal
+        
+        print(f"\nTable block: 0x{table_start:08X} - 0x{data_start-1:08X}")
+        print(f"Data block: 0x{data_start:08X} - 0x{len(self.data)-1:08X}")
+        
+        # Cada linha da table tem 80 bytes (0x50)
+        LINE_SIZE = 0x50  # 80 bytes
+        
+        # Calcula quantas linhas completas existem
+        table_size = data_start - table_start
+        num_lines = table_size // LINE_SIZE
+        
+        print(f"\nTable tem {num_lines} linhas de {LINE_SIZE} bytes cada")
+        
+        self.parse_lines()
+        
+        # 4. Extrai strings do Data block PRESERVANDO CARACTERES ESPECIAIS
+        print(f"\n{'='*60}")
+        print("EXTRAINDO STRINGS DO DATA BLOCK (PRESERVANDO ESPECIAIS)")
+        print(f"{'='*60}")
+        
+        # As células só guardam offset/tamanho; bytes e textos vêm do buffer quando acessados
+        # (no modo mmap o buffer é o próprio arquivo mapeado)
+        self.strings = CellTable(self.data, data_start)
+        
+        # Localiza todos os null terminators de uma vez, direto no buffer (sem copiar o Data block)
+        spans = self.split_null_terminated(self.data, data_start)
+        
+        for start, end in spans:
+            cell_index = self.strings.append(start, end - start)
+            cell_id = cell_index + 1
+            
+            # Debug: mostra strings com caracteres especiais
+            if cell_id <= 9:
+                string_info = self.strings[cell_index]
+                original_bytes = string_info['original_bytes']
+                safe_text = string_info['safe_text']
+                hex_repr = ' '.join(f'{b:02X}' for b in original_bytes[:20])
+                if len(original_bytes) > 20:
+                    hex_repr += '...'
+                print(f"  Célula {cell_id}: offset=0x{string_info['file_offset']:08X}")
+                print(f"    Hex: {hex_repr}")
+                print(f"    Safe: '{safe_text[:50]}{'...' if len(safe_text) > 50 else ''}'")
+        
+        print(f"\nStrings extraídas: {len(self.strings)}")
+        
+        # 5. Mapeia strings para linhas da table
+        print(f"\n{'='*60}")
+        print("MAPEANDO STRINGS PARA LINHAS DA TABLE")
+        print(f"{'='*60}")
+        
+        total_mapped = self.map_references()
+        
+        # Mostra estatísticas
+        print(f"Total de linhas na table: {len(self.groups)}")
+        print(f"Total de strings extraídas: {len(self.strings)}")
+        print(f"Total de referências mapeadas: {total_mapped}")
+        
+        # Conta quantas strings únicas foram referenciadas
+        unique_referenced = len(self.strings.references)
+        print(f"Strings únicas referenciadas: {unique_referenced}")
+        
+        # Verifica contra o header
+        print(f"\n{'='*60}")
+        print("VALIDAÇÃO")
+        print(f"{'='*60}")
+        
+        print(f"Total cells no header: {self.header['total_cells']}")
+        print(f"Strings únicas referenciadas: {unique_referenced}")
+        
+        if unique_referenced == self.header['total_cells']:
+            print("✓ CONTAGEM BATE!")
+        else:
+            print(f"✗ CONTAGEM NÃO BATE! Diferença: {abs(unique_referenced - self.header['total_cells'])}")
+        
+        if use_cache:
+            self.write_cache()
+        
+        return True
+
+    def _cache_payload(self):
+        cells = self.strings
+        return {
+            'header': self.header,
+            'groups': self.groups,
+            'data_start': cells.data_start,
+            'offsets': cells.offsets,
+            'lengths': cells.lengths,
+            'references': cells.references
+        }
+
+    def _restore_cache(self, payload):
+        self.header = payload['header']
+        self.groups = payload['groups']
+        self.strings = CellTable(self.data, payload['data_start'])
+        self.strings.offsets = payload['offsets']
+        self.strings.lengths = payload['lengths']
+        self.strings.modified_bits = bytearray((len(self.strings.offsets) + 7) // 8)
+        self.strings.references = payload['references']
+        self.strings_by_file_offset = {s['file_offset']: s for s in self.strings}
+
+    def parse_lines(self):
+        """Monta self.groups (linhas da table) a partir de self.data"""
+        self.groups = []  # Vamos chamar de "lines" agora
+        
+        # Lê a table inteira de uma vez como colunas uint32
+        table = self.read_table(self.data)
+        
+        # Extrai os 3 valores de referência (S1, S2, S3)
+        # S1: bytes 0x34-0x37 (53-56 decimal) dentro da linha
+        # S2: bytes 0x38-0x3B (57-60 decimal)
+        # S3: bytes 0x3C-0x3F (61-64 decimal)
+        columns = [table[col::self.LINE_WORDS] for col, _ in self.POINTER_COLUMNS]
+        
+        for line_num, (s1_value, s2_value, s3_value) in enumerate(zip(*columns)):
+            # Calcula offsets para o Data block (subtrai 0x10)
+            data_pointers = [(ptr_type, value - 0x10)
+                             for ptr_type, value in (('S1', s1_value), ('S2', s2_value), ('S3', s3_value))
+                             if value != 0]
+            
+            # Salva informações da linha
+            line_info = {
+                'line_id': line_num,
+                'line_start': self.TABLE_START + (line_num * self.LINE_SIZE),
+                's1': s1_value,
+                's2': s2_value,
+                's3': s3_value,
+                'data_pointers': data_pointers,  # Lista de (tipo, offset)
+                'strings': []  # Células apontadas por esta linha
+            }
+            
+            self.groups.append(line_info)
+
+    def map_references(self):
+        """Monta o índice file_offset → célula e liga cada ponteiro S1/S2/S3 à sua célula"""
+        # Cria dicionário rápido para busca por file_offset (reutilizado pelo save)
+        self.strings_by_file_offset = {s['file_offset']: s for s in self.strings}
+        strings_by_file_offset = self.strings_by_file_offset
+        
+        self.strings.references = {}
+        total_mapped = 0
+        
+        for line in self.groups:
+            line['strings'] = []
+            
+            for ptr_type, data_offset in line['data_pointers']:
+                file_offset = self.DATA_START + data_offset
+                
+                if file_offset in strings_by_file_offset:
+                    string_info = strings_by_file_offset[file_offset]
+                    line['strings'].append(string_info['cell_id'])
+                    self.strings.add_reference(string_info.index, (line['line_id'], ptr_type))
+                    total_mapped += 1
+        
+        return total_mapped
+
+    def read_table(self, data):
+        """Lê as linhas completas da table como um array uint32 (20 valores por linha)"""
+        table_size = self.DATA_START - self.TABLE_START
+        available = max(0, min(table_size, len(data) - self.TABLE_START))
+        num_lines = available // self.LINE_SIZE
+        
+        table = array('I')
+        with memoryview(data) as view:
+            table.frombytes(view[self.TABLE_START:self.TABLE_START + num_lines * self.LINE_SIZE])
+        if sys.byteorder == 'big':
+            table.byteswap()
+        return table
+
+    def split_null_terminated(self, data, start=0):
+        """Spans (início, fim), relativos a `start`, das strings não vazias de data[start:]"""
+        # O regex varre o buffer (bytes ou mmap) em C, sem loop byte a byte e sem copiar
+        return [(match.start() - start, match.end() - start) for match in NON_NULL_RE.finditer(data, start)]
+
+    def base_records(self, indices):
+        """Registros ainda sem tradução das células `indices`, para acrescentar ao _TRADUZIR"""
+        indices = list(indices)
+        cells = self.strings
+        # Textos com escapes de todas as células, convertidos em lote
+        for index, text in zip(indices, cells.safe_texts(indices)):
+            references = cells.references.get(index, ())
+            refs = ", ".join(f"L{line_id}[{ptr_type}]" for line_id, ptr_type in references)
+            yield {
+                'offset': cells.data_start + cells.offsets[index],
+                'cell_id': index + 1,
+                'refs': f"REFERÊNCIAS: {refs}" if refs else None,
+                'original_length': None,
+                'original': text,
+                'translation': ''
+            }
+    
+    # 🔥🔥🔥 ADICIONE ESTE MÉTODO SE NÃO EXISTIR 🔥🔥🔥
+    def update_string(self, cell_id, new_text):
+        """Atualiza uma string pelo ID da célula (1-based) - TRATANDO ESPECIAIS"""
+        if 1 <= cell_id <= len(self.strings):
+            string_info = self.strings[cell_id - 1]
+            string_info['modified'] = True
+            
+            # **IMPORTANTE**: Precisamos processar sequências especiais como \x0E
+            processed_text = self._process_special_sequences(new_text)
+            string_info['new_text'] = processed_text
+            if CODEC.legacy_differs(new_text):
+                print(f"⚠️ Célula {cell_id}: '\\\\' seguido de x/n/r/t agora é barra literal "
+                      f"(na regra antiga virava o código de controle) - confira a tradução")
+            
+            # Log da modificação
+            old_len = len(string_info['original_bytes'])
+            new_len = len(processed_text)  # cp1252 (e o fallback) gravam 1 byte por caractere
+            
+            delta = new_len - old_len
+            
+            print(f"Célula {cell_id} atualizada:")
+            print(f"  Original: '{string_info['safe_text'][:30]}...'")
+            print(f"  Novo: '{processed_text[:30]}...'")
+            print(f"  Tamanho: {old_len} → {new_len} bytes (Δ={delta})")
+            
+            return True
+        else:
+            print(f"ERRO: Célula {cell_id} não encontrada (total: {len(self.strings)} células)")
+            return False
+
+    def _process_special_sequences(self, text):
+        """Converte escapes (\\xHH, \\n, \\r, \\t, \\\\) de volta para os caracteres reais"""
+        return CODEC.unescape(text)
+    
+    def save(self):
+        """Salva arquivo binário seguindo a estrutura CORRETA de 4 blocos"""
+        print("\n" + "="*60)
+        print("SALVANDO ARQUIVO BINÁRIO")
+        print("📁 ESTRUTURA: File signature → Table header → Table → Data")
+        print("="*60)
+        
+        # Definições da estrutura
+        TABLE_START = 0x28       # Byte 40 (0x28)
+        DATA_START = 0x138A8     # Início do Data block (0x138A8)
+        LINE_SIZE = 0x50         # Tamanho de cada linha na table (80 bytes)
+        
+        # 1. Reconstrói Data block com strings modificadas
+        print("\n1. Reconstruindo Data block...")
+        
+        data_block = bytearray()
+        string_positions = {}  # Mapeia cell_id → nova posição no data block
+        new_lengths = []
+        
+        current_pos = 0
+        
+        # A CellTable já está na ordem de cell_id; lê as colunas direto, sem criar views
+        cells = self.strings
+        
+        for cell_index in range(len(cells)):
+            cell_id = cell_index + 1
+            
+            # Salva a posição desta string no novo data block
+            string_positions[cell_id] = current_pos
+            
+            # Decide qual texto usar (modificado ou original)
+            if cells.new_texts.get(cell_index) and cells.is_modified(cell_index):
+                encoded = cells.encode_new_text(cell_index)
+            else:
+                encoded = cells.get_bytes(cell_index)
+            new_lengths.append(len(encoded))
+            
+            # Adiciona string + null terminator
+            data_block.extend(encoded)
+            data_block.append(0)
+            current_pos += len(encoded) + 1
+        
+        # Adiciona null final se necessário
+        if len(data_block) == 0 or data_block[-1] != 0:
+            data_block.append(0)
+        
+        print(f"   Data block: {len(data_block)} bytes")
+        print(f"   Strings processadas: {len(cells)}")
+        
+        # 2. Reconstrói Table block
+        print("\n2. Reconstruindo Table block...")
+        
+        table_size = DATA_START - TABLE_START
+        num_lines = table_size // LINE_SIZE
+        
+        print(f"   Tamanho da table: {table_size} bytes")
+        print(f"   Número de linhas: {num_lines}")
+        
+        # Lê a table original inteira (campos desconhecidos são preservados como estão)
+        table = self.read_table(self.data)
+        
+        # Mapa ponteiro antigo → ponteiro novo (valores já com +0x10), a partir do índice do load
+        relocation = {}
+        for file_offset, string_info in self.strings_by_file_offset.items():
+            cell_id = string_info['cell_id']
+            if cell_id in string_positions:
+                relocation[file_offset - DATA_START + 0x10] = string_positions[cell_id] + 0x10
+        
+        unresolved_pointers = 0  # Ponteiros que não apontam para início de célula
+        
+        # Atualiza as colunas S1, S2, S3 de uma vez
+        for col, ptr_name in self.POINTER_COLUMNS:
+            old_values = table[col::self.LINE_WORDS]
+            new_values = array('I', [relocation.get(value, value) for value in old_values])
+            unresolved_pointers += sum(1 for value in old_values if value and value not in relocation)
+            table[col::self.LINE_WORDS] = new_values
+            
+            # Debug para primeiras linhas
+            for line_num in range(min(5, len(old_values))):
+                if old_values[line_num] != 0 and old_values[line_num] in relocation:
+                    print(f"   Linha {line_num} {ptr_name}: "
+                          f"0x{old_values[line_num]:08X}→0x{new_values[line_num]:08X}")
+        
+        if sys.byteorder == 'big':
+            table.byteswap()
+        new_table = bytearray(table.tobytes())
+        
+        # Garante que a table tenha o tamanho correto
+        if len(new_table) < table_size:
+            padding = table_size - len(new_table)
+            new_table.extend(b'\x00' * padding)
+            print(f"   Padding adicionado: {padding} bytes")
+        
+        print(f"   Table reconstruída: {len(new_table)} bytes")
+        if unresolved_pointers:
+            print(f"   ⚠️ {unresolved_pointers} ponteiros sem célula correspondente (mantidos)")
+        
+        # 3. Reconstrói Header (preserva valores originais)
+        print("\n3. Preparando Header...")
+        
+        # Mantém os 6 valores originais do header
+        header_values = []
+        for i in range(6):
+            offset = 16 + (i * 4)
+            value = struct.unpack('<I', self.data[offset:offset+4])[0]
+            header_values.append(value)
+        
+        # Cria header block
+        header_block = bytearray()
+        for value in header_values:
+            header_block.extend(struct.pack('<I', value))
+        
+        print(f"   Header: {len(header_block)} bytes")
+        print(f"   Valores: {[f'0x{v:08X}' for v in header_values]}")
+        
+        # 4. Reconstrói Signature
+        signature_block = bytearray()
+        signature = b'Emperor MM file.'
+        signature_block.extend(signature.ljust(16, b'\x00'))
+        
+        # 5. Monta arquivo completo
+        print("\n4. Montando arquivo completo...")
+        
+        new_data = bytearray()
+        
+        # File signature (0x00-0x0F)
+        new_data.extend(signature_block)
+        
+        # Table header (0x10-0x27)
+        new_data.extend(header_block)
+        
+        # Table (0x28-0x138A7)
+        new_data.extend(new_table)
+        
+        # Data (0x138A8-end)
+        new_data.extend(data_block)
+        
+        print(f"\n   Tamanhos dos blocos:")
+        print(f"     Signature: {len(signature_block)} bytes")
+        print(f"     Header: {len(header_block)} bytes")
+        print(f"     Table: {len(new_table)} bytes")
+        print(f"     Data: {len(data_block)} bytes")
+        print(f"     Total: {len(new_data)} bytes")
+        
+        # 6. Validação
+        print("\n5. Validação...")
+        
+        # Verifica estrutura básica
+        if len(new_data) < DATA_START:
+            print(f"✗ ERRO: Arquivo muito pequeno para a estrutura!")
+            return False
+        
+        # Verifica assinatura
+        new_signature = new_data[0:16].decode('ascii', errors='ignore').rstrip('\x00')
+        if new_signature != "Emperor MM file.":
+            print(f"✗ ERRO: Assinatura incorreta: {new_signature}")
+            return False
+        
+        print(f"   ✓ Assinatura: {new_signature}")
+        
+        # 7. Salva arquivo
+        # O arquivo não pode ser sobrescrito enquanto estiver mapeado
+        self.close(keep_data=True)
+        
+        try:
+            # Novo arquivo
+            with open(self.filename, 'wb') as f:
+                f.write(new_data)
+            
+            print(f"✓ Arquivo salvo: {self.filename}")
+            print(f"  Tamanho original: {len(self.data)} bytes")
+            print(f"  Tamanho novo: {len(new_data)} bytes")
+            
+            modified_count = self.strings.modified_count()
+            
+            # Atualiza dados internos (células, linhas e índice passam a refletir o arquivo gravado)
+            self._rebase(new_data, [string_positions[cell_index + 1] for cell_index in range(len(cells))], new_lengths)
+            
+            # Verificação final
+            print(f"\n✓ Estrutura preservada: 4 blocos")
+            print(f"✓ Total de strings: {len(self.strings)}")
+            print(f"✓ Strings modificadas: {modified_count}")
+            
+            return True
+            
+        except Exception as e:
+            print(f"\n✗ ERRO ao salvar: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+    def _offset_patches(self, plan):
+        """[(posição no arquivo, novo valor)] dos ponteiros S1/S2/S3 que mudam com o plan"""
+        table = self.read_table(self.data)
+        patches = []
+        for col, ptr_name in self.POINTER_COLUMNS:
+            for line_num, value in enumerate(table[col::self.LINE_WORDS]):
+                if value == 0 or (self.DATA_START + value - 0x10) not in self.strings_by_file_offset:
+                    continue
+                new_value = value + plan.shift(value - 0x10)
+                if new_value != value:
+                    patches.append((self.TABLE_START + line_num * self.LINE_SIZE + col * 4, new_value))
+        return patches
+
+    def _rebase_pointers(self):
+        """Após salvar: linhas da table e índice file_offset → célula relidos do arquivo gravado"""
+        self.parse_lines()
+        self.map_references()
+
+    def find_cell_by_original_offset(self, original_offset):
+        """Encontra a célula que começa exatamente nesse offset original (relativo ao Data block)"""
+        if not self.strings_by_file_offset:
+            return None
+        
+        s = self.strings_by_file_offset.get(self.DATA_START + original_offset)
+        if s is not None:
+            return s.get('cell_id', None)
+        return None
+
+    def verify_saved_file(self, new_data):
+        """Verifica se o arquivo foi salvo corretamente com a nova estrutura"""
+        print("\n" + "="*60)
+        print("VERIFICAÇÃO DO ARQUIVO SALVO")
+        print("ESTRUTURA: 4 blocos")
+        print("="*60)
+        
+        try:
+            # 1. File signature (0x00-0x0F)
+            if len(new_data) < 16:
+                print(f"✗ Arquivo muito pequeno: {len(new_data)} bytes")
+                return False
+                
+            signature = new_data[0:16].decode('ascii', errors='ignore').rstrip('\x00')
+            print(f"1. File signature: {signature}")
+            
+            # 2. Table header (0x10-0x27)
+            if len(new_data) < 40:
+                print(f"✗ Arquivo muito pequeno para header: {len(new_data)} bytes")
+                return False
+                
+            num_count = struct.unpack('<I', new_data[16:20])[0]
+            total_cells = struct.unpack('<I', new_data[20:24])[0]
+            print(f"2. Table header:")
+            print(f"   num_count_values: {num_count}")
+            print(f"   total_cells: {total_cells}")
+            
+            # Verifica se os valores são válidos
+            if num_count < 0 or num_count > 4294967295:
+                print(f"   ⚠️ num_count_values fora do range: {num_count}")
+            
+            if total_cells < 0 or total_cells > 4294967295:
+                print(f"   ⚠️ total_cells fora do range: {total_cells}")
+            
+            # 3. Table block (0x28-0x138A7)
+            print(f"3. Table block (primeiros 3 pares):")
+            
+            if len(new_data) < 64:
+                print(f"✗ Arquivo muito pequeno para table: {len(new_data)} bytes")
+                return False
+            
+            # Par 0
+            count0 = struct.unpack('<I', new_data[40:44])[0]    # COUNT
+            offset0 = struct.unpack('<I', new_data[44:48])[0]   # OFFSET
+            print(f"   Par 0: count={count0}, offset=0x{offset0:04X}")
+            
+            # Par 1
+            count1 = struct.unpack('<I', new_data[48:52])[0]    # COUNT
+            offset1 = struct.unpack('<I', new_data[52:56])[0]   # OFFSET
+            print(f"   Par 1: count={count1}, offset=0x{offset1:04X}")
+            
+            # Par 2
+            count2 = struct.unpack('<I', new_data[56:60])[0]    # COUNT
+            offset2 = struct.unpack('<I', new_data[60:64])[0]   # OFFSET
+            print(f"   Par 2: count={count2}, offset=0x{offset2:04X}")
+            
+            # 4. Data block (0x138A8)
+            data_start = 0x138A8
+            print(f"4. Data block começa em: 0x{data_start:08X}")
+            
+            if len(new_data) > data_start:
+                print(f"   Tamanho do Data block: {len(new_data) - data_start} bytes")
+                
+                # Verifica alguns bytes do início do Data block
+                if len(new_data) > data_start + 16:
+                    first_data = new_data[data_start:data_start+16]
+                    hex_str = ' '.join(f'{b:02X}' for b in first_data)
+                    print(f"   Primeiros bytes do Data: {hex_str}")
+            else:
+                print(f"   ⚠️ Data block vazio ou inexistente")
+            
+            print(f"\n✓ Arquivo verificado com sucesso!")
+            print(f"✓ Estrutura correta: 4 blocos")
+            print(f"✓ Tamanho total: {len(new_data)} bytes")
+            
+            return True
+            
+        except struct.error as e:
+            print(f"\n✗ ERRO de struct na verificação: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+        except Exception as e:
+            print(f"\n✗ ERRO na verificação: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
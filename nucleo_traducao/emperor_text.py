@@ -0,0 +1,504 @@
+"""Formato do EmperorText.eng: grupos de células e offsets por grupo"""
+import bisect
+import struct
+
+from . import binario
+
+def decodificar_bytes(string_bytes):
+    """Decodifica bytes do jogo (cp1252, com fallback para latin-1)"""
+    try:
+        return string_bytes.decode('cp1252')
+    except:
+        try:
+            return string_bytes.decode('latin-1')
+        except:
+            return f"[BIN:{string_bytes.hex()[:20]}...]"
+
+# ---------------- TABELA DE CÉLULAS ---------------- #
+
+class CellView(binario.CellView):
+    """CellView do EmperorText: offset no Data block, texto decodificado e grupo"""
+    __slots__ = ()
+    KEYS = ('cell_id', 'offset', 'absolute_offset', 'original_bytes', 'text', 'display_length',
+            'byte_length', 'modified', 'new_text', 'group_id')
+    
+    def __getitem__(self, key):
+        table, index = self.table, self.index
+        if key == 'offset':
+            return table.offsets[index]
+        if key == 'absolute_offset':
+            return table.data_start + table.offsets[index]
+        if key == 'text':
+            return decodificar_bytes(table.get_bytes(index))
+        if key == 'display_length':
+            return len(self['text'])
+        if key == 'byte_length':
+            return table.lengths[index]
+        if key == 'group_id':
+            return table.group_ids.get(index)
+        return super().__getitem__(key)
+    
+    def __setitem__(self, key, value):
+        if key == 'group_id':
+            if value is None:
+                self.table.group_ids.pop(self.index, None)
+            else:
+                self.table.group_ids[self.index] = value
+        else:
+            super().__setitem__(key, value)
+
+class CellTable(binario.CellTable):
+    """CellTable do EmperorText: grupo de cada célula e busca pelo offset no Data block"""
+    view_class = CellView
+    
+    def __init__(self, source, data_start):
+        super().__init__(source, data_start)
+        self.group_ids = {}           # índice → grupo (apenas células mapeadas)
+    
+    def index_at_offset(self, data_offset):
+        """Índice da célula que começa exatamente em data_offset (busca binária; offsets são crescentes)"""
+        index = bisect.bisect_left(self.offsets, data_offset)
+        if index < len(self.offsets) and self.offsets[index] == data_offset:
+            return index
+        return None
+
+# ---------------- ESTRUTURA CORRIGIDA ---------------- #
+
+class ZeusTextFile(binario.EngFile):
+    DATA_START = 0x1F5C
+    POINTER_LABEL = "Offsets de grupo"
+    BASE_TITLE = "Emperor Text"  # Cabeçalho do arquivo _TRADUZIR
+    
+    def load(self, use_mmap=False, use_cache=True):
+        """Carrega arquivo binário CORRETAMENTE - ORDEM (COUNT, OFFSET) para ESTE ARQUIVO!
+        
+        use_mmap=True mapeia o arquivo em vez de lê-lo; as células (CellTable)
+        leem os bytes direto do mapeamento quando acessados.
+        use_cache=True reaproveita a estrutura do arquivo .cache se o binário não mudou.
+        """
+        self._read_data(use_mmap)
+        
+        if use_cache and self.load_cache():
+            return True
+        
+        print(f"Tamanho do arquivo: {len(self.data)} bytes")
+        
+        # 1. File signature
+        signature = self.data[0:16].decode('ascii', errors='ignore').rstrip('\x00')
+        print(f"Assinatura: {signature}")
+        
+        # 2. List header
+        header_offset = 16
+        self.header = {
+            'num_count_values': struct.unpack('<I', self.data[header_offset:header_offset+4])[0],
+            'total_cells': struct.unpack('<I', self.data[header_offset+4:header_offset+8])[0],
+            'mystery_value': struct.unpack('<I', self.data[header_offset+8:header_offset+12])[0],
+            'reserved': struct.unpack('<I', self.data[header_offset+12:header_offset+16])[0]
+        }
+        
+        print(f"Cabeçalho: {self.header}")
+        
+        # 3. List block (359 pares) 
+        list_start = 32
+        data_start = self.DATA_START
+        
+        self.groups = []
+        offset = list_start
+        
+        print(f"Lendo lista de 0x{list_start:08X} a 0x{data_start-1:08X}...")
+        
+        # Lê EXATAMENTE 359 pares
+        for pair_id in range(359):
+            if offset + 8 > data_start:
+                print(f"AVISO: Fora do limite da lista no par {pair_id}")
+                break
+            
+            #COUNT primeiro, OFFSET depois
+            count = struct.unpack('<I', self.data[offset:offset+4])[0]      # COUNT primeiro!
+            group_offset = struct.unpack('<I', self.data[offset+4:offset+8])[0]  # OFFSET depois!
+            
+            self.groups.append({
+                'offset': group_offset,  # Offset relativo ao Data
+                'count': count,          # Número de células
+                'pair_id': pair_id,
+                'strings': [],
+                'original_offset': offset
+            })
+            
+            # DEBUG: Primeiros pares
+            if pair_id < 5:
+                print(f"  Par {pair_id}: COUNT={count}, OFFSET=0x{group_offset:04X} ({group_offset})")
+            
+            offset += 8
+        
+        print(f"Pares lidos: {len(self.groups)}/359")
+        
+        # Verificação crítica - AGORA COM VALORES CORRETOS
+        if len(self.groups) > 1:
+            print(f"\nVERIFICAÇÃO CRÍTICA:")
+            print(f"Par 0: offset={self.groups[0]['offset']}, count={self.groups[0]['count']} (deve ser 0, 0)")
+            print(f"Par 1: offset={self.groups[1]['offset']}, count={self.groups[1]['count']} (deve ser 275, 7)")
+            print(f"Par 2: count={self.groups[2]['count']}, offset={self.groups[2]['offset']} (deve ser 14, 323)")
+            
+            if self.groups[0]['count'] == 0 and self.groups[0]['offset'] == 0:
+                print("✓ Par 0 OK")
+            else:
+                print("✗ Par 0 ERRADO!")
+            
+            if self.groups[1]['count'] == 7 and self.groups[1]['offset'] == 0x67:
+                print("✓ Par 1 OK")
+            else:
+                print(f"✗ Par 1 ERRADO! Esperado: count=7, offset=103 (0x67)")
+        
+        # 4. Extrai strings
+        self.extract_strings(data_start)
+        
+        # 5. Mapeia strings para grupos (busca binária nos offsets, uma passada)
+        self.map_strings_to_groups_corrected()
+        
+        # Validação
+        total_in_groups = sum(g['count'] for g in self.groups)
+        print(f"\nVALIDAÇÃO FINAL:")
+        print(f"Células totais nos grupos: {total_in_groups}")
+        print(f"Células no header: {self.header['total_cells']}")
+        print(f"Strings extraídas: {len(self.strings)}")
+        
+        if total_in_groups == self.header['total_cells']:
+            print("✓ Contagem de células BATE!")
+        else:
+            print(f"✗ Contagem NÃO bate! Diferença: {total_in_groups - self.header['total_cells']}")
+        
+        if use_cache:
+            self.write_cache()
+        
+        return True
+
+    def _cache_payload(self):
+        cells = self.strings
+        return {
+            'header': self.header,
+            'groups': self.groups,
+            'data_start': cells.data_start,
+            'offsets': cells.offsets,
+            'lengths': cells.lengths,
+            'group_ids': cells.group_ids
+        }
+
+    def _restore_cache(self, payload):
+        self.header = payload['header']
+        self.groups = payload['groups']
+        self.strings = CellTable(self.data, payload['data_start'])
+        self.strings.offsets = payload['offsets']
+        self.strings.lengths = payload['lengths']
+        self.strings.modified_bits = bytearray((len(self.strings.offsets) + 7) // 8)
+        self.strings.group_ids = payload['group_ids']
+
+    def map_strings_to_groups_corrected(self):
+        """Mapeia strings para grupos CORRETAMENTE"""
+        print(f"\nMapeando strings para grupos CORRETAMENTE...")
+        
+        cells = self.strings
+        mapped_groups = 0
+        
+        # Reset
+        cells.group_ids = {}
+        for group in self.groups:
+            group['strings'] = []
+        
+        # Grupo 0 é dummy (count=0, offset=0)
+        # Grupo 1 é o primeiro real
+        
+        for group_id, group in enumerate(self.groups):
+            count = group['count']
+            
+            if count > 0:
+                # Encontra a célula que começa neste offset
+                target_offset = group['offset']
+                found_cell_index = cells.index_at_offset(target_offset)
+                
+                if found_cell_index is not None:
+                    # Adiciona 'count' células a partir desta
+                    last_cell_index = min(found_cell_index + count, len(cells))
+                    group['strings'] = list(range(found_cell_index + 1, last_cell_index + 1))
+                    for cell_idx in range(found_cell_index, last_cell_index):
+                        cells.group_ids[cell_idx] = group_id
+                    mapped_groups += 1
+                else:
+                    print(f"  ✗ Grupo {group_id}: nenhuma célula encontrada no offset {target_offset}")
+        
+        print(f"Grupos mapeados: {mapped_groups}")
+    
+    def extract_strings(self, data_start):
+        """Extrai strings - versão corrigida"""
+        pos = data_start
+        strings_extracted = 0
+        
+        # As células só guardam offset/tamanho; bytes e texto vêm do buffer quando acessados
+        # (no modo mmap o buffer é o próprio arquivo mapeado)
+        self.strings = CellTable(self.data, data_start)
+        
+        print(f"\nExtraindo strings de 0x{data_start:08X}...")
+        
+        while pos < len(self.data) and strings_extracted < self.header['total_cells']:
+            end_pos = self.data.find(b'\x00', pos)
+            if end_pos == -1:
+                break
+            
+            self.strings.append(pos - data_start, end_pos - pos)
+            
+            pos = end_pos + 1
+            strings_extracted += 1
+        
+        print(f"Strings extraídas: {len(self.strings)}")
+        
+        # Mostra primeiras strings
+        print("\nPrimeiras 3 strings:")
+        for i in range(min(3, len(self.strings))):
+            s = self.strings[i]
+            print(f"  Célula {s['cell_id']}: offset={s['offset']}, grupo={s['group_id']}, texto='{s['text']}'")
+    
+    def base_records(self, indices):
+        """Registros ainda sem tradução das células `indices`, para acrescentar ao _TRADUZIR"""
+        for index in indices:
+            string_info = self.strings[index]
+            group_id = string_info['group_id']
+            yield {
+                'offset': string_info['absolute_offset'],
+                'cell_id': index + 1,
+                'refs': f"GRUPO: {group_id if group_id is not None else 'N/A'}",
+                'original_length': None,
+                'original': string_info['text'],
+                'translation': ''
+            }
+    
+    # 🔥🔥🔥 ADICIONE ESTE MÉTODO SE NÃO EXISTIR 🔥🔥🔥
+    def update_string(self, cell_id, new_text):
+        """Atualiza uma string pelo ID da célula (1-based)"""
+        if 1 <= cell_id <= len(self.strings):
+            string_info = self.strings[cell_id - 1]
+            string_info['modified'] = True
+            string_info['new_text'] = new_text
+            
+            # Log da modificação
+            old_len = string_info['byte_length']
+            new_len = len(new_text)  # cp1252 (e o fallback) gravam 1 byte por caractere
+            
+            delta = new_len - old_len
+            
+            print(f"Célula {cell_id} atualizada: '{string_info['text'][:20]}...' → '{new_text[:20]}...'")
+            print(f"  Tamanho: {old_len} → {new_len} bytes (Δ={delta})")
+            
+            return True
+        else:
+            print(f"ERRO: Célula {cell_id} não encontrada (total: {len(self.strings)} células)")
+            return False
+    
+    def save(self):
+        """Salva arquivo COM A MESMA ORDEM DO ORIGINAL: (COUNT, OFFSET)"""
+        print("\n" + "="*60)
+        print("SALVANDO ARQUIVO BINÁRIO")
+        print("🔥🔥🔥 ORDEM: (COUNT, OFFSET) - MESMA DO ORIGINAL 🔥🔥🔥")
+        print("="*60)
+        
+        # 1. Reconstrói Data block
+        data_block = bytearray()
+        cell_offsets = {}
+        new_lengths = []
+        current_offset = 0
+        
+        # Constrói data block lendo as colunas da CellTable direto, sem criar views
+        cells = self.strings
+        for cell_index in range(len(cells)):
+            cell_id = cell_index + 1
+            cell_offsets[cell_id] = current_offset
+            
+            if cells.new_texts.get(cell_index) and cells.is_modified(cell_index):
+                encoded = cells.encode_new_text(cell_index)
+            else:
+                encoded = cells.get_bytes(cell_index)
+            new_lengths.append(len(encoded))
+            
+            data_block.extend(encoded)
+            data_block.append(0)
+            current_offset += len(encoded) + 1
+        
+        # Null final
+        if len(data_block) == 0 or data_block[-1] != 0:
+            data_block.append(0)
+        
+        print(f"Data block: {len(data_block)} bytes")
+        
+        # 2. Reconstrói List block COM ORDEM (COUNT, OFFSET)
+        list_block = bytearray()
+        # Após construir list_block (linha 376):
+        print(f"\nDEBUG list_block - primeiros 32 bytes:")
+        hex_str = ' '.join(f'{b:02X}' for b in list_block[:32])
+        print(hex_str)
+
+        # Interpreta os primeiros 3 pares
+        print("\nInterpretação dos primeiros 3 pares (COUNT, OFFSET):")
+        for i in range(0, 24, 8):  # 3 pares * 8 bytes
+            if i + 8 <= len(list_block):
+                count = struct.unpack('<I', list_block[i:i+4])[0]
+                offset = struct.unpack('<I', list_block[i+4:i+8])[0]
+                print(f"  Par {i//8}: count={count}, offset=0x{offset:04X}")
+
+        
+        for group in self.groups:
+            count = group['count']
+            offset = 0
+
+            # 1. Se o grupo tem strings mapeadas, usa a primeira
+            if group['strings']:
+                first_cell_id = min(group['strings'])
+                offset = cell_offsets.get(first_cell_id, 0)
+
+            # 2. Se NÃO tem strings, mas tinha offset original, recalcula pelo offset antigo
+            elif group['offset'] != 0:
+                cell_id = self.find_cell_by_original_offset(group['offset'])
+                if cell_id and cell_id in cell_offsets:
+                    offset = cell_offsets[cell_id]
+
+            # 3. fallback (raríssimo)
+            else:
+                offset = 0
+            
+            # 🔥🔥🔥 ORDEM (COUNT, OFFSET) como no original
+            list_block.extend(struct.pack('<I', count))      # COUNT primeiro
+            list_block.extend(struct.pack('<I', offset))     # OFFSET depois
+            
+            if group['pair_id'] < 5:
+                print(f"  Par {group['pair_id']}: count={count}, offset=0x{offset:04X} ({offset})")
+        
+        # 3. Padding
+        list_size_needed = self.DATA_START - 0x20
+        if len(list_block) < list_size_needed:
+            padding = list_size_needed - len(list_block)
+            list_block.extend(b'\x00' * padding)
+        
+        # 4. Arquivo completo
+        new_data = bytearray()
+        
+        # Signature
+        signature = b'Emperor textfile'
+        new_data.extend(signature.ljust(16, b'\x00'))
+        
+        # Header
+        new_data.extend(struct.pack('<I', self.header['num_count_values']))
+        new_data.extend(struct.pack('<I', self.header['total_cells']))  # Atualiza total de células
+        new_data.extend(struct.pack('<I', self.header['mystery_value']))
+        new_data.extend(struct.pack('<I', self.header['reserved']))
+        
+        # List block
+        new_data.extend(list_block)
+        
+        # Data block
+        new_data.extend(data_block)
+        
+        # 5. Salva
+        # O arquivo não pode ser sobrescrito enquanto estiver mapeado
+        self.close(keep_data=True)
+        
+        try:
+            # Novo arquivo
+            with open(self.filename, 'wb') as f:
+                f.write(new_data)
+            
+            print(f"Arquivo salvo: {self.filename}")
+            print(f"Tamanho original: {len(self.data)} bytes")
+            print(f"Tamanho novo: {len(new_data)} bytes")
+            
+            # As células passam a refletir o arquivo gravado
+            self._rebase(new_data, [cell_offsets[cell_index + 1] for cell_index in range(len(cells))], new_lengths)
+
+            # 🔥🔥🔥 ADICIONE ESTA LINHA:
+            self.verify_saved_file(new_data)  # Verifica se salvou corretamente!
+            
+            return True
+                
+        except Exception as e:
+            print(f"✗ ERRO ao salvar: {e}")
+            return False
+
+    def _offset_patches(self, plan):
+        """[(posição no arquivo, novo offset)] dos grupos cujo offset muda com o plan"""
+        cells = self.strings
+        patches = []
+        for group in self.groups:
+            if group['strings']:
+                target = cells.offsets[min(group['strings']) - 1]
+            elif group['offset'] != 0 and self.find_cell_by_original_offset(group['offset']):
+                target = group['offset']
+            else:
+                continue  # Grupo vazio ou offset fora do início de uma célula: mantém
+            
+            new_offset = target + plan.shift(target)
+            if new_offset != group['offset']:
+                patches.append((group['original_offset'] + 4, new_offset))
+        return patches
+
+    def _rebase_pointers(self):
+        """Após salvar: offsets dos grupos relidos do arquivo gravado"""
+        for group in self.groups:
+            group['offset'] = struct.unpack_from('<I', self.data, group['original_offset'] + 4)[0]
+
+    def find_cell_by_original_offset(self, original_offset):
+        """Encontra a célula que começa exatamente nesse offset original"""
+        index = self.strings.index_at_offset(original_offset)
+        if index is not None:
+            return index + 1
+        return None
+
+    
+    def verify_saved_file(self, new_data):
+        """Verificação completa - CORRIGIDA para ordem (COUNT, OFFSET)"""  # 🔥 MUDOU!
+        print("\n" + "="*60)
+        print("VERIFICAÇÃO DO ARQUIVO SALVO")
+        print("ORDEM: (COUNT, OFFSET)")  # 🔥 CORRIGIDO PARA COUNT, OFFSET!
+        print("="*60)
+        
+        try:
+            # 1. Signature
+            sig = new_data[0:16].decode('ascii', errors='ignore').rstrip('\x00')
+            if sig != "Emperor textfile":
+                print(f"✗ Signature inválida: {sig}")
+                return False
+            print(f"✓ Signature: {sig}")
+            
+            # 2. Header
+            num_count = struct.unpack('<I', new_data[16:20])[0]
+            if num_count != 359:
+                print(f"✗ num_count_values inválido: {num_count}")
+                return False
+            print(f"✓ num_count_values: {num_count}")
+            
+            # 3. Primeiros pares - ORDEM CORRETA: COUNT, OFFSET
+            print("\nVerificando primeiros pares (COUNT, OFFSET):")  # 🔥 CORRIGIDO!
+            
+            # Par 0: deve ser (0, 0)
+            count0 = struct.unpack('<I', new_data[32:36])[0]  # COUNT primeiro
+            offset0 = struct.unpack('<I', new_data[36:40])[0]  # OFFSET depois
+            
+            if count0 == 0 and offset0 == 0:
+                print(f"✓ Par 0: count={count0}, offset={offset0}")
+            else:
+                print(f"✗ Par 0 ERRADO: count={count0}, offset={offset0} (deveria ser 0, 0)")
+                return False
+            
+            # Par 1: deve ser (7, 0x67)
+            count1 = struct.unpack('<I', new_data[40:44])[0]  # COUNT
+            offset1 = struct.unpack('<I', new_data[44:48])[0]  # OFFSET
+            
+            print(f"  Par 1: count={count1}, offset=0x{offset1:04X} ({offset1})")
+            
+            # Par 2: deve ser (0x143 (323), 14)
+            offset2 = struct.unpack('<I', new_data[48:52])[0]  # OFFSET
+            count2 = struct.unpack('<I', new_data[52:56])[0]   # COUNT
+            print(f"  Par 2: offset=0x{offset2:04X} ({offset2}), count={count2}")
+            
+            print(f"\n✓ Arquivo verificado com sucesso!")
+            return True
+            
+        except Exception as e:
+            print(f"✗ ERRO na verificação: {e}")
+            return False
@@ -0,0 +1,137 @@
+"""Glossário EN → PT: termos exigidos na tradução, procurados com Aho-Corasick"""
+import re
+from collections import deque
+
+from .registros import anotar_bloco
+from .indices import remover_acentos
+
+# ---------------- GLOSSÁRIO ---------------- #
+
+# Escapes do texto (\n, \x0E...) e o número do link (@118Hygiene): separam palavras
+SEPARATOR_RE = re.compile(r"\\(?:x[0-9A-Fa-f]{2}|.)|@\d+")
+PT_PLURAL = ("S", "ES")  # Terminações aceitas depois de uma tradução PT inteira
+
+def palavra_em(text, start, end, endings=("s",), prefix=False):
+    """Se text[start:end] é uma palavra inteira (aceitando uma das `endings` logo depois)
+    
+    Com `prefix`, basta começar uma palavra ("habitaç*" aceita "habitação").
+    """
+    size = len(text)
+    word = lambda i: i < size and (text[i].isalnum() or text[i] == "_")  # [city_name] não é "city"
+    if start > 0 and word(start - 1):
+        return False
+    if prefix or not word(end):
+        return True
+    return any(text.startswith(ending, end) and not word(end + len(ending)) for ending in endings)
+
+class AhoCorasick:
+    """Autômato de Aho-Corasick: todas as ocorrências de vários termos numa passada só"""
+    
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                child = self.goto[node].get(ch)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][ch] = child
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                node = child
+            self.out[node].append(index)
+        
+        # Links de falha em largura: cada nó aponta para o maior sufixo que também é prefixo
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self.goto[node].items():
+                queue.append(child)
+                fail = self.fail[node]
+                while fail and ch not in self.goto[fail]:
+                    fail = self.fail[fail]
+                target = self.goto[fail].get(ch, 0)
+                self.fail[child] = target if target != child else 0
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+    
+    def iter(self, text):
+        """Gera (início, fim, índice do termo) de cada ocorrência"""
+        goto, fail, out, patterns = self.goto, self.fail, self.out, self.patterns
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for index in out[node]:
+                yield i + 1 - len(patterns[index]), i + 1, index
+
+class Glossary:
+    """Glossário EN → PT exigido, compilado em dois autômatos de Aho-Corasick
+    
+    Termo EN: sem diferenciar maiúsculas, palavra inteira (aceita o plural com "s").
+    Tradução PT: sem acentos/maiúsculas, palavra inteira na TRADUÇÃO (aceita o plural
+    com "s"/"es"); "tradu*" aceita qualquer palavra que comece assim e "|" separa
+    alternativas aceitas. Arquivo: uma linha "termo em inglês = tradução | alternativa".
+    """
+    
+    def __init__(self, terms):
+        self.terms = terms  # [(termo EN, [traduções PT])]
+        self.en = AhoCorasick([en.lower() for en, pts in terms])
+        
+        forms = {}
+        self.pt_of = []  # termo → {formas PT aceitas}
+        for en, pts in terms:
+            ids = set()
+            for pt in pts:
+                form = (remover_acentos(pt.rstrip("*").strip()), pt.endswith("*"))
+                ids.add(forms.setdefault(form, len(forms)))
+            self.pt_of.append(ids)
+        self.pt_prefix = [prefix for form, prefix in forms]  # forma → só início de palavra
+        self.pt = AhoCorasick(form for form, prefix in forms)
+    
+    @classmethod
+    def load(cls, path):
+        terms = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                en, pt = line.split("=", 1)
+                pts = [p.strip() for p in pt.split("|") if p.strip()]
+                if en.strip() and pts:
+                    terms.append((en.strip(), pts))
+        return cls(terms)
+    
+    def __len__(self):
+        return len(self.terms)
+    
+    def terms_in(self, original):
+        """Índices dos termos EN que aparecem como palavra inteira no ORIGINAL"""
+        text = SEPARATOR_RE.sub(" ", original).lower()
+        return {index for start, end, index in self.en.iter(text) if palavra_em(text, start, end)}
+    
+    def check(self, original, translation):
+        """[(termo EN, [traduções PT])] do ORIGINAL cuja tradução exigida falta na TRADUÇÃO"""
+        if not original or not translation:
+            return []
+        found = self.terms_in(original)
+        if not found:
+            return []
+        text = remover_acentos(SEPARATOR_RE.sub(" ", translation))
+        present = {index for start, end, index in self.pt.iter(text)
+                   if palavra_em(text, start, end, PT_PLURAL, self.pt_prefix[index])}
+        return [self.terms[index] for index in sorted(found) if not self.pt_of[index] & present]
+
+def descrever_termos(missing):
+    """Termos fora do glossário numa linha: "termo → tradução | alternativa, ..." """
+    return ", ".join(f"{en} → {' | '.join(pts)}" for en, pts in missing)
+
+def anotar_glossario(block, missing):
+    """Marca no bloco (antes da TRADUÇÃO:) os termos do glossário sem a tradução exigida"""
+    return anotar_bloco(block, [f"GLOSSÁRIO: {en} → {' | '.join(pts)}" for en, pts in missing])
@@ -0,0 +1,241 @@
+"""Índices de pesquisa do _TRADUZIR: palavras (sem acentos) e trigramas (trecho/regex)"""
+import re
+import bisect
+import unicodedata
+
+# ---------------- ÍNDICE DE PALAVRAS ---------------- #
+
+WORD_RE = re.compile(r"\w+")
+
+def remover_acentos(texto):
+    """Remove acentuação"""
+    texto_normalizado = unicodedata.normalize('NFKD', texto)
+    texto_sem_acentos = ''.join(c for c in texto_normalizado if not unicodedata.combining(c))
+    return texto_sem_acentos.upper()
+
+class WordIndex:
+    """Índice invertido das palavras do ORIGINAL e da TRADUÇÃO, sem acento (remover_acentos)
+    
+    As chaves são (asset, cell_id), então um mesmo índice pode juntar os arquivos do jogo.
+    Consulta: termos separados por espaço = E; "|" entre termos = OU; "termo*" = prefixo.
+    Só "|" é operador: "ou" e "or" são palavras comuns e podem ser pesquisadas.
+    """
+    
+    FIELDS = ('original', 'translation')
+    
+    def __init__(self):
+        self.postings = {field: {} for field in self.FIELDS}  # palavra → {chave}
+        self.doc_tokens = {}  # (chave, campo) → palavras indexadas (para atualizar/remover)
+        self._sorted = {field: None for field in self.FIELDS}  # palavras ordenadas (prefixo)
+    
+    @staticmethod
+    def tokens(text):
+        return set(WORD_RE.findall(remover_acentos(text or '')))
+    
+    def set_field(self, key, field, text):
+        """(Re)indexa um campo de uma célula"""
+        postings = self.postings[field]
+        
+        for token in self.doc_tokens.pop((key, field), ()):
+            keys = postings.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del postings[token]
+                    self._sorted[field] = None
+        
+        tokens = self.tokens(text)
+        for token in tokens:
+            keys = postings.get(token)
+            if keys is None:
+                keys = postings[token] = set()
+                self._sorted[field] = None
+            keys.add(key)
+        if tokens:
+            self.doc_tokens[(key, field)] = tokens
+    
+    def add(self, key, original, translation):
+        self.set_field(key, 'original', original)
+        self.set_field(key, 'translation', translation)
+    
+    def _lookup(self, field, token, prefix):
+        postings = self.postings[field]
+        if not prefix:
+            return postings.get(token, set())
+        
+        if self._sorted[field] is None:
+            self._sorted[field] = sorted(postings)
+        tokens = self._sorted[field]
+        
+        keys = set()
+        for i in range(bisect.bisect_left(tokens, token), len(tokens)):
+            if not tokens[i].startswith(token):
+                break
+            keys |= postings[tokens[i]]
+        return keys
+    
+    def query(self, text, field=None):
+        """Chaves que satisfazem a consulta (field='original'/'translation' restringe o campo)"""
+        fields = self.FIELDS if field is None else (field,)
+        
+        # "|" separa grupos; dentro do grupo todos os termos precisam aparecer
+        groups = [part.split() for part in text.split('|')]
+        
+        result = set()
+        for group in groups:
+            group_keys = None
+            for term in group:
+                prefix = term.endswith('*')
+                words = WORD_RE.findall(remover_acentos(term.rstrip('*')))
+                for n, word in enumerate(words):
+                    keys = set()
+                    for f in fields:
+                        keys |= self._lookup(f, word, prefix and n == len(words) - 1)
+                    group_keys = keys if group_keys is None else group_keys & keys
+            if group_keys:
+                result |= group_keys
+        return result
+
+# ---------------- ÍNDICE DE TRIGRAMAS ---------------- #
+
+def trigramas(texto):
+    """Conjunto de trigramas (3 caracteres seguidos) do texto em minúsculas"""
+    texto = texto.lower()
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+def literais_obrigatorios(pattern):
+    """Trechos literais que toda ocorrência do regex precisa conter
+    
+    Retorna None quando não dá para garantir nenhum (alternativa "|" no padrão).
+    Grupos ( ), classes [ ] e escapes como \\d quebram o trecho; o caractere antes de
+    ?, * ou {n,m} é descartado por ser opcional.
+    """
+    if '|' in pattern:
+        return None
+    
+    literals = []
+    current = []
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\' and i + 1 < len(pattern):
+            nxt = pattern[i + 1]
+            i += 2
+            if nxt.isalnum():  # \d, \w, \b, \xHH...: não é texto literal
+                literals.append(''.join(current))
+                current = []
+                if nxt == 'x':
+                    i += 2
+            elif depth == 0:
+                current.append(nxt)
+            continue
+        if c in '*?{':
+            if current:
+                current.pop()
+            if c == '{':
+                end = pattern.find('}', i)
+                i = len(pattern) if end < 0 else end
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            i = len(pattern) if end < 0 else end
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth = max(0, depth - 1)
+        elif c not in '.^$+' and depth == 0:
+            current.append(c)
+            i += 1
+            continue
+        literals.append(''.join(current))
+        current = []
+        i += 1
+    literals.append(''.join(current))
+    return [literal for literal in literals if len(literal) >= 3]
+
+class TrigramIndex:
+    """Índice de trigramas do ORIGINAL (texto escapado, como no _TRADUZIR) e da TRADUÇÃO
+    
+    Serve para trechos que o WordIndex não acha (@101, \\x0E, meia palavra): os trigramas
+    da consulta filtram as candidatas e só elas passam pela comparação completa.
+    """
+    
+    FIELDS = ('original', 'translation')
+    
+    def __init__(self):
+        self.postings = {field: {} for field in self.FIELDS}  # trigrama → {chave}
+        self.texts = {}  # (chave, campo) → texto indexado
+    
+    def set_field(self, key, field, text):
+        """(Re)indexa um campo de uma célula"""
+        postings = self.postings[field]
+        
+        old = self.texts.pop((key, field), None)
+        if old:
+            for gram in trigramas(old):
+                keys = postings.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del postings[gram]
+        
+        if text:
+            self.texts[(key, field)] = text
+            for gram in trigramas(text):
+                keys = postings.get(gram)
+                if keys is None:
+                    keys = postings[gram] = set()
+                keys.add(key)
+    
+    def add(self, key, original, translation):
+        self.set_field(key, 'original', original)
+        self.set_field(key, 'translation', translation)
+    
+    def candidates(self, literals, field):
+        """Chaves cujo campo contém todos os trigramas dos literais (None = sem filtro possível)"""
+        grams = set()
+        for literal in literals or ():
+            grams |= trigramas(literal)
+        if not grams:
+            return None
+        
+        postings = self.postings[field]
+        keys = None
+        for gram in sorted(grams, key=lambda g: len(postings.get(g, ()))):
+            found = postings.get(gram)
+            if not found:
+                return set()
+            keys = set(found) if keys is None else keys & found
+            if not keys:
+                break
+        return keys
+    
+    def search(self, text, regex=False, field=None):
+        """Gera as chaves confirmadas, em ordem, para um trecho (sem diferenciar maiúsculas) ou regex
+        
+        O regex é compilado antes de gerar qualquer resultado (re.error sai na chamada).
+        """
+        fields = self.FIELDS if field is None else (field,)
+        if regex:
+            matcher = re.compile(text, re.IGNORECASE).search
+            literals = literais_obrigatorios(text)
+        else:
+            needle = text.lower()
+            matcher = lambda value: needle in value.lower()
+            literals = [text]
+        
+        candidates = set()
+        for f in fields:
+            keys = self.candidates(literals, f)
+            if keys is None:
+                keys = {key for key, kf in self.texts if kf == f}
+            candidates |= keys
+        
+        def confirm():
+            for key in sorted(candidates):
+                for f in fields:
+                    value = self.texts.get((key, f))
+                    if value and matcher(value):
+                        yield key
+                        break
+        return confirm()
@@ -0,0 +1,712 @@
+"""Interface Tk dos tradutores: Extrair → Traduzir → Colar → Mesclar → Gravar binário
+
+Os botões e as mensagens são os mesmos para todos os formatos; cada script abre a janela
+com a TranslatorSession do seu .eng (abrir_interface). A linha de comando fica no módulo
+cli, que não importa tkinter nem pyperclip.
+"""
+import re
+import os
+import tkinter as tk
+from tkinter import messagebox, scrolledtext
+
+import pyperclip
+
+from .binario import descrever_analise
+from .glossario import descrever_termos, anotar_glossario
+from .validacao import anotar_codigos
+
+MAX = 50  # Células por lote
+BUILD_IDLE_MS = 30000  # Grava o binário após 30s sem novas mesclagens
+
+# Sessão da janela aberta e seus arquivos (definidos em abrir_interface)
+SESSION = None
+BASE = None
+BIN_FILE = None
+GLOSSARY_FILE = None
+
+# ---------------- FUNÇÕES AUXILIARES ---------------- #
+
+def extrair_todas_as_celulas():
+    """Extrai TODAS as células do arquivo binário para o arquivo BASE de uma vez"""
+    if not os.path.exists(BIN_FILE):
+        messagebox.showerror("Erro", f"Arquivo binário não encontrado: {BIN_FILE}")
+        return None
+    
+    try:
+        total_cells, existing_count, added = SESSION.add_missing_cells()
+    except Exception as e:
+        messagebox.showerror("Erro", f"Erro ao salvar células: {str(e)}")
+        return None
+    
+    if added:
+        # Atualiza a interface
+        text_extrair.delete("1.0", tk.END)
+        text_extrair.insert(tk.END,
+            "EMPEROR TRANSLATOR - TODAS AS CÉLULAS\n"
+            "==================================\n"
+            f"Arquivo: {BIN_FILE}\n"
+            f"Total de células no binário: {total_cells}\n"
+            f"Células já no arquivo .txt: {existing_count}\n"
+            f"Células adicionadas agora: {added}\n"
+            f"\nO arquivo {BASE} agora contém TODAS as células.\n"
+            f"Você pode traduzir em qualquer ordem.\n\n"
+            f"Status: {added} novas células adicionadas\n"
+            f"Total no arquivo: {existing_count + added} células\n"
+        )
+        
+        messagebox.showinfo("Extração Completa", 
+                          f"Extraição concluída!\n\n"
+                          f"Total de células no binário: {total_cells}\n"
+                          f"Células já no arquivo: {existing_count}\n"
+                          f"Células adicionadas: {added}\n\n"
+                          f"O arquivo {BASE} agora contém TODAS as células.")
+    else:
+        # Atualiza a interface mesmo se não houver novas células
+        text_extrair.delete("1.0", tk.END)
+        text_extrair.insert(tk.END,
+            "EMPEROR TRANSLATOR - TODAS AS CÉLULAS\n"
+            "==================================\n"
+            f"Arquivo: {BIN_FILE}\n"
+            f"Total de células no binário: {total_cells}\n"
+            f"Células já no arquivo .txt: {existing_count}\n"
+            f"\nTodas as células já estão no arquivo {BASE}\n"
+            f"Continue traduzindo e use 'Mesclar' para atualizar.\n\n"
+            f"Status: Nenhuma célula nova adicionada\n"
+            f"Total no arquivo: {existing_count} células\n"
+        )
+        
+        messagebox.showinfo("Extração Completa", 
+                          f"Todas as {total_cells} células já estão no arquivo.\n"
+                          f"Use 'Extrair para traduzir' para pegar células não traduzidas.")
+    
+    return added
+
+def preencher_rascunhos():
+    """Botão "Preencher pela memória": rascunhos para os originais já traduzidos"""
+    try:
+        filled = len(SESSION.fill_from_memory())
+    except FileNotFoundError:
+        messagebox.showinfo("Info", "Execute 'Extrair TODAS as células' primeiro.")
+        return None
+    mostrar_progresso()
+    if filled:
+        messagebox.showinfo("Memória de tradução", 
+                          f"{filled} células preenchidas como rascunho.\n"
+                          f"Revise-as e mescle para irem ao binário.")
+    else:
+        messagebox.showinfo("Memória de tradução", "Nenhuma célula não traduzida tem o original já traduzido.")
+    return filled
+
+def extrair_celulas_para_traducao():
+    """Extrai um lote de células para tradução (apenas as não traduzidas)"""
+    if not os.path.exists(BASE):
+        messagebox.showinfo("Info", "Execute 'Extrair TODAS as células' primeiro.")
+        return None
+    
+    print("\n" + "="*60)
+    print("ANALISANDO CÉLULAS PARA TRADUÇÃO")
+    print("="*60)
+    
+    # Só as MAX primeiras células não traduzidas (do banco, se houver, ou do arquivo em streaming)
+    try:
+        total_blocks, translated_count, untranslated_count, selected_blocks = SESSION.untranslated_batch(MAX)
+    except FileNotFoundError:
+        messagebox.showinfo("Info", "Execute 'Extrair TODAS as células' primeiro.")
+        return None
+    
+    print(f"Total de blocos encontrados: {total_blocks}")
+    print(f"Total de células: {total_blocks}")
+    print(f"Células traduzidas: {translated_count}")
+    print(f"Células não traduzidas: {untranslated_count}")
+    
+    # Prepara texto para tradução, com as sugestões da memória aproximada em cada bloco
+    output_text = SESSION.batch_text(selected_blocks)
+    
+    # Atualiza a interface
+    text_extrair.delete("1.0", tk.END)
+    text_extrair.insert(tk.END,
+        "EMPEROR TRANSLATOR - CÉLULAS PARA TRADUZIR\n"
+        "=======================================\n"
+        f"Total de células no arquivo: {total_blocks}\n"
+        f"Células traduzidas: {translated_count}\n"
+        f"Células não traduzidas: {untranslated_count}\n"
+        f"Extraindo {len(selected_blocks)} células para tradução...\n\n"
+    )
+    
+    text_extrair.insert(tk.END, output_text)
+    mostrar_progresso()
+    
+    if selected_blocks:
+        messagebox.showinfo("Extração concluída", 
+                          f"{len(selected_blocks)} células não traduzidas extraídas.\n"
+                          f"Total de células: {total_blocks}\n"
+                          f"Traduzidas: {translated_count}\n"
+                          f"Restantes: {untranslated_count}")
+    else:
+        messagebox.showinfo("Tradução Concluída", 
+                          "Todas as células já foram traduzidas!\n"
+                          f"Total: {total_blocks} células")
+    
+    return selected_blocks
+
+def pesquisar_celulas_por_palavra():
+    """Pesquisa células por palavra no original ou na tradução"""
+    if not os.path.exists(BASE):
+        messagebox.showinfo("Info", "Execute 'Extrair TODAS as células' primeiro.")
+        return None
+    
+    # Janela de diálogo para pedir a palavra
+    class PesquisaDialog(tk.Toplevel):
+        def __init__(self, parent):
+            super().__init__(parent)
+            self.title("Pesquisar Células")
+            self.geometry("420x270")
+            self.result = None
+            
+            tk.Label(self, text="Digite a palavra, trecho ou regex para pesquisar:", font=("Arial", 10)).pack(pady=10)
+            
+            self.entry = tk.Entry(self, width=40)
+            self.entry.pack(pady=5)
+            self.entry.bind("<Return>", lambda event: self.pesquisar())
+            self.entry.focus()
+            
+            tk.Label(self, text="Palavras: ignora acentos; palavra* = prefixo; a | b = qualquer uma",
+                     font=("Arial", 9), fg="gray").pack()
+            
+            # Tipo de pesquisa: índice de palavras ou trecho/regex (índice de trigramas)
+            self.mode = tk.StringVar(value="palavras")
+            mode_frame = tk.Frame(self)
+            mode_frame.pack(pady=5)
+            for text, value in (("Palavras", "palavras"), ("Trecho (@101, \\x0E...)", "trecho"), ("Regex", "regex")):
+                tk.Radiobutton(mode_frame, text=text, variable=self.mode, value=value).pack(side=tk.LEFT)
+            
+            # Campo onde pesquisar
+            self.field = tk.StringVar(value="")
+            field_frame = tk.Frame(self)
+            field_frame.pack(pady=5)
+            for text, value in (("ORIGINAL e TRADUÇÃO", ""), ("Só ORIGINAL", "original"), ("Só TRADUÇÃO", "translation")):
+                tk.Radiobutton(field_frame, text=text, variable=self.field, value=value).pack(side=tk.LEFT)
+            
+            btn_frame = tk.Frame(self)
+            btn_frame.pack(pady=10)
+            
+            tk.Button(btn_frame, text="Pesquisar", command=self.pesquisar, bg="#4CAF50", fg="white", width=10).pack(side=tk.LEFT, padx=5)
+            tk.Button(btn_frame, text="Cancelar", command=self.destroy, bg="#f44336", fg="white", width=10).pack(side=tk.LEFT, padx=5)
+        
+        def pesquisar(self):
+            palavra = self.entry.get()
+            if self.mode.get() == "palavras":
+                palavra = palavra.strip()
+            if palavra.strip():
+                self.result = (palavra, self.field.get() or None, self.mode.get())
+                self.destroy()
+    
+    # Mostra diálogo de pesquisa
+    dialog = PesquisaDialog(root)
+    root.wait_window(dialog)
+    
+    if not dialog.result:
+        return None
+    palavra, field, modo = dialog.result
+    
+    print("\n" + "="*60)
+    print(f"PESQUISANDO ({modo.upper()}): '{palavra}'")
+    print("="*60)
+    
+    try:
+        if modo == "palavras":
+            total_blocks, resultados = SESSION.search(palavra, field)
+        else:
+            total_blocks, resultados = SESSION.search_fragment(palavra, modo == "regex", field)
+    except FileNotFoundError:
+        messagebox.showinfo("Info", "Execute 'Extrair TODAS as células' primeiro.")
+        return None
+    except re.error as e:
+        messagebox.showerror("Erro", f"Expressão regular inválida: {e}")
+        return None
+    
+    print(f"Total de células: {total_blocks}")
+    
+    # Atualiza a interface (os blocos entram na tela conforme são confirmados)
+    text_extrair.delete("1.0", tk.END)
+    text_extrair.insert(tk.END,
+        f"EMPEROR TRANSLATOR - PESQUISA POR: '{palavra}'\n"
+        "===============================================\n"
+        f"Total de células no arquivo: {total_blocks}\n"
+        f"\nResultados da pesquisa:\n\n"
+    )
+    
+    matching_blocks = []
+    for cell_id, block in resultados:
+        matching_blocks.append((cell_id, block))
+        text_extrair.insert(tk.END, block + "\n\n")
+        if len(matching_blocks) % 50 == 0:
+            text_extrair.update_idletasks()
+    
+    print(f"Células encontradas: {len(matching_blocks)}")
+    text_extrair.insert(tk.END, f"Células encontradas: {len(matching_blocks)}\n")
+    
+    if matching_blocks:
+        # Copia para área de transferência
+        output_text = "".join(block + "\n\n" for cell_id, block in matching_blocks)
+        pyperclip.copy(output_text)
+        messagebox.showinfo("Pesquisa Concluída", 
+                          f"Encontradas {len(matching_blocks)} células contendo '{palavra}'.\n\n"
+                          f"Resultados copiados para área de transferência.")
+    else:
+        text_extrair.insert(tk.END, f"\nNenhuma célula encontrada contendo '{palavra}'.\n")
+        messagebox.showinfo("Pesquisa Concluída", 
+                          f"Nenhuma célula encontrada contendo '{palavra}'.")
+    
+    return matching_blocks
+
+# ---------------- MESCLAGEM ---------------- #
+
+def mesclar_traducao_completa():
+    """Mescla traduções no arquivo de texto E atualiza o arquivo binário COM VALIDAÇÃO"""
+    # Garante que o arquivo BASE existe
+    SESSION.create_base()
+    
+    cola_text = text_mesclar.get("1.0", tk.END).strip()
+    if not cola_text:
+        messagebox.showwarning("Aviso", "Cole os textos traduzidos antes de mesclar.")
+        return
+    
+    # 1. Primeiro, mescla no arquivo de texto BASE
+    try:
+        store = SESSION.translations()
+    except FileNotFoundError:
+        messagebox.showerror("Erro", f"Arquivo {BASE} não encontrado. Execute a extração primeiro.")
+        return
+    
+    # Valida o texto colado contra o BASE (original e códigos de controle)
+    updates_for_binary, rejected = SESSION.validate_paste(cola_text.splitlines())
+    applied = len(updates_for_binary)
+    validated_cells = list(updates_for_binary)
+    validation_errors = []  # Lista de erros de validação
+    
+    for cell_id, error_msg in rejected:
+        validation_errors.append(f"Célula {cell_id}: {error_msg}")
+        
+        # Adiciona marcador de erro na interface
+        current_text = text_extrair.get("1.0", tk.END)
+        if f"Célula {cell_id}:" not in current_text:
+            error_marker = f"\n\n⚠️ ERRO VALIDAÇÃO CÉLULA {cell_id}:\n" \
+                          f"{error_msg}\n"
+            text_extrair.insert(tk.END, error_marker)
+    
+    # Mostra resumo na interface
+    text_extrair.insert(tk.END, f"\n\n{'='*50}\n")
+    text_extrair.insert(tk.END, f"RESUMO DA MESCLAGEM:\n")
+    text_extrair.insert(tk.END, f"Células validadas: {len(validated_cells)}\n")
+    text_extrair.insert(tk.END, f"Células com erro: {len(validation_errors)}\n")
+    
+    # Mostra erros de validação se houver
+    if validation_errors:
+        error_window = tk.Toplevel(root)
+        error_window.title("Erros de Validação - Original ou Códigos Não Correspondem")
+        error_window.geometry("700x500")
+        
+        # Frame principal
+        main_frame = tk.Frame(error_window)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Label explicativa
+        label = tk.Label(main_frame, text="As seguintes células NÃO serão mescladas:", 
+                        font=("Arial", 10, "bold"), fg="red")
+        label.pack(anchor=tk.W, pady=(0, 10))
+        
+        # Área de texto com scroll
+        error_text = scrolledtext.ScrolledText(main_frame, wrap=tk.WORD, height=15)
+        error_text.pack(fill=tk.BOTH, expand=True)
+        
+        error_content = f"ERROS DE VALIDAÇÃO ENCONTRADOS ({len(validation_errors)} células):\n"
+        error_content += "=" * 60 + "\n\n"
+        
+        for error in validation_errors:
+            error_content += error + "\n" + "-" * 40 + "\n"
+        
+        error_text.insert(tk.END, error_content)
+        error_text.config(state=tk.DISABLED)  # Somente leitura
+        
+        # Frame para botões
+        btn_frame = tk.Frame(main_frame)
+        btn_frame.pack(pady=10)
+        
+        # Botão para continuar apenas com células válidas
+        def continue_valid_only():
+            error_window.destroy()
+            save_and_update(applied, store, updates_for_binary, validation_errors)
+        
+        # Botão para cancelar
+        def cancel_merge():
+            error_window.destroy()
+            messagebox.showinfo("Cancelado", "Mesclagem cancelada devido a erros de validação.")
+            return
+        
+        btn_continue = tk.Button(btn_frame, text="Continuar (Apenas células válidas)", 
+                                command=continue_valid_only, bg="#4CAF50", fg="white")
+        btn_continue.pack(side=tk.LEFT, padx=5)
+        
+        btn_cancel = tk.Button(btn_frame, text="Cancelar Mesclagem", 
+                              command=cancel_merge, bg="#f44336", fg="white")
+        btn_cancel.pack(side=tk.LEFT, padx=5)
+        
+    else:
+        # Nenhum erro, continua normalmente
+        save_and_update(applied, store, updates_for_binary, validation_errors)
+
+def save_and_update(applied, store, updates_for_binary, validation_errors):
+    """Salva arquivo e atualiza binário (função auxiliar)"""
+    # Salva arquivo de texto se houve alterações
+    if applied > 0:
+        try:
+            # Grava no diário do BASE, propaga para as células repetidas e confere o glossário do lote
+            drafts, problems = SESSION.merge_batch(updates_for_binary)
+            
+            # Atualiza interface
+            text_extrair.insert(tk.END, f"\n✓ {applied} traduções aplicadas no arquivo de texto\n")
+            if drafts:
+                # Rascunhos ficam para revisão: só as células validadas vão para o binário
+                text_extrair.insert(tk.END, f"✓ {len(drafts)} células repetidas preenchidas como rascunho\n")
+            if problems:
+                text_extrair.insert(tk.END, f"⚠️ {len(problems)} células sem a terminologia do glossário:\n")
+                for cell_id, block, missing in problems:
+                    text_extrair.insert(tk.END, f"  Célula {cell_id}: {descrever_termos(missing)}\n")
+            
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao salvar arquivo {BASE}: {str(e)}")
+            return
+    
+    # 2. Atualiza arquivo binário se houver alterações
+    if updates_for_binary and os.path.exists(BIN_FILE):
+        resposta = messagebox.askyesno("Atualizar Binário", 
+                                      f"{len(updates_for_binary)} células validadas para atualizar.\n"
+                                      f"{len(validation_errors)} células ignoradas (erro de validação).\n\n"
+                                      f"Deseja aplicar as alterações válidas?")
+        
+        if resposta:
+            try:
+                # Aplica as atualizações apenas das células validadas (na sessão, sem regravar o .eng)
+                success_count, error_count = SESSION.apply_updates(updates_for_binary)
+                
+                if success_count > 0:
+                    agendar_gravacao()
+                
+                messagebox.showinfo("Sucesso", 
+                                   f"{applied} traduções aplicadas no arquivo de texto.\n"
+                                   f"{success_count} células atualizadas no binário (em memória).\n"
+                                   f"{error_count} erros ao atualizar binário.\n"
+                                   f"{len(validation_errors)} células ignoradas (validação).\n"
+                                   f"O {BIN_FILE} é gravado ao ficar ocioso, em 'Gravar binário' ou ao fechar.")
+                
+                # Atualiza interface
+                text_extrair.insert(tk.END, f"✓ {success_count} células atualizadas no binário (pendentes de gravação)\n")
+                if error_count > 0:
+                    text_extrair.insert(tk.END, f"⚠️ {error_count} erros ao atualizar binário\n")
+                if len(validation_errors) > 0:
+                    text_extrair.insert(tk.END, f"✗ {len(validation_errors)} células ignoradas (validação)\n")
+            except Exception as e:
+                messagebox.showerror("Erro", 
+                                    f"Erro ao atualizar arquivo binário: {str(e)}")
+    else:
+        if updates_for_binary and not os.path.exists(BIN_FILE):
+            messagebox.showwarning("Aviso", 
+                                 f"Arquivo binário {BIN_FILE} não encontrado.")
+            text_extrair.insert(tk.END, f"⚠️ Arquivo binário {BIN_FILE} não encontrado\n")
+        elif applied > 0:
+            if validation_errors:
+                messagebox.showinfo("Mesclagem Parcial", 
+                                   f"{applied} traduções aplicadas no arquivo de texto.\n"
+                                   f"{len(validation_errors)} células ignoradas (erro de validação).")
+                text_extrair.insert(tk.END, f"⚠️ {len(validation_errors)} células ignoradas (validação)\n")
+            else:
+                messagebox.showinfo("Mesclagem concluída", 
+                                   f"{applied} traduções aplicadas no arquivo de texto.")
+                text_extrair.insert(tk.END, f"✓ Mesclagem concluída com sucesso!\n")
+        else:
+            messagebox.showwarning("Aviso", 
+                                 "Nenhuma tradução aplicada. Verifique o formato.")
+            text_extrair.insert(tk.END, f"✗ Nenhuma tradução aplicada\n")
+    
+    mostrar_progresso()
+    
+    # Desabilita o botão de colar
+    btn_colar_trad.config(state=tk.DISABLED)
+
+def colar_traducao():
+    """Cola tradução da área de transferência"""
+    try:
+        texto_traduzido = pyperclip.paste()
+        
+        if not texto_traduzido:
+            messagebox.showwarning("Aviso", "Nada encontrado na área de transferência.")
+            return
+        
+        text_mesclar.delete("1.0", tk.END)
+        text_mesclar.insert(tk.END, texto_traduzido)
+        
+        resposta = messagebox.askyesno("Tradução Colada", 
+                                     "Tradução colada com sucesso!\n\n"
+                                     "Deseja mesclar automaticamente?")
+        
+        if resposta:
+            mesclar_traducao_completa()
+            
+    except Exception as e:
+        messagebox.showerror("Erro", f"Erro ao colar tradução: {str(e)}")
+
+# ---------------- GRAVAÇÃO DO BINÁRIO ---------------- #
+
+_build_job = None  # Gravação agendada pelo root.after
+
+def gravar_binario(silencioso=False):
+    """Grava no binário as alterações pendentes da sessão"""
+    global _build_job
+    if _build_job is not None:
+        root.after_cancel(_build_job)
+        _build_job = None
+    
+    if not SESSION.has_pending():
+        if not silencioso:
+            messagebox.showinfo("Gravar binário", "Nenhuma alteração pendente.")
+        return True
+    
+    # Códigos de controle divergentes, caracteres fora do cp1252 e crescimento do arquivo
+    problems, plan, report = SESSION.prepare_build()
+    if problems and not silencioso:
+        text_extrair.insert(tk.END, f"\n⚠️ {len(problems)} células com códigos de controle diferentes do original:\n\n")
+        for cell_id, block, erros, avisos in problems:
+            text_extrair.insert(tk.END, anotar_codigos(block, erros, avisos) + "\n\n")
+        if not messagebox.askyesno("Gravar binário", 
+                                  f"{len(problems)} células têm códigos de controle diferentes do original\n"
+                                  f"(listadas na área de extração).\n\n"
+                                  f"Gravar o binário mesmo assim?"):
+            return False
+    if report['null']:
+        # O null dividiria a célula no Data block: não grava nem com confirmação
+        text_extrair.insert(tk.END, "\nANÁLISE DA GRAVAÇÃO:\n" + "\n".join(descrever_analise(report)) + "\n")
+        messagebox.showerror("Gravar binário", 
+                            f"{len(report['null'])} células têm caractere nulo (\\x00) na tradução\n"
+                            f"(listadas na área de extração). Corrija-as antes de gravar.")
+        return False
+    if report['invalid'] and not silencioso:
+        text_extrair.insert(tk.END, "\nANÁLISE DA GRAVAÇÃO:\n" + "\n".join(descrever_analise(report)) + "\n")
+        if not messagebox.askyesno("Gravar binário", 
+                                  f"{len(report['invalid'])} células têm caracteres fora do cp1252,\n"
+                                  f"que virariam '?' no jogo (listadas na área de extração).\n\n"
+                                  f"Gravar o binário mesmo assim?"):
+            return False
+    
+    pending = len(SESSION.pending_cells)
+    try:
+        ok = SESSION.build(plan)
+    except Exception as e:
+        print(f"✗ Erro ao gravar {BIN_FILE}: {e}")
+        ok = False
+    
+    if ok:
+        mostrar_progresso()
+        status_var.set(f"✓ {pending} células gravadas em {BIN_FILE}")
+        text_extrair.insert(tk.END, f"✓ {pending} células gravadas em {BIN_FILE}\n")
+        if not silencioso:
+            messagebox.showinfo("Gravar binário", f"{pending} células gravadas em {BIN_FILE}.")
+    else:
+        status_var.set(f"✗ Erro ao gravar {BIN_FILE} - {pending} células continuam pendentes")
+        messagebox.showerror("Erro", 
+                            f"Erro ao gravar {BIN_FILE}.\n"
+                            f"As {pending} alterações continuam pendentes na sessão.")
+    return ok
+
+def agendar_gravacao():
+    """(Re)agenda a gravação do binário para quando não houver mesclagens por BUILD_IDLE_MS"""
+    global _build_job
+    if _build_job is not None:
+        root.after_cancel(_build_job)
+    _build_job = root.after(BUILD_IDLE_MS, lambda: gravar_binario(silencioso=True))
+    status_var.set(f"{len(SESSION.pending_cells)} células pendentes - gravação automática em "
+                   f"{BUILD_IDLE_MS // 1000}s ou em 'Gravar binário'")
+
+def mostrar_progresso():
+    """Mostra na barra de progresso as contagens do status de tradução"""
+    try:
+        progress_var.set(f"PROGRESSO: {SESSION.status().summary()}")
+    except FileNotFoundError:
+        progress_var.set(f"PROGRESSO: {BASE} ainda não existe - use 'Extrair TODAS as células'")
+    except Exception as e:
+        print(f"⚠️ Erro ao calcular o progresso: {e}")
+
+def compactar_traducoes(silencioso=False):
+    """Incorpora o diário das mesclagens ao arquivo BASE"""
+    try:
+        size = SESSION.journal_size()
+        if SESSION.compact():
+            status_var.set(f"✓ Diário ({size} bytes) incorporado ao {BASE}")
+            if not silencioso:
+                messagebox.showinfo("Compactar", f"Diário incorporado ao {BASE}.")
+        elif not silencioso:
+            messagebox.showinfo("Compactar", "Nenhuma mesclagem pendente no diário.")
+        return True
+    except Exception as e:
+        messagebox.showerror("Erro", f"Erro ao compactar {BASE}: {str(e)}\n"
+                                     f"As traduções continuam no diário {SESSION.journal_file}.")
+        return False
+
+def verificar_glossario():
+    """Lista as células traduzidas que não usam a terminologia do glossário"""
+    print("\n" + "="*60)
+    print("VERIFICANDO GLOSSÁRIO")
+    print("="*60)
+    
+    try:
+        problems = SESSION.check_glossary()
+    except FileNotFoundError:
+        messagebox.showinfo("Info", "Execute 'Extrair TODAS as células' primeiro.")
+        return None
+    if problems is None:
+        messagebox.showinfo("Glossário", f"Arquivo de glossário {GLOSSARY_FILE} não encontrado.")
+        return None
+    
+    glossary = SESSION.glossary()
+    print(f"Termos no glossário: {len(glossary)}")
+    print(f"Células fora do glossário: {len(problems)}")
+    
+    output_text = ""
+    for cell_id, block, missing in problems:
+        output_text += anotar_glossario(block, missing) + "\n\n"
+    
+    text_extrair.delete("1.0", tk.END)
+    text_extrair.insert(tk.END,
+        "EMPEROR TRANSLATOR - VERIFICAÇÃO DO GLOSSÁRIO\n"
+        "===============================================\n"
+        f"Termos no glossário: {len(glossary)}\n"
+        f"Células fora do glossário: {len(problems)}\n\n"
+    )
+    text_extrair.insert(tk.END, output_text)
+    
+    if problems:
+        pyperclip.copy(output_text)
+        messagebox.showinfo("Glossário", 
+                          f"{len(problems)} células não usam a tradução exigida pelo glossário.\n\n"
+                          f"Blocos copiados para área de transferência.")
+    else:
+        messagebox.showinfo("Glossário", "Todas as traduções seguem o glossário.")
+    return problems
+
+def ao_fechar():
+    """Grava as alterações pendentes antes de fechar a janela"""
+    if SESSION.has_pending() and not gravar_binario(silencioso=True):
+        if not messagebox.askyesno("Sair", 
+                                  "O binário não foi gravado.\n"
+                                  "Sair mesmo assim? As alterações pendentes serão perdidas."):
+            return
+    compactar_traducoes(silencioso=True)
+    root.destroy()
+
+# ---------------- UI ---------------- #
+
+def abrir_interface(session, titulo, lote=MAX, build_idle_ms=BUILD_IDLE_MS):
+    """Abre a janela do tradutor para a `session` (TranslatorSession) até ela ser fechada"""
+    global SESSION, BASE, BIN_FILE, GLOSSARY_FILE, MAX, BUILD_IDLE_MS
+    global root, text_extrair, text_mesclar, btn_colar_trad, status_var, progress_var
+    SESSION = session
+    BASE, BIN_FILE, GLOSSARY_FILE = session.base_file, session.bin_file, session.glossary_file
+    MAX, BUILD_IDLE_MS = lote, build_idle_ms
+    
+    root = tk.Tk()
+    root.title(titulo)
+    root.geometry("1200x700")
+    
+    # Frame para botões superiores
+    frame_top = tk.Frame(root)
+    frame_top.pack(fill=tk.X, padx=10, pady=5)
+    
+    # Frame para as áreas de texto
+    frame_bottom = tk.Frame(root)
+    frame_bottom.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+    
+    # Dividir frame_bottom em esquerda e direita
+    frame_left = tk.Frame(frame_bottom)
+    frame_right = tk.Frame(frame_bottom)
+    
+    frame_left.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
+    frame_right.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5)
+    
+    # Botões superiores
+    btn_frame = tk.Frame(frame_top)
+    btn_frame.pack()
+    
+    btn_extrair_todas = tk.Button(btn_frame, text="Extrair TODAS as células", 
+                                command=extrair_todas_as_celulas, bg="#4CAF50", fg="white", width=20)
+    btn_extrair_todas.pack(side=tk.LEFT, padx=5)
+    
+    btn_extrair_lote = tk.Button(btn_frame, text="Extrair para traduzir", 
+                               command=extrair_celulas_para_traducao, width=20)
+    btn_extrair_lote.pack(side=tk.LEFT, padx=5)
+    
+    btn_pesquisar = tk.Button(btn_frame, text="Pesquisar por palavra", 
+                             command=pesquisar_celulas_por_palavra, bg="#4285f4", fg="white", width=20)
+    btn_pesquisar.pack(side=tk.LEFT, padx=5)
+    
+    btn_colar_trad = tk.Button(btn_frame, text="Colar Tradução", command=colar_traducao,
+                              bg="#ff9800", fg="white", width=15, state=tk.DISABLED)
+    btn_colar_trad.pack(side=tk.LEFT, padx=5)
+    
+    btn_gravar = tk.Button(btn_frame, text="Gravar binário", command=gravar_binario,
+                          bg="#9c27b0", fg="white", width=15)
+    btn_gravar.pack(side=tk.LEFT, padx=5)
+    
+    btn_compactar = tk.Button(btn_frame, text="Compactar .txt", command=compactar_traducoes, width=15)
+    btn_compactar.pack(side=tk.LEFT, padx=5)
+    
+    btn_glossario = tk.Button(btn_frame, text="Verificar glossário", command=verificar_glossario, width=15)
+    btn_glossario.pack(side=tk.LEFT, padx=5)
+    
+    btn_preencher = tk.Button(btn_frame, text="Preencher pela memória", command=preencher_rascunhos, width=20)
+    btn_preencher.pack(side=tk.LEFT, padx=5)
+    
+    # Labels informativas
+    label_info = tk.Label(frame_top, text="Extrair TODAS → Extrair para traduzir → Copiar → Traduzir → Colar → Mesclar", 
+                         font=("Arial", 10), fg="blue")
+    label_info.pack(pady=5)
+    
+    # Área de texto da esquerda (extração)
+    label_extrair = tk.Label(frame_left, text="CÉLULAS PARA TRADUZIR / RESULTADOS DA PESQUISA:")
+    label_extrair.pack(anchor=tk.W)
+    
+    text_extrair = scrolledtext.ScrolledText(frame_left, wrap=tk.WORD, height=28)
+    text_extrair.pack(fill=tk.BOTH, expand=True)
+    
+    # Área de texto da direita (mesclagem)
+    label_mesclar = tk.Label(frame_right, text="TRADUÇÕES (cole aqui para mesclar):")
+    label_mesclar.pack(anchor=tk.W)
+    
+    text_mesclar = scrolledtext.ScrolledText(frame_right, wrap=tk.WORD, height=28)
+    text_mesclar.pack(fill=tk.BOTH, expand=True)
+    
+    # Botão de mesclagem no rodapé
+    frame_footer = tk.Frame(root)
+    frame_footer.pack(fill=tk.X, padx=10, pady=5)
+    
+    btn_mesclar = tk.Button(frame_footer, text="MESCLAR TRADUÇÕES (texto + binário)", 
+                           command=mesclar_traducao_completa, bg="#ff6b6b", fg="white", height=2)
+    btn_mesclar.pack(fill=tk.X)
+    
+    # Status bar
+    status_var = tk.StringVar()
+    status_var.set("MODO: Extração completa | Detecção inteligente de células traduzidas | MAX=300 células")
+    status_bar = tk.Label(root, textvariable=status_var, bd=1, relief=tk.SUNKEN, anchor=tk.W, fg="green")
+    status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+    
+    progress_var = tk.StringVar()
+    progress_bar = tk.Label(root, textvariable=progress_var, bd=1, relief=tk.SUNKEN, anchor=tk.W, fg="blue")
+    progress_bar.pack(side=tk.BOTTOM, fill=tk.X)
+    mostrar_progresso()
+    
+    # Verifica se o arquivo binário existe
+    if not os.path.exists(BIN_FILE):
+        status_var.set(f"AVISO: Arquivo {BIN_FILE} não encontrado! Configure o caminho correto.")
+    
+    root.protocol("WM_DELETE_WINDOW", ao_fechar)
+    
+    root.mainloop()
@@ -0,0 +1,338 @@
+"""Memória de tradução: exata (hash do original), aproximada (distância de edição) e
+compartilhada entre os assets (arquivo JSON-lines com trava)"""
+import os
+import json
+import time
+import heapq
+import hashlib
+from collections import Counter
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .registros import TranslationStatus
+from .indices import trigramas
+
+FUZZY_TOP_K = 3  # Sugestões da memória aproximada por célula extraída
+FUZZY_MIN_SIMILARITY = 0.6  # Similaridade mínima (1 - distância de edição / tamanho)
+LOCK_SUFFIX = ".lock"
+
+# ---------------- MEMÓRIA DE TRADUÇÃO ---------------- #
+
+def hash_original(texto):
+    """Hash dos bytes exatos do ORIGINAL (o mesmo da coluna original_hash do banco)"""
+    return hashlib.sha1(texto.encode('utf-8')).hexdigest()
+
+class TranslationMemory:
+    """Memória de tradução exata: hash do ORIGINAL → células com esse mesmo original
+    
+    Nomes de unidades, botões e "OK" se repetem muito; a tradução de uma célula vale
+    como rascunho para todas as outras com o mesmo original.
+    """
+    
+    def __init__(self):
+        self.groups = {}   # hash → [cell_id] em ordem
+        self.hash_of = {}  # cell_id → hash
+    
+    @classmethod
+    def from_store(cls, store):
+        memory = cls()
+        for cell_id in sorted(store.index):
+            record = store.get(cell_id)
+            if record is not None:
+                memory.add(cell_id, record['original'])
+        return memory
+    
+    def add(self, cell_id, original):
+        """Registra o original da célula (células sem ORIGINAL ficam fora da memória)"""
+        if not original:
+            return
+        key = hash_original(original)
+        self.hash_of[cell_id] = key
+        self.groups.setdefault(key, []).append(cell_id)
+    
+    def duplicates(self, cell_id):
+        """Outras células com exatamente o mesmo original"""
+        key = self.hash_of.get(cell_id)
+        if key is None:
+            return []
+        return [other for other in self.groups[key] if other != cell_id]
+    
+    def propagate(self, status, updates):
+        """{cell_id: tradução} de rascunho para as duplicatas ainda não traduzidas das células em `updates`"""
+        drafts = {}
+        for cell_id, text in updates.items():
+            if not text:
+                continue
+            for other in self.duplicates(cell_id):
+                if other not in updates and other not in drafts and status.get(other) == TranslationStatus.NAO_TRADUZIDA:
+                    drafts[other] = text
+        return drafts
+    
+    def known_translation(self, store, status, cell_id):
+        """Tradução já existente para o original da célula (validada primeiro), ou None"""
+        found = None
+        for other in self.duplicates(cell_id):
+            state = status.get(other)
+            if state in (TranslationStatus.VALIDADA, TranslationStatus.NO_BINARIO):
+                return store.get(other)['translation']
+            if state == TranslationStatus.RASCUNHO and found is None:
+                found = store.get(other)['translation']
+        return found
+
+def distancia_edicao(a, b):
+    """Distância de Levenshtein entre a e b (bit-paralelo de Myers/Hyyrö)
+    
+    Cada coluna da matriz de edição vira um inteiro de len(a) bits, então o custo é
+    proporcional a len(b) operações com inteiros, e não a len(a) * len(b).
+    """
+    if not a:
+        return len(b)
+    if not b:
+        return len(a)
+    
+    peq = {}
+    for i, c in enumerate(a):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    mask = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    pv = mask
+    mv = 0
+    score = len(a)
+    for c in b:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return score
+
+class FuzzyMemory:
+    """Memória de tradução aproximada: originais já traduzidos indexados por trigramas
+    
+    Para "Build %d farms" acha "Build %d houses" e a tradução dele. Os trigramas em
+    comum escolhem poucas candidatas e só elas passam pela distância de edição.
+    """
+    
+    MAX_CANDIDATES = 8       # Candidatas (por trigramas) que passam pela similaridade completa
+    MAX_QUERY_GRAMS = 24     # Só os trigramas mais raros da consulta contam os votos
+    COMMON_GRAM = 0.05       # Trigramas em mais que 5% dos originais não votam (custo limitado)
+    MAX_EDIT_LENGTH = 500    # Acima disso a similaridade é o Dice dos trigramas
+    
+    def __init__(self):
+        self.entries = []    # [original, tradução, cell_id, nº de trigramas]
+        self.by_original = {}  # original → posição em entries
+        self.postings = {}   # trigrama → [posição em entries]
+    
+    @staticmethod
+    def grams(text):
+        return trigramas(f" {text} ")
+    
+    @classmethod
+    def from_store(cls, store):
+        memory = cls()
+        for cell_id in sorted(store.index):
+            record = store.get(cell_id)
+            if record is not None and record['translation']:
+                memory.add(cell_id, record['original'], record['translation'])
+        return memory
+    
+    def add(self, cell_id, original, translation):
+        """Acrescenta (ou atualiza a tradução de) um original traduzido"""
+        if not original or not translation:
+            return
+        pos = self.by_original.get(original)
+        if pos is not None:
+            self.entries[pos][1] = translation
+            self.entries[pos][2] = cell_id
+            return
+        
+        grams = self.grams(original)
+        pos = len(self.entries)
+        self.entries.append([original, translation, cell_id, len(grams)])
+        self.by_original[original] = pos
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(pos)
+    
+    def similarity(self, a, b, grams_a):
+        """1 - distância de edição / tamanho (Dice dos trigramas para textos longos)"""
+        longest = max(len(a), len(b))
+        if longest > self.MAX_EDIT_LENGTH:
+            grams_b = self.grams(b)
+            return 2.0 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+        return 1.0 - distancia_edicao(a, b) / longest
+    
+    def suggest(self, original, k=None):
+        """Até k (similaridade, original, tradução, cell_id), da mais parecida para a menos"""
+        k = k or FUZZY_TOP_K
+        if not original or not self.entries:
+            return []
+        
+        # Votos só dos trigramas mais raros: custo limitado mesmo para textos longos
+        grams = self.grams(original)
+        common = max(50, int(len(self.entries) * self.COMMON_GRAM))
+        rare = [positions for positions in map(self.postings.get, grams)
+                if positions and len(positions) <= common]
+        rare = heapq.nsmallest(self.MAX_QUERY_GRAMS, rare, key=len)
+        if not rare:
+            return []
+        
+        votes = Counter()
+        for positions in rare:
+            votes.update(positions)
+        
+        # Dice estimado escolhe as candidatas; poucos votos ou tamanhos muito diferentes ficam de fora
+        min_votes = len(rare) * FUZZY_MIN_SIMILARITY / 2
+        scale = len(grams) / len(rare)
+        size = len(original)
+        entries = self.entries
+        estimates = []
+        for pos, count in [item for item in votes.items() if item[1] >= min_votes]:
+            entry = entries[pos]
+            entry_size = len(entry[0])
+            if min(size, entry_size) < FUZZY_MIN_SIMILARITY * max(size, entry_size):
+                continue
+            estimates.append((count * scale / (len(grams) + entry[3]), pos))
+        
+        results = []
+        for estimate, pos in heapq.nlargest(self.MAX_CANDIDATES, estimates):
+            entry_original, translation, cell_id, entry_grams = entries[pos]
+            if entry_original == original:
+                continue  # Original idêntico: é a memória exata que cuida
+            score = self.similarity(original, entry_original, grams)
+            if score >= FUZZY_MIN_SIMILARITY:
+                results.append((score, entry_original, translation, cell_id))
+        results.sort(key=lambda item: (-item[0], item[3]))
+        return results[:k]
+
+# ---------------- MEMÓRIA COMPARTILHADA ---------------- #
+
+class FileLock:
+    """Trava exclusiva entre processos num arquivo .lock (fcntl no Linux/Mac, msvcrt no Windows)"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.handle = None
+    
+    def __enter__(self):
+        self.handle = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX)
+        else:
+            self.handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self.handle.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.05)
+        return self
+    
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+        else:
+            self.handle.seek(0)
+            msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+        self.handle.close()
+        self.handle = None
+
+class SharedMemory:
+    """Memória de tradução compartilhada entre os arquivos do jogo (Text, MM, Eventmsg...)
+    
+    O arquivo é JSON lines só de acréscimo: {"asset", "cell", "original", "translation"}.
+    Qualquer ferramenta lê e grava segurando a trava `arquivo.lock`; cada uma lê só o
+    que foi acrescentado desde a última vez. Esta instância indexa apenas as entradas dos
+    outros assets (as do próprio asset já estão no BASE).
+    """
+    
+    def __init__(self, path, asset):
+        self.path = path
+        self.asset = asset
+        self.lock_path = path + LOCK_SUFFIX
+        self.offset = 0        # Bytes do arquivo já lidos
+        self.own_entries = 0   # Entradas deste asset no arquivo
+        self.exact = {}        # hash do original → (tradução, (asset, cell_id))
+        self.fuzzy = FuzzyMemory()
+    
+    def _read_new(self):
+        """Lê as linhas acrescentadas desde a última leitura (com a trava segura)"""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size <= self.offset:
+            return
+        
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1  # Só linhas completas
+        self.offset += end
+        
+        for line in data[:end].decode("utf-8").splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get('asset') == self.asset:
+                self.own_entries += 1
+                continue
+            original = entry.get('original')
+            translation = entry.get('translation')
+            if original and translation:
+                key = (entry.get('asset'), entry.get('cell'))
+                self.exact[hash_original(original)] = (translation, key)
+                self.fuzzy.add(key, original, translation)
+    
+    def refresh(self):
+        """Traz as traduções gravadas pelas outras ferramentas (só trava se o arquivo cresceu)"""
+        try:
+            if os.path.getsize(self.path) <= self.offset:
+                return
+        except OSError:
+            return
+        with FileLock(self.lock_path):
+            self._read_new()
+    
+    def record(self, entries):
+        """Acrescenta [(cell_id, original, tradução)] deste asset (um fsync por chamada)"""
+        if not entries:
+            return
+        with FileLock(self.lock_path):
+            self._read_new()
+            with open(self.path, "a", encoding="utf-8") as f:
+                for cell_id, original, translation in entries:
+                    entry = {'asset': self.asset, 'cell': cell_id, 'original': original, 'translation': translation}
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.offset = os.path.getsize(self.path)
+        self.own_entries += len(entries)
+    
+    def lookup(self, original, refresh=True):
+        """(tradução, (asset, cell_id)) de outro asset com exatamente esse original, ou None
+        
+        Com `refresh` falso usa só o que já foi lido (quem consulta muitas células chama
+        refresh() uma vez antes).
+        """
+        if not original:
+            return None
+        if refresh:
+            self.refresh()
+        return self.exact.get(hash_original(original))
+    
+    def suggest(self, original, k=None):
+        """Sugestões aproximadas vindas dos outros assets (FuzzyMemory.suggest)"""
+        self.refresh()
+        return self.fuzzy.suggest(original, k)
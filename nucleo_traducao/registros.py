@@ -0,0 +1,338 @@
+"""Formato _TRADUZIR.txt: leitor de blocos, TranslationStore e TranslationStatus"""
+import re
+import pickle
+
+from .binario import CACHE_VERSION, CACHE_ERRORS
+
+OFFSET_RE = re.compile(r"OFFSET:\s*(0x[0-9A-Fa-f]+)")
+# Só o espaço após "chars]:" é separador: espaços no início do original fazem parte do texto
+ORIG_RE = re.compile(r"ORIGINAL\s*\[(\d+)\s*chars\]: ?(.*)")
+CELL_ID_RE = re.compile(r"CELULA:\s*(\d+)\s*(.*)")  # cell_id e o resto da linha (GRUPO/REFERÊNCIAS)
+
+# ---------------- LEITOR DO FORMATO _TRADUZIR ---------------- #
+
+def classificar_linha(line):
+    """Tipo de uma linha do formato _TRADUZIR e o valor extraído dela
+    
+    'OFFSET'   → offset (int)
+    'CELULA'   → (cell_id, resto da linha: GRUPO/REFERÊNCIAS)
+    'ORIGINAL' → (N chars, texto original)
+    'TRADUCAO' → None (a tradução é a linha seguinte)
+    'TEXTO'    → linha sem marcador (tradução, comentário...)
+    'VAZIA'    → linha em branco (fim do bloco)
+    """
+    stripped = line.strip()
+    if not stripped:
+        return 'VAZIA', None
+    
+    if stripped.startswith("OFFSET:"):
+        match = OFFSET_RE.match(stripped)
+        return 'OFFSET', int(match.group(1), 16) if match else None
+    
+    if stripped.startswith("CELULA:"):
+        match = CELL_ID_RE.match(stripped)
+        if match:
+            return 'CELULA', (int(match.group(1)), match.group(2))
+        return 'CELULA', (None, stripped[len("CELULA:"):].strip())
+    
+    if "ORIGINAL [" in stripped and "chars]:" in stripped:
+        # Sem rstrip: espaços no fim do texto original fazem parte dele
+        match = ORIG_RE.match(line.lstrip())
+        if match:
+            return 'ORIGINAL', (int(match.group(1)), match.group(2))
+    
+    if "TRADUÇÃO:" in stripped:
+        return 'TRADUCAO', None
+    
+    return 'TEXTO', stripped
+
+def tokenizar_linhas(lines):
+    """Gera (tipo, valor, número_da_linha, linha) para cada linha (aceita um arquivo aberto)"""
+    for line_num, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        kind, value = classificar_linha(line)
+        yield kind, value, line_num, line
+
+def ler_registros(lines):
+    """Agrupa as linhas em registros de célula, um bloco por vez (memória constante)
+    
+    Cada registro é um dict com offset, cell_id, refs, original_length, original,
+    translation, line (número da linha do OFFSET) e block (texto do bloco, sem as
+    linhas em branco das pontas). Linhas fora de um bloco OFFSET: são ignoradas.
+    """
+    record = None
+    block_lines = []
+    after_traducao = False
+    
+    for kind, value, line_num, line in tokenizar_linhas(lines):
+        if kind == 'OFFSET':
+            if record is not None:
+                record['block'] = '\n'.join(block_lines).strip()
+                yield record
+            record = {
+                'offset': value,
+                'cell_id': None,
+                'refs': None,
+                'original_length': None,
+                'original': None,
+                'translation': '',
+                'line': line_num,
+                'block': ''
+            }
+            block_lines = [line]
+            after_traducao = False
+            continue
+        
+        if record is None:
+            continue
+        
+        if kind == 'VAZIA':
+            # Linha em branco fecha o bloco
+            record['block'] = '\n'.join(block_lines).strip()
+            yield record
+            record = None
+            continue
+        
+        block_lines.append(line)
+        
+        if after_traducao:
+            after_traducao = False
+            if kind == 'TEXTO' and not record['translation']:
+                record['translation'] = value
+            continue
+        
+        if kind == 'CELULA' and record['cell_id'] is None:
+            record['cell_id'], record['refs'] = value
+        elif kind == 'ORIGINAL' and record['original'] is None:
+            record['original_length'], record['original'] = value
+        elif kind == 'TRADUCAO':
+            after_traducao = True
+    
+    if record is not None:
+        record['block'] = '\n'.join(block_lines).strip()
+        yield record
+
+def formatar_bloco(record):
+    """Bloco no formato _TRADUZIR (sem a linha em branco final)"""
+    original = record['original']
+    length = record['original_length']
+    if length is None:
+        length = len(original)
+    offset = record['offset']
+    block = (
+        f"OFFSET: 0x{offset if offset is not None else 0:08X}\n"
+        f"CELULA: {record['cell_id']}  {record['refs'] or ''}".rstrip() + "\n"
+        f"ORIGINAL [{length} chars]: {original}\n"
+        f"TRADUÇÃO:"
+    )
+    if record['translation']:
+        block += f"\n{record['translation']}"
+    return block
+
+# ---------------- ARQUIVO DE TRADUÇÃO ---------------- #
+
+class TranslationStore:
+    """Arquivo BASE (_TRADUZIR.txt) em memória, indexado por cell_id
+    
+    O conteúdo é guardado como a lista de blocos separados por linha em branco, exatamente
+    como estão no arquivo: só os blocos alterados são remontados e serialize() junta tudo
+    de volta em uma passada.
+    """
+    
+    def __init__(self, content=""):
+        self.blocks = content.split("\n\n")
+        self.index = {}  # cell_id → posição do bloco em self.blocks
+        
+        for pos, block in enumerate(self.blocks):
+            if not block.lstrip().startswith("OFFSET:"):
+                continue
+            match = CELL_ID_RE.search(block)
+            if match:
+                # Como o content.find() antigo: vale o primeiro bloco da célula
+                self.index.setdefault(int(match.group(1)), pos)
+    
+    def __len__(self):
+        return len(self.index)
+    
+    def __contains__(self, cell_id):
+        return cell_id in self.index
+    
+    @staticmethod
+    def _is_translation_line(line):
+        """Linha logo após TRADUÇÃO: que contém uma tradução (e não o início de outro campo)"""
+        return classificar_linha(line)[0] == 'TEXTO'
+    
+    def get(self, cell_id):
+        """Registro da célula (offset, refs, original, tradução...) ou None"""
+        pos = self.index.get(cell_id)
+        if pos is None:
+            return None
+        return next(ler_registros(self.blocks[pos].strip().split('\n')), None)
+    
+    def set_translation(self, cell_id, traducao):
+        """Grava a tradução no bloco da célula
+        
+        Retorna a tradução anterior ('' se não havia) ou None se a célula não está no arquivo.
+        """
+        pos = self.index.get(cell_id)
+        if pos is None:
+            return None
+        
+        lines = self.blocks[pos].split('\n')
+        previous = ''
+        
+        for k, line in enumerate(lines):
+            if "TRADUÇÃO:" in line:
+                if k + 1 < len(lines) and self._is_translation_line(lines[k + 1]):
+                    # Já existe uma tradução na próxima linha: substitui
+                    previous = lines[k + 1].strip()
+                    lines[k + 1] = traducao
+                else:
+                    lines.insert(k + 1, traducao)
+                break
+        else:
+            # Sem linha TRADUÇÃO: (caso raro) - adiciona após ORIGINAL
+            for k, line in enumerate(lines):
+                if "ORIGINAL [" in line:
+                    lines[k + 1:k + 1] = ["TRADUÇÃO:", traducao]
+                    break
+        
+        self.blocks[pos] = '\n'.join(lines)
+        return previous
+    
+    def block_of(self, cell_id):
+        """Texto do bloco da célula, como está no arquivo"""
+        return self.blocks[self.index[cell_id]]
+    
+    def replace_block(self, cell_id, block):
+        """Substitui o bloco da célula (usado ao reaplicar o diário); False se a célula não existe"""
+        pos = self.index.get(cell_id)
+        if pos is None:
+            return False
+        self.blocks[pos] = block
+        return True
+    
+    def serialize(self):
+        """Conteúdo completo do arquivo BASE"""
+        return "\n\n".join(self.blocks)
+
+class TranslationStatus:
+    """Estado de tradução de cada célula (um byte por cell_id) com contadores por estado
+    
+    Mantido pela sessão a cada mesclagem/gravação, então o próximo lote e o progresso
+    saem sem reler o arquivo BASE.
+    """
+    
+    NAO_TRADUZIDA = 0
+    RASCUNHO = 1     # Tradução no BASE, ainda não validada nesta base de status
+    VALIDADA = 2     # Mesclada com o original validado
+    NO_BINARIO = 3   # Gravada no .eng
+    AUSENTE = 255    # cell_id sem bloco no BASE
+    
+    NAMES = {NAO_TRADUZIDA: "não traduzida", RASCUNHO: "rascunho", VALIDADA: "validada", NO_BINARIO: "no binário"}
+    
+    def __init__(self, size=0):
+        self.states = bytearray([self.AUSENTE]) * size  # states[cell_id - 1]
+        self.counts = [0, 0, 0, 0]
+    
+    @classmethod
+    def from_store(cls, store, previous=None):
+        """Monta o status a partir do TranslationStore
+        
+        Célula com tradução vira rascunho, a não ser que o status anterior (`previous`)
+        já a tivesse como validada ou gravada no binário.
+        """
+        status = cls(max(store.index, default=0))
+        for cell_id in store.index:
+            record = store.get(cell_id)
+            if not (record and record['translation']):
+                status.set(cell_id, cls.NAO_TRADUZIDA)
+            elif previous is not None and previous.get(cell_id) in (cls.VALIDADA, cls.NO_BINARIO):
+                status.set(cell_id, previous.get(cell_id))
+            else:
+                status.set(cell_id, cls.RASCUNHO)
+        return status
+    
+    def __len__(self):
+        return sum(self.counts)
+    
+    def get(self, cell_id):
+        if 1 <= cell_id <= len(self.states):
+            return self.states[cell_id - 1]
+        return self.AUSENTE
+    
+    def set(self, cell_id, state):
+        if cell_id < 1:
+            return
+        if cell_id > len(self.states):
+            self.states.extend([self.AUSENTE] * (cell_id - len(self.states)))
+        old = self.states[cell_id - 1]
+        if old != self.AUSENTE:
+            self.counts[old] -= 1
+        self.states[cell_id - 1] = state
+        if state != self.AUSENTE:
+            self.counts[state] += 1
+    
+    def translated_count(self):
+        return self.counts[self.RASCUNHO] + self.counts[self.VALIDADA] + self.counts[self.NO_BINARIO]
+    
+    def next_batch(self, limit, state=NAO_TRADUZIDA, accept=None):
+        """Os `limit` menores cell_ids no estado (bytearray.find: proporcional ao lote)
+        
+        `accept(cell_id)` falso pula a célula sem contar no lote.
+        """
+        cell_ids = []
+        pos = self.states.find(state)
+        while pos != -1 and len(cell_ids) < limit:
+            if accept is None or accept(pos + 1):
+                cell_ids.append(pos + 1)
+            pos = self.states.find(state, pos + 1)
+        return cell_ids
+    
+    def summary(self):
+        return (f"{self.translated_count()}/{len(self)} traduzidas | "
+                f"{self.counts[self.VALIDADA]} validadas | "
+                f"{self.counts[self.NO_BINARIO]} no binário | "
+                f"{self.counts[self.NAO_TRADUZIDA]} restantes")
+    
+    def save(self, path, stamp):
+        with open(path, 'wb') as f:
+            pickle.dump({'version': CACHE_VERSION, 'stamp': stamp, 'states': bytes(self.states)},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load(cls, path):
+        """(carimbo, status) salvos em `path`, ou (None, None)"""
+        try:
+            with open(path, 'rb') as f:
+                saved = pickle.load(f)
+            if not isinstance(saved, dict) or saved.get('version') != CACHE_VERSION:
+                return None, None
+            stamp, states = saved['stamp'], saved['states']
+            status = cls()
+            for cell_id, state in enumerate(states, 1):
+                status.set(cell_id, state)
+        except CACHE_ERRORS:
+            return None, None
+        return stamp, status
+
+def anotar_bloco(block, notes):
+    """Insere linhas de aviso no bloco, antes da linha TRADUÇÃO:
+    
+    Linhas entre o ORIGINAL e a TRADUÇÃO são ignoradas pela mesclagem.
+    """
+    if not notes:
+        return block
+    lines = block.split("\n")
+    for i, line in enumerate(lines):
+        if classificar_linha(line)[0] == 'TRADUCAO':
+            return "\n".join(lines[:i] + notes + lines[i:])
+    return "\n".join(lines + notes)
+
+def anotar_sugestoes(block, suggestions):
+    """Insere as sugestões da memória aproximada (linhas SUGESTÃO) no bloco"""
+    hints = []
+    for score, original, translation, key in suggestions:
+        origem = f" {key[0]}" if isinstance(key, tuple) else ""  # Vinda de outro asset
+        hints.append(f"SUGESTÃO {score:.0%}{origem} [{original}]: {translation}")
+    return anotar_bloco(block, hints)
@@ -0,0 +1,817 @@
+"""Sessão de tradução: binário parseado, _TRADUZIR + diário, status, memória e índices"""
+import os
+import json
+import datetime
+
+from .binario import descrever_analise
+from .registros import (CELL_ID_RE, ler_registros, formatar_bloco, TranslationStore, TranslationStatus,
+                        anotar_sugestoes)
+from .memoria import FUZZY_TOP_K, TranslationMemory, FuzzyMemory, SharedMemory
+from .indices import WordIndex, TrigramIndex
+from .glossario import Glossary, descrever_termos
+from .validacao import validar_codigos
+from .banco import TranslationDB
+
+JOURNAL_SUFFIX = ".journal"  # Diário das mesclagens ao lado do BASE
+JOURNAL_COMPACT_BYTES = 256 * 1024  # Acima disso o diário é incorporado ao BASE
+STATUS_SUFFIX = ".status"  # Status de tradução por célula, ao lado do BASE
+
+# ---------------- SESSÃO ---------------- #
+
+def abrir_banco(db_file):
+    """Abre o banco SQLite opcional (TranslationDB); None se indisponível"""
+    try:
+        return TranslationDB(db_file)
+    except Exception as e:
+        print(f"⚠️ Banco SQLite {db_file} indisponível, usando só o arquivo de texto: {e}")
+        return None
+
+class TranslatorSession:
+    """Mantém o binário parseado e o arquivo BASE em memória enquanto a interface está aberta.
+    
+    As mesclagens só alteram a sessão; o .eng é gravado em build() (botão "Gravar binário",
+    após BUILD_IDLE_MS sem novas mesclagens ou ao fechar a janela).
+    
+    As traduções mescladas não regravam o BASE: os blocos alterados são acrescentados ao
+    diário (BASE + JOURNAL_SUFFIX, uma linha JSON por célula) e compact() os incorpora ao
+    BASE quando o diário passa de JOURNAL_COMPACT_BYTES, no botão "Compactar" ou ao fechar.
+    
+    Com db_file, o banco SQLite acompanha as mesclagens e atende lote e pesquisa por índice.
+    
+    `file_class` é o ZeusTextFile do formato (emperor_text.ZeusTextFile ou emperor_mm.ZeusTextFile).
+    """
+    
+    def __init__(self, file_class, bin_file, base_file, db_file=None, asset=None, shared_file=None, glossary_file=None):
+        self.file_class = file_class
+        self.bin_file = bin_file
+        self.base_file = base_file
+        self.journal_file = base_file + JOURNAL_SUFFIX
+        self.status_file = base_file + STATUS_SUFFIX
+        self._status = None
+        self._status_source = None
+        self._word_index = None
+        self._index_store = None  # Store a partir do qual o índice de palavras foi montado
+        self._trigram_index = None
+        self._trigram_store = None
+        self._memory = None
+        self._memory_store = None
+        self._fuzzy = None
+        self._fuzzy_store = None
+        self.db_file = db_file
+        self.asset = asset
+        self.db = None
+        self.shared_file = shared_file
+        self.shared = None
+        self.glossary_file = glossary_file
+        self._glossary = None
+        self._glossary_stamp = None
+        self.zeus_file = None
+        self.content = None
+        self._store = None        # TranslationStore do conteúdo atual do BASE
+        self._store_source = None
+        self._journal_offset = 0    # Bytes do diário já reaplicados no store
+        self._journal_seen = None   # (tamanho, mtime) do diário na última leitura
+        self.pending_cells = set()  # Células alteradas na memória e ainda não gravadas no .eng
+        self._bin_stamp = None
+        self._base_stamp = None
+    
+    @staticmethod
+    def _stamp(path):
+        st = os.stat(path)
+        return (st.st_size, st.st_mtime_ns)
+    
+    def binary(self):
+        """ZeusTextFile da sessão (recarrega se o .eng mudou no disco e não há alterações pendentes)"""
+        stamp = self._stamp(self.bin_file)
+        if self.zeus_file is None or (stamp != self._bin_stamp and not self.pending_cells):
+            zeus_file = self.file_class(self.bin_file)
+            zeus_file.load()
+            self.zeus_file = zeus_file
+            self._bin_stamp = stamp
+        elif stamp != self._bin_stamp:
+            print(f"⚠️ {self.bin_file} mudou no disco, mas há {len(self.pending_cells)} células pendentes na sessão - mantendo a versão da memória")
+        return self.zeus_file
+    
+    def create_base(self):
+        """Cria o arquivo BASE (só o cabeçalho) se ele não existir; retorna True se criou"""
+        if os.path.exists(self.base_file):
+            return False
+        with open(self.base_file, "w", encoding="utf-8") as f:
+            f.write(f"# Arquivo de tradução {self.file_class.BASE_TITLE}\n")
+            f.write(f"# Criado em: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"# Formato:\n")
+            f.write(f"# OFFSET: 0xXXXXXXX\n")
+            f.write(f"# CELULA: X  GRUPO: Y\n")
+            f.write(f"# ORIGINAL [N chars]: texto original\n")
+            f.write(f"# TRADUÇÃO:\n")
+            f.write(f"# texto traduzido\n\n")
+        print(f"Arquivo {self.base_file} criado com sucesso!")
+        return True
+    
+    def add_missing_cells(self):
+        """Acrescenta ao BASE as células do binário que ainda não estão nele
+        
+        Retorna (células no binário, células que já estavam no BASE, células acrescentadas).
+        Só lê o binário: nenhuma tradução é preenchida aqui (ver fill_from_memory).
+        """
+        print("\n" + "="*60)
+        print("EXTRAINDO TODAS AS CÉLULAS")
+        print("="*60)
+        
+        # Carrega o arquivo binário (mapeado: só os textos extraídos são materializados)
+        zeus_file = self.file_class(self.bin_file)
+        try:
+            zeus_file.load(use_mmap=True)
+            self.create_base()
+            
+            try:
+                existing_content = self.read_base()
+            except FileNotFoundError:
+                existing_content = ""
+            existing_cell_ids = {int(match.group(1)) for match in CELL_ID_RE.finditer(existing_content)}
+            total_cells = len(zeus_file.strings)
+            
+            print(f"Células no arquivo binário: {total_cells}")
+            print(f"Células já no arquivo .txt: {len(existing_cell_ids)}")
+            
+            missing = [index for index in range(total_cells) if index + 1 not in existing_cell_ids]
+            print(f"Células para extrair: {len(missing)}")
+            
+            blocks = [formatar_bloco(record) + "\n\n" for record in zeus_file.base_records(missing)]
+        finally:
+            # Os blocos já têm todo o texto necessário (ou deu erro); libera o mapeamento do binário
+            zeus_file.close()
+        
+        if blocks:
+            with open(self.base_file, "a", encoding="utf-8") as f:
+                f.writelines(blocks)
+            print(f"Adicionadas {len(blocks)} novas células ao arquivo {self.base_file}")
+        
+        return total_cells, len(existing_cell_ids), len(blocks)
+    
+    def read_base(self):
+        """Conteúdo do arquivo BASE (relido só se o arquivo mudou no disco)"""
+        stamp = self._stamp(self.base_file)
+        if self.content is None or stamp != self._base_stamp:
+            with open(self.base_file, "r", encoding="utf-8") as f:
+                self.content = f.read()
+            self._base_stamp = stamp
+        return self.content
+    
+    def translations(self):
+        """TranslationStore do BASE + diário
+        
+        O BASE só é reparseado quando muda no disco; se só o diário cresceu (mesclagem
+        feita por outro processo, como a linha de comando), reaplica apenas o trecho novo.
+        """
+        content = self.read_base()
+        if self._store is None or self._store_source is not content:
+            store = TranslationStore(content)
+            self._journal_offset = 0
+            self._replay_journal(store)
+            self._store = store
+            self._store_source = content
+        elif self._journal_stamp() != self._journal_seen:
+            stamp = self._journal_stamp()
+            if stamp is None or stamp[0] < self._journal_offset:
+                # Diário apagado ou reescrito por fora: reparseia tudo
+                self._store = None
+                return self.translations()
+            changed = self._replay_journal(self._store)
+            self._index_translations(self._store, changed)
+        return self._store
+    
+    def _journal_stamp(self):
+        try:
+            return self._stamp(self.journal_file)
+        except OSError:
+            return None
+    
+    def _replay_journal(self, store):
+        """Reaplica no store o diário a partir de _journal_offset; retorna {cell_id: tradução} alteradas"""
+        self._journal_seen = self._journal_stamp()
+        entries, self._journal_offset = self._read_journal(self._journal_offset)
+        changed = {}
+        for cell_id, block in entries.items():
+            if store.replace_block(cell_id, block):
+                record = store.get(cell_id)
+                if record is not None:
+                    changed[cell_id] = record['translation']
+        if changed:
+            print(f"Diário {self.journal_file}: {len(changed)} células reaplicadas")
+        return changed
+    
+    def _read_journal(self, offset):
+        """({cell_id: bloco} das linhas completas do diário a partir de `offset`, novo offset)
+        
+        A última entrada de cada célula vale; uma linha ainda sem o fim (gravação em
+        andamento ou interrompida) fica para a próxima leitura.
+        """
+        try:
+            with open(self.journal_file, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return {}, 0
+        end = data.rfind(b"\n") + 1
+        entries = {}
+        for line in data[:end].decode("utf-8").splitlines():
+            try:
+                entry = json.loads(line)
+                entries[int(entry['cell'])] = entry['block']
+            except (ValueError, KeyError, TypeError):
+                continue
+        return entries, offset + end
+    
+    def journal_entries(self):
+        """{cell_id: bloco} do diário inteiro (a última entrada de cada célula vale)"""
+        return self._read_journal(0)[0]
+    
+    def _status_stamp(self):
+        """Identifica o conteúdo do BASE + diário ao qual o status salvo corresponde"""
+        return self._stamp(self.base_file) + (self.journal_size(),)
+    
+    def status(self):
+        """TranslationStatus do BASE (do arquivo .status se ainda vale, senão remontado do store)"""
+        stamp = self._status_stamp()
+        if self._status is None or self._status_source != stamp:
+            saved_stamp, status = TranslationStatus.load(self.status_file)
+            if status is None or saved_stamp != stamp:
+                # O BASE mudou por fora: remonta, mantendo o que já estava validado/no binário
+                status = TranslationStatus.from_store(self.translations(), previous=self._status or status)
+                print(f"Status de tradução remontado: {status.summary()}")
+            self._status = status
+            self._status_source = stamp
+            self._save_status()
+        return self._status
+    
+    def _save_status(self):
+        try:
+            self._status_source = self._status_stamp()
+            self._status.save(self.status_file, self._status_source)
+        except Exception as e:
+            print(f"⚠️ Não foi possível gravar o status {self.status_file}: {e}")
+    
+    def journal_size(self):
+        try:
+            return os.path.getsize(self.journal_file)
+        except OSError:
+            return 0
+    
+    def iter_records(self):
+        """Registros do BASE em streaming, já com as traduções que estão no diário"""
+        overlay = self.journal_entries()
+        with open(self.base_file, "r", encoding="utf-8") as f:
+            for record in ler_registros(f):
+                block = overlay.get(record['cell_id'])
+                if block is not None:
+                    record = next(ler_registros(block.split('\n')), record)
+                yield record
+    
+    def database(self):
+        """Banco SQLite da sessão (None sem DB_FILE); na primeira vez importa o BASE + diário"""
+        if self.db is None and self.db_file:
+            self.db = abrir_banco(self.db_file)
+            if self.db is not None and not self.db.has_asset(self.asset):
+                content = self.read_base()
+                header = content.split("\n\n", 1)[0] + "\n\n" if content.startswith("#") else ""
+                count = self.db.import_records(self.asset, self.iter_records(), header=header)
+                print(f"✓ {count} células de {self.base_file} importadas no banco {self.db_file}")
+        return self.db
+    
+    def untranslated_batch(self, limit):
+        """(total, traduzidas, não traduzidas, [(cell_id, bloco)] das `limit` primeiras não traduzidas)"""
+        db = self.database()
+        if db is not None:
+            total, translated = db.stats(self.asset).get(self.asset, (0, 0))
+            selected = [(r['cell_id'], r['block']) for r in db.untranslated(self.asset, limit, distinct=True)]
+            return total, translated, total - translated, selected
+        
+        # Pelo status de tradução: custo proporcional ao lote; originais repetidos vão uma vez só
+        status = self.status()
+        store = self.translations()
+        memory = self.memory()
+        seen = set()
+        
+        def first_of_original(cell_id):
+            key = memory.hash_of.get(cell_id)
+            if key is None:
+                return True  # Sem ORIGINAL: não se agrupa com nenhuma outra
+            if key in seen:
+                return False
+            seen.add(key)
+            return True
+        
+        cell_ids = status.next_batch(limit, accept=first_of_original)
+        selected = [(cell_id, store.block_of(cell_id).strip()) for cell_id in cell_ids]
+        return len(status), status.translated_count(), status.counts[status.NAO_TRADUZIDA], selected
+    
+    def batch_text(self, selected_blocks):
+        """Texto do lote para o tradutor, com as sugestões da memória aproximada em cada bloco"""
+        output_text = ""
+        hinted = 0
+        for cell_id, block in selected_blocks:
+            suggestions = self.suggestions(cell_id)
+            if suggestions:
+                hinted += 1
+            output_text += anotar_sugestoes(block, suggestions) + "\n\n"
+        if hinted:
+            print(f"Células com sugestões da memória de tradução: {hinted}")
+        return output_text
+    
+    def memory(self):
+        """TranslationMemory das células do BASE + diário (os originais não mudam na mesclagem)"""
+        store = self.translations()
+        if self._memory is None or self._memory_store is not store:
+            self._memory = TranslationMemory.from_store(store)
+            self._memory_store = store
+        return self._memory
+    
+    def fuzzy_memory(self):
+        """FuzzyMemory das células traduzidas do BASE + diário"""
+        store = self.translations()
+        if self._fuzzy is None or self._fuzzy_store is not store:
+            self._fuzzy = FuzzyMemory.from_store(store)
+            self._fuzzy_store = store
+        return self._fuzzy
+    
+    def suggestions(self, cell_id, k=None):
+        """Traduções parecidas já feitas para o original da célula, neste e nos outros assets"""
+        k = k or FUZZY_TOP_K
+        record = self.translations().get(cell_id)
+        if record is None:
+            return []
+        results = self.fuzzy_memory().suggest(record['original'], k)
+        shared = self.shared_memory()
+        if shared is not None:
+            seen = {original for score, original, translation, key in results}
+            results += [item for item in shared.suggest(record['original'], k) if item[1] not in seen]
+            results.sort(key=lambda item: -item[0])
+        return results[:k]
+    
+    def shared_memory(self):
+        """SharedMemory aberta na primeira chamada (semeada com as traduções deste asset)"""
+        if self.shared_file is None:
+            return None
+        if self.shared is None:
+            shared = SharedMemory(self.shared_file, self.asset)
+            try:
+                shared.refresh()
+                if shared.own_entries == 0:
+                    store = self.translations()
+                    entries = []
+                    for cell_id in sorted(store.index):
+                        record = store.get(cell_id)
+                        if record is not None and record['original'] and record['translation']:
+                            entries.append((cell_id, record['original'], record['translation']))
+                    shared.record(entries)
+                    print(f"✓ {len(entries)} traduções de {self.asset} na memória compartilhada {self.shared_file}")
+            except Exception as e:
+                print(f"⚠️ Memória compartilhada {self.shared_file} indisponível: {e}")
+                self.shared_file = None
+                return None
+            self.shared = shared
+        return self.shared
+    
+    def glossary(self):
+        """Glossary do arquivo de glossário (recarregado se ele mudar), ou None se não houver"""
+        if self.glossary_file is None or not os.path.exists(self.glossary_file):
+            return None
+        stamp = self._stamp(self.glossary_file)
+        if self._glossary is None or stamp != self._glossary_stamp:
+            self._glossary = Glossary.load(self.glossary_file)
+            self._glossary_stamp = stamp
+        return self._glossary
+    
+    def check_glossary(self, cell_ids=None):
+        """[(cell_id, bloco, [(termo EN, [traduções PT])])] das células fora do glossário
+        
+        Sem `cell_ids`, verifica todas as células traduzidas.
+        """
+        glossary = self.glossary()
+        if glossary is None:
+            return None
+        store = self.translations()
+        problems = []
+        for cell_id in sorted(store.index if cell_ids is None else cell_ids):
+            record = store.get(cell_id)
+            if record is None:
+                continue
+            missing = glossary.check(record['original'], record['translation'])
+            if missing:
+                problems.append((cell_id, store.block_of(cell_id).strip(), missing))
+        return problems
+    
+    def check_codes(self, cell_ids=None):
+        """[(cell_id, bloco, erros, avisos)] das células com códigos divergentes (validar_codigos)
+        
+        Sem `cell_ids`, verifica todas as células traduzidas numa passada.
+        """
+        store = self.translations()
+        problems = []
+        for cell_id in sorted(store.index if cell_ids is None else cell_ids):
+            record = store.get(cell_id)
+            if record is None or not record['translation']:
+                continue
+            erros, avisos = validar_codigos(record['original'], record['translation'])
+            if erros or avisos:
+                problems.append((cell_id, store.block_of(cell_id).strip(), erros, avisos))
+        return problems
+    
+    def propagation(self, updates):
+        """Rascunhos {cell_id: tradução} para as duplicatas não traduzidas das células em `updates`"""
+        return self.memory().propagate(self.status(), updates)
+    
+    def fill_from_memory(self, limit=None):
+        """Preenche como rascunho as células não traduzidas cujo original já tem tradução
+        
+        Ação explícita ("Preencher pela memória"), nunca parte da extração do lote: percorre
+        só as não traduzidas e para em `limit` células preenchidas (None = todas). Grava no
+        diário e retorna {cell_id: tradução}; os rascunhos ficam para revisão e não vão para
+        o binário (só a tradução validada na mesclagem vai).
+        """
+        status = self.status()
+        store = self.translations()
+        memory = self.memory()
+        shared = self.shared_memory()
+        if shared is not None:
+            shared.refresh()
+        drafts = {}
+        
+        def known(cell_id):
+            text = memory.known_translation(store, status, cell_id)
+            record = store.get(cell_id)
+            if not text and shared is not None and record is not None and record['original']:
+                # Mesmo original já traduzido em outro arquivo do jogo
+                found = shared.lookup(record['original'], refresh=False)
+                if found:
+                    text = found[0]
+            if text:
+                drafts[cell_id] = text
+            return bool(text)
+        
+        status.next_batch(len(status) if limit is None else limit, accept=known)
+        if drafts:
+            for cell_id, text in drafts.items():
+                store.set_translation(cell_id, text)
+            self.write_translations(store, {}, drafts)
+            print(f"✓ {len(drafts)} células preenchidas como rascunho pela memória de tradução (revise e mescle)")
+        return drafts
+    
+    def validated_updates(self):
+        """{cell_id: tradução} das células validadas que ainda não estão no .eng
+        
+        Rascunhos ficam de fora: só vão para o binário depois de mesclados.
+        """
+        status = self.status()
+        store = self.translations()
+        return {cell_id: store.get(cell_id)['translation']
+                for cell_id in status.next_batch(len(status), TranslationStatus.VALIDADA)}
+    
+    def word_index(self):
+        """WordIndex das células do BASE + diário (remontado só se o BASE mudar por fora)"""
+        store = self.translations()
+        if self._word_index is None or self._index_store is not store:
+            index = WordIndex()
+            for cell_id in store.index:
+                record = store.get(cell_id)
+                if record is not None:
+                    index.add((self.asset, cell_id), record['original'], record['translation'])
+            self._word_index = index
+            self._index_store = store
+        return self._word_index
+    
+    def search(self, query, field=None):
+        """(total de células, [(cell_id, bloco)] que satisfazem a consulta do WordIndex)"""
+        store = self.translations()
+        keys = self.word_index().query(query, field)
+        cell_ids = sorted(cell_id for asset, cell_id in keys if asset == self.asset)
+        return len(store), [(cell_id, store.block_of(cell_id).strip()) for cell_id in cell_ids]
+    
+    def trigram_index(self):
+        """TrigramIndex das células do BASE + diário (remontado só se o BASE mudar por fora)"""
+        store = self.translations()
+        if self._trigram_index is None or self._trigram_store is not store:
+            index = TrigramIndex()
+            for cell_id in store.index:
+                record = store.get(cell_id)
+                if record is not None:
+                    index.add((self.asset, cell_id), record['original'], record['translation'])
+            self._trigram_index = index
+            self._trigram_store = store
+        return self._trigram_index
+    
+    def search_fragment(self, text, regex=False, field=None):
+        """(total de células, gerador de (cell_id, bloco)) para um trecho ou regex
+        
+        Os blocos saem conforme são confirmados, para a tela mostrar enquanto pesquisa.
+        """
+        store = self.translations()
+        keys = self.trigram_index().search(text, regex, field)
+        
+        def blocks():
+            for asset, cell_id in keys:
+                if asset == self.asset:
+                    yield cell_id, store.block_of(cell_id).strip()
+        return len(store), blocks()
+    
+    def write_base(self, content):
+        """Grava o arquivo BASE e mantém a cópia em memória"""
+        with open(self.base_file, "w", encoding="utf-8") as f:
+            f.write(content)
+        self.content = content
+        self._base_stamp = self._stamp(self.base_file)
+    
+    def write_translations(self, store, updates, drafts=None):
+        """Acrescenta ao diário os blocos das células alteradas ({cell_id: tradução}, um fsync por mesclagem)
+        
+        `drafts` são as duplicatas preenchidas pela memória de tradução (ficam como rascunho).
+        """
+        drafts = drafts or {}
+        status = self.status()  # Em dia com o BASE + diário de antes desta gravação
+        try:
+            with open(self.journal_file, "ab") as f:
+                start = f.tell()
+                for cell_id in list(updates) + list(drafts):
+                    entry = {'cell': cell_id, 'block': store.block_of(cell_id)}
+                    f.write((json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+                end = f.tell()
+        except Exception:
+            self._store = None  # O store alterado não bate mais com o disco: reparseia na próxima
+            raise
+        self._store = store
+        for cell_id in updates:
+            status.set(cell_id, TranslationStatus.VALIDADA)
+        for cell_id in drafts:
+            status.set(cell_id, TranslationStatus.RASCUNHO)
+        if start == self._journal_offset:
+            # Nada de outro processo no meio: o que acabou de ser gravado já está no store
+            # e no status, que só ganha o carimbo novo (sem remontar)
+            self._journal_offset = end
+            self._journal_seen = self._journal_stamp()
+            self._save_status()
+        else:
+            # Outro processo gravou no diário antes: o próximo status() remonta, mantendo o validado aqui
+            self._status_source = None
+        
+        changed = {**drafts, **updates}
+        self._index_translations(store, changed)
+        
+        db = self.database()
+        if db is not None:
+            try:
+                db.set_translations(self.asset, changed)
+            except Exception as e:
+                print(f"⚠️ Erro ao gravar no banco {self.db_file}: {e}")
+        
+        # Só as traduções validadas vão para as outras ferramentas (rascunhos não)
+        shared = self.shared_memory()
+        if shared is not None:
+            try:
+                shared.record([(cell_id, store.get(cell_id)['original'], text)
+                               for cell_id, text in updates.items() if text and store.get(cell_id)['original']])
+            except Exception as e:
+                print(f"⚠️ Erro ao gravar na memória compartilhada {self.shared_file}: {e}")
+        
+        if self.journal_size() > JOURNAL_COMPACT_BYTES:
+            self.compact()
+    
+    def _index_translations(self, store, changed):
+        """Atualiza os índices e a memória aproximada já montados com {cell_id: tradução}"""
+        if self._word_index is not None and self._index_store is store:
+            for cell_id, text in changed.items():
+                self._word_index.set_field((self.asset, cell_id), 'translation', text)
+        if self._trigram_index is not None and self._trigram_store is store:
+            for cell_id, text in changed.items():
+                self._trigram_index.set_field((self.asset, cell_id), 'translation', text)
+        if self._fuzzy is not None and self._fuzzy_store is store:
+            for cell_id, text in changed.items():
+                self._fuzzy.add(cell_id, store.get(cell_id)['original'], text)
+    
+    def validate_paste(self, cola_lines):
+        """Valida os blocos colados contra o BASE (texto original e códigos de controle)
+        
+        Retorna ({cell_id: tradução} das células válidas, [(cell_id, mensagem)] das rejeitadas).
+        """
+        store = self.translations()
+        updates = {}
+        rejected = []
+        
+        # Cada bloco OFFSET: colado vira um registro (cell_id, original e tradução)
+        for record in ler_registros(cola_lines):
+            cell_id = record['cell_id']
+            original_text_from_clipboard = record['original']
+            traducao = record['translation']
+            
+            # Se encontrou cell_id e tradução, VALIDA antes de atualizar
+            if cell_id is not None and traducao and original_text_from_clipboard:
+                print(f"\nProcessando célula {cell_id}:")
+                print(f"  Original no clipboard: '{original_text_from_clipboard}'")
+                print(f"  Tradução: '{traducao}'")
+                
+                # VALIDAÇÃO: Verifica no arquivo BASE se o original bate
+                validation_passed = True
+                error_msg = ""
+                
+                # Bloco desta célula no arquivo BASE (busca direta pelo índice)
+                file_record = store.get(cell_id)
+                if file_record is not None:
+                    file_original_text = file_record['original']
+                    
+                    if file_original_text:
+                        print(f"  Original no arquivo: '{file_original_text}'")
+                        
+                        # Compara os textos originais
+                        if file_original_text != original_text_from_clipboard:
+                            validation_passed = False
+                            error_msg = f"Célula {cell_id}: Texto original não corresponde!\n" \
+                                      f"Arquivo: '{file_original_text}'\n" \
+                                      f"Clipboard: '{original_text_from_clipboard}'"
+                            
+                            # Verifica se a diferença é apenas em espaços ou formatação
+                            if file_original_text.strip() == original_text_from_clipboard.strip():
+                                print(f"  Aviso: Diferença apenas em espaços, corrigindo...")
+                                # Atualiza o texto no clipboard para bater com o arquivo
+                                original_text_from_clipboard = file_original_text
+                                validation_passed = True
+                                error_msg = ""
+                                print(f"  ✓ Corrigido: '{file_original_text}'")
+                    else:
+                        validation_passed = False
+                        error_msg = f"Célula {cell_id}: Não encontrou texto original no arquivo!"
+                else:
+                    validation_passed = False
+                    error_msg = f"Célula {cell_id}: Não encontrada no arquivo {self.base_file}!"
+                
+                # Códigos de controle, escapes e marcadores precisam continuar iguais na tradução
+                if validation_passed:
+                    erros_codigos, avisos_codigos = validar_codigos(file_original_text, traducao)
+                    if erros_codigos:
+                        validation_passed = False
+                        error_msg = f"Célula {cell_id}: Códigos de controle diferentes do original!\n" + \
+                                    "\n".join(erros_codigos)
+                    for aviso in avisos_codigos:
+                        print(f"  Aviso: {aviso}")
+                
+                # Se validação falhou
+                if not validation_passed:
+                    print(f"  ✗ VALIDAÇÃO FALHOU: {error_msg}")
+                    rejected.append((cell_id, error_msg))
+                    continue
+                
+                print(f"  ✓ Validação OK")
+                updates[cell_id] = traducao
+        
+        return updates, rejected
+    
+    def merge(self, updates):
+        """Grava no diário do BASE as traduções validadas {cell_id: tradução}
+        
+        As células repetidas (mesmo original) ainda não traduzidas recebem a tradução como
+        rascunho; retorna esses rascunhos {cell_id: tradução}.
+        """
+        store = self.translations()
+        
+        # Só os blocos das células coladas são alterados; o arquivo é gravado em uma passada
+        for cell_id, traducao in updates.items():
+            previous = store.set_translation(cell_id, traducao)
+            if previous:
+                print(f"  → Célula {cell_id}: substituindo tradução existente: '{previous}' por '{traducao}'")
+            else:
+                print(f"  → Célula {cell_id}: adicionando nova tradução: '{traducao}'")
+        
+        # Duplicatas (mesmo original) ainda não traduzidas recebem a tradução como rascunho
+        drafts = self.propagation(updates)
+        for cell_id, traducao in drafts.items():
+            store.set_translation(cell_id, traducao)
+            print(f"  → Célula {cell_id}: rascunho pela memória de tradução: '{traducao}'")
+        
+        self.write_translations(store, updates, drafts)
+        print(f"✓ {len(updates)} traduções gravadas no diário de {self.base_file}")
+        return drafts
+    
+    def merge_batch(self, updates):
+        """merge() de um lote colado, seguido da verificação do glossário só nas suas células
+        
+        Retorna (rascunhos {cell_id: tradução}, problemas do glossário como em check_glossary).
+        """
+        drafts = self.merge(updates)
+        if drafts:
+            print(f"✓ {len(drafts)} células repetidas preenchidas como rascunho (não vão para o binário)")
+        
+        problems = self.check_glossary(updates) or []
+        if problems:
+            print(f"⚠️ {len(problems)} células do lote sem a terminologia do glossário:")
+            for cell_id, block, missing in problems:
+                print(f"  → Célula {cell_id}: {descrever_termos(missing)}")
+        return drafts, problems
+    
+    def compact(self):
+        """Incorpora o diário ao BASE (formato de texto normal) e apaga o diário"""
+        if not os.path.exists(self.journal_file):
+            return False
+        
+        store = self.translations()
+        content = store.serialize()
+        
+        # Grava em um temporário e troca, para o BASE nunca ficar pela metade
+        temp_file = self.base_file + ".tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.base_file)
+        os.remove(self.journal_file)
+        self._journal_offset = 0
+        self._journal_seen = None
+        
+        self.content = content
+        self._base_stamp = self._stamp(self.base_file)
+        self._store_source = content
+        if self._status is not None:
+            self._save_status()  # Mesmo conteúdo, novo arquivo: só atualiza o carimbo
+        print(f"✓ Diário incorporado ao {self.base_file}")
+        return True
+    
+    def apply_updates(self, updates):
+        """Aplica {cell_id: texto} no binário em memória; retorna (sucessos, erros)"""
+        zeus_file = self.binary()
+        success_count = 0
+        error_count = 0
+        
+        for cell_id, new_text in updates.items():
+            try:
+                if zeus_file.update_string(cell_id, new_text):
+                    self.pending_cells.add(cell_id)
+                    success_count += 1
+                    print(f"✓ Célula {cell_id} atualizada na sessão")
+                else:
+                    error_count += 1
+                    print(f"✗ Erro ao atualizar célula {cell_id} no binário")
+            except Exception as e:
+                error_count += 1
+                print(f"✗ Exceção ao atualizar célula {cell_id}: {e}")
+        
+        return success_count, error_count
+    
+    def has_pending(self):
+        return bool(self.pending_cells)
+    
+    def analyze_build(self):
+        """(plan, relatório) da próxima gravação (ZeusTextFile.analyze_build), ou (None, None)"""
+        if not self.pending_cells:
+            return None, None
+        return self.zeus_file.analyze_build()
+    
+    def prepare_build(self):
+        """(problemas de códigos, plan, relatório) da próxima gravação, já mostrados no log
+        
+        Os problemas são as células com códigos de controle divergentes em todo o arquivo
+        (check_codes, só as com erro); plan e relatório vêm de analyze_build.
+        """
+        # Todo o arquivo numa passada: códigos de controle divergentes quebram o texto no jogo
+        try:
+            problems = [problem for problem in self.check_codes() if problem[2]]
+        except FileNotFoundError:
+            problems = []
+        if problems:
+            print(f"⚠️ {len(problems)} células com códigos de controle diferentes do original:")
+            for cell_id, block, erros, avisos in problems:
+                print(f"  → Célula {cell_id}: {', '.join(erros)}")
+        
+        # Caracteres fora do cp1252, nulls e crescimento do arquivo
+        plan, report = self.analyze_build()
+        print("\nANÁLISE DA GRAVAÇÃO:")
+        for line in descrever_analise(report):
+            print(line)
+        return problems, plan, report
+    
+    def build(self, plan=None):
+        """Grava no .eng as células pendentes (só a parte alterada do arquivo)
+        
+        `plan` vem do analyze_build, para não codificar as células de novo.
+        """
+        if not self.pending_cells:
+            return True
+        
+        if plan is None:
+            plan, report = self.analyze_build()
+            for line in descrever_analise(report):
+                print(line)
+        
+        print(f"\nGravando {len(self.pending_cells)} células pendentes em {self.bin_file}...")
+        if not self.zeus_file.save_incremental(plan):
+            return False
+        
+        if self._status is not None:
+            for cell_id in self.pending_cells:
+                # Rascunhos da memória de tradução continuam rascunho até serem validados
+                if self._status.get(cell_id) == TranslationStatus.VALIDADA:
+                    self._status.set(cell_id, TranslationStatus.NO_BINARIO)
+            self._save_status()
+        
+        self.pending_cells.clear()
+        self._bin_stamp = self._stamp(self.bin_file)
+        return True
@@ -0,0 +1,48 @@
+"""Validação dos códigos de controle, escapes e marcadores entre original e tradução"""
+import re
+from collections import Counter
+
+from .registros import anotar_bloco
+
+# ---------------- VALIDAÇÃO DE CÓDIGOS ---------------- #
+
+# Tudo que precisa passar igual do ORIGINAL para a TRADUÇÃO (a ordem das alternativas importa)
+CODE_RE = re.compile(
+    r"(?P<link>@\d+)"                        # @118 (início de link: @118higiene\x0E)
+    r"|(?P<format>@[A-Za-z])"                # @L, @P, @H, @G...
+    r"|(?P<escape>\\(?:x[0-9A-Fa-f]{2}|.))"  # \x0E, \t, \n do texto escapado
+    r"|(?P<printf>%\d*[A-Za-z])"             # %d, %s
+    r"|(?P<placeholder>\[[A-Za-z_]+\])"      # [city_name], [leader_name]
+    r"|(?P<number>\d+)")
+CODE_KINDS = {'link': "link", 'format': "código", 'escape': "escape", 'printf': "formato",
+              'placeholder': "marcador", 'number': "número"}
+
+def codigos_de_controle(texto):
+    """Multiconjunto (Counter) de (tipo, código) do texto"""
+    return Counter((match.lastgroup, match.group()) for match in CODE_RE.finditer(texto or ""))
+
+def validar_codigos(original, traducao):
+    """(erros, avisos) dos códigos que faltam ou sobram na tradução
+    
+    Links, códigos, escapes, formatos e marcadores diferentes são erro, assim como um
+    caractere nulo na tradução; números diferentes são só aviso (a frase pode ter sido
+    reescrita).
+    """
+    # O null separa as células no Data block: na tradução ele dividiria a célula
+    erros = ["caractere nulo (\\x00) na tradução"] if traducao and '\x00' in traducao else []
+    avisos = []
+    
+    esperado = codigos_de_controle(original)
+    obtido = codigos_de_controle(traducao)
+    if esperado == obtido:
+        return erros, avisos
+    
+    for titulo, diff in (("faltando", esperado - obtido), ("sobrando", obtido - esperado)):
+        for (kind, token), count in sorted(diff.items()):
+            msg = f"{titulo} {CODE_KINDS[kind]} {token}" + (f" ({count}x)" if count > 1 else "")
+            (avisos if kind == 'number' else erros).append(msg)
+    return erros, avisos
+
+def anotar_codigos(block, erros, avisos):
+    """Marca no bloco (antes da TRADUÇÃO:) os códigos divergentes"""
+    return anotar_bloco(block, [f"CÓDIGOS: {erro}" for erro in erros] + [f"AVISO: {aviso}" for aviso in avisos])
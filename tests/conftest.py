@@ -0,0 +1,92 @@
+"""Fixtures dos testes: .eng e _TRADUZIR sintéticos, pequenos e montados em tmp_path"""
+import os
+import sys
+import struct
+
+import pytest
+
+# Os testes rodam da raiz do projeto ou de tests/: o pacote fica um nível acima
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nucleo_traducao.emperor_text import ZeusTextFile as TextFile
+from nucleo_traducao.emperor_mm import ZeusTextFile as MMFile
+from nucleo_traducao.sessao import TranslatorSession
+
+# Células do EmperorText sintético, por grupo (o par 0 do arquivo é sempre vazio)
+GRUPOS_TEXTO = [
+    ["Farm", "Houses", "Build %d farms"],
+    ["@118Hygiene\x0E", "Granary", "Farm"],
+    ["City of [city_name]", "OK"],
+]
+
+# Células do EmperorMM sintético e as linhas da table: (S1, S2, S3) como índices de célula
+TEXTOS_MM = [b"About Emperor", b"Line\nbreak", b"Code\x0Eend", b"Back\\slash", b"Farm"]
+LINHAS_MM = [(0, None, None), (1, 2, None), (None, 3, 4), (4, None, None)]
+
+# ---------------- CONSTRUTORES ---------------- #
+
+def montar_eng_texto(grupos):
+    """Bytes de um EmperorText.eng com as células `grupos` (lista de listas de str)"""
+    data = bytearray()
+    pares = [(0, 0)]
+    for textos in grupos:
+        pares.append((len(textos), len(data)))
+        for texto in textos:
+            data += texto.encode('cp1252') + b'\x00'
+    pares += [(0, 0)] * (359 - len(pares))
+
+    total = sum(len(textos) for textos in grupos)
+    arquivo = bytearray(b'Emperor textfile'.ljust(16, b'\x00'))
+    arquivo += struct.pack('<4I', 359, total, 0, 0)
+    for count, offset in pares:
+        arquivo += struct.pack('<II', count, offset)
+    arquivo += b'\x00' * (TextFile.DATA_START - len(arquivo))
+    return bytes(arquivo + data)
+
+def montar_eng_mm(textos, linhas):
+    """Bytes de um EmperorMM.eng com as células `textos` (bytes) apontadas pelas `linhas`"""
+    data = bytearray()
+    offsets = []
+    for raw in textos:
+        offsets.append(len(data))
+        data += raw + b'\x00'
+
+    table = bytearray(MMFile.DATA_START - MMFile.TABLE_START)
+    for line_id, pointers in enumerate(linhas):
+        for (column, ptr_type), cell in zip(MMFile.POINTER_COLUMNS, pointers):
+            if cell is not None:
+                struct.pack_into('<I', table, line_id * MMFile.LINE_SIZE + column * 4, offsets[cell] + 0x10)
+
+    arquivo = bytearray(b'Emperor MM file.')
+    arquivo += struct.pack('<6I', len(linhas), len(textos), 0, 0, 0, 0)
+    return bytes(arquivo + table + data)
+
+def gravar(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return str(path)
+
+def bloco(cell_id, original, traducao=""):
+    """Bloco colado no formato _TRADUZIR (só os campos que a mesclagem confere)"""
+    return f"OFFSET: 0x00000000\nCELULA: {cell_id}\nORIGINAL [{len(original)} chars]: {original}\nTRADUÇÃO:\n{traducao}\n"
+
+# ---------------- FIXTURES ---------------- #
+
+@pytest.fixture
+def eng_texto(tmp_path):
+    return gravar(tmp_path / "EmperorText.eng", montar_eng_texto(GRUPOS_TEXTO))
+
+@pytest.fixture
+def eng_mm(tmp_path):
+    return gravar(tmp_path / "EmperorMM.eng", montar_eng_mm(TEXTOS_MM, LINHAS_MM))
+
+@pytest.fixture
+def sessao(tmp_path, eng_texto):
+    """TranslatorSession do EmperorText sintético, com o _TRADUZIR já extraído"""
+    glossario = tmp_path / "glossario.txt"
+    glossario.write_text("farm = fazenda\n", encoding="utf-8")
+    session = TranslatorSession(TextFile, eng_texto, str(tmp_path / "EmperorText_TRADUZIR.txt"),
+                                asset="EmperorText", shared_file=str(tmp_path / "memoria.jsonl"),
+                                glossary_file=str(glossario))
+    session.add_missing_cells()
+    return session
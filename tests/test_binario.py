@@ -0,0 +1,138 @@
+"""CellTable, DeltaPlan e gravação incremental nos dois formatos .eng"""
+import pickle
+import shutil
+
+from nucleo_traducao import binario
+from nucleo_traducao.binario import DeltaPlan
+
+from conftest import (GRUPOS_TEXTO, TEXTOS_MM, LINHAS_MM, TextFile, MMFile,
+                      montar_eng_texto, montar_eng_mm)
+
+def ler(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+def carregar(cls, path, **kwargs):
+    eng = cls(path)
+    eng.load(**kwargs)
+    return eng
+
+# ---------------- EMPERORTEXT ---------------- #
+
+NOVOS_TEXTO = {2: "Casas de madeira", 5: "Celeiro", 8: "Sim"}
+
+def grupos_com(novos):
+    textos = [texto for grupo in GRUPOS_TEXTO for texto in grupo]
+    for cell_id, texto in novos.items():
+        textos[cell_id - 1] = texto
+    grupos, pos = [], 0
+    for grupo in GRUPOS_TEXTO:
+        grupos.append(textos[pos:pos + len(grupo)])
+        pos += len(grupo)
+    return grupos
+
+def test_texto_celulas_e_grupos(eng_texto):
+    eng = carregar(TextFile, eng_texto, use_cache=False)
+    assert [s['text'] for s in eng.strings] == [t for grupo in GRUPOS_TEXTO for t in grupo]
+    assert [s['group_id'] for s in eng.strings] == [1, 1, 1, 2, 2, 2, 3, 3]
+    assert eng.groups[2]['strings'] == [4, 5, 6]
+
+def test_texto_incremental_igual_ao_arquivo_montado(eng_texto):
+    eng = carregar(TextFile, eng_texto, use_cache=False)
+    for cell_id, texto in NOVOS_TEXTO.items():
+        assert eng.update_string(cell_id, texto)
+    assert eng.save_incremental()
+    assert ler(eng_texto) == montar_eng_texto(grupos_com(NOVOS_TEXTO))
+
+    # O modelo em memória passa a ser o do arquivo gravado
+    assert [s['text'] for s in eng.strings] == [s['text'] for s in carregar(TextFile, eng_texto, use_cache=False).strings]
+    assert eng.strings.modified_count() == 0
+
+def test_texto_incremental_igual_ao_save_completo(eng_texto, tmp_path):
+    copia = str(tmp_path / "copia.eng")
+    shutil.copy(eng_texto, copia)
+    for path, salvar in ((eng_texto, "save_incremental"), (copia, "save")):
+        eng = carregar(TextFile, path, use_cache=False)
+        for cell_id, texto in NOVOS_TEXTO.items():
+            eng.update_string(cell_id, texto)
+        assert getattr(eng, salvar)()
+    assert ler(eng_texto) == ler(copia)
+
+def test_texto_incremental_com_mmap(eng_texto):
+    eng = carregar(TextFile, eng_texto, use_mmap=True, use_cache=False)
+    eng.update_string(1, "Fazenda")
+    assert eng.save_incremental()
+    assert ler(eng_texto) == montar_eng_texto(grupos_com({1: "Fazenda"}))
+
+def test_delta_plan_desloca_so_depois_das_modificadas(eng_texto):
+    eng = carregar(TextFile, eng_texto, use_cache=False)
+    cells = eng.strings
+    eng.update_string(2, "Houses!!")  # +2
+    eng.update_string(5, "Gran")      # -3
+    plan = DeltaPlan(cells)
+    assert plan.modified == [1, 4]
+    assert [plan.shift(offset) for offset in cells.offsets] == [0, 0, 2, 2, 2, -1, -1, -1]
+    assert plan.new_offsets() == [offset + plan.shift(offset) for offset in cells.offsets]
+    assert list(plan.new_lengths()) == [4, 8, 14, 12, 4, 4, 19, 2]
+
+def test_analise_separa_cp1252_e_nulo(eng_texto):
+    eng = carregar(TextFile, eng_texto, use_cache=False)
+    antes = ler(eng_texto)
+    eng.update_string(1, "Fazenda 日本")
+    eng.update_string(2, "Ca\x00sas")
+    plan, report = eng.analyze_build()
+    assert report['invalid'] == {1: "日本"}
+    assert report['null'] == [2]
+    assert plan.encoded[0] == b"Fazenda ??"
+    assert any("caractere nulo" in line for line in binario.descrever_analise(report))
+
+    # O null dividiria a célula: nada é gravado
+    assert not eng.save_incremental(plan)
+    assert ler(eng_texto) == antes
+
+def test_cache_restaura_a_mesma_estrutura(eng_texto):
+    eng = carregar(TextFile, eng_texto)
+    cached = carregar(TextFile, eng_texto)
+    assert list(cached.strings.offsets) == list(eng.strings.offsets)
+    assert [s['group_id'] for s in cached.strings] == [s['group_id'] for s in eng.strings]
+
+def test_cache_invalido_volta_ao_parse(eng_texto):
+    eng = TextFile(eng_texto)
+    for lixo in (b"nao e pickle", pickle.dumps([1, 2, 3]), pickle.dumps({'version': 1})):
+        with open(eng.cache_path(), 'wb') as f:
+            f.write(lixo)
+        eng = carregar(TextFile, eng_texto)
+        assert len(eng.strings) == 8
+
+# ---------------- EMPERORMM ---------------- #
+
+NOVOS_MM = {1: "Sobre o Emperor", 3: "Código\\x0Efim", 4: "Barra\\\\invertida"}
+BYTES_MM = {1: b"Sobre o Emperor", 3: b"C\xf3digo\x0efim", 4: b"Barra\\invertida"}
+
+def test_mm_referencias(eng_mm):
+    eng = carregar(MMFile, eng_mm, use_cache=False)
+    assert [s['safe_text'] for s in eng.strings] == ["About Emperor", "Line\\nbreak", "Code\\x0Eend",
+                                                     "Back\\\\slash", "Farm"]
+    assert eng.strings.references[4] == [(2, 'S3'), (3, 'S1')]
+
+def test_mm_incremental_igual_ao_arquivo_montado(eng_mm):
+    eng = carregar(MMFile, eng_mm, use_cache=False)
+    for cell_id, texto in NOVOS_MM.items():
+        assert eng.update_string(cell_id, texto)
+    assert eng.save_incremental()
+    textos = [BYTES_MM.get(cell_id, raw) for cell_id, raw in enumerate(TEXTOS_MM, 1)]
+    assert ler(eng_mm) == montar_eng_mm(textos, LINHAS_MM)
+
+    # Ponteiros relidos do arquivo gravado
+    assert eng.strings.references[4] == [(2, 'S3'), (3, 'S1')]
+    assert eng.strings[0]['safe_text'] == "Sobre o Emperor"
+
+def test_mm_incremental_igual_ao_save_completo(eng_mm, tmp_path):
+    copia = str(tmp_path / "copia.eng")
+    shutil.copy(eng_mm, copia)
+    for path, salvar in ((eng_mm, "save_incremental"), (copia, "save")):
+        eng = carregar(MMFile, path, use_cache=False)
+        for cell_id, texto in NOVOS_MM.items():
+            eng.update_string(cell_id, texto)
+        assert getattr(eng, salvar)()
+    assert ler(eng_mm) == ler(copia)
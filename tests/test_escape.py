@@ -0,0 +1,49 @@
+"""EscapeCodec do EmperorMM: bytes do Data block ↔ texto com escapes"""
+from nucleo_traducao.emperor_mm import CODEC, EscapeCodec
+
+TODOS_OS_BYTES = bytes(range(1, 256))
+
+def test_escape_de_controles_e_barra():
+    assert CODEC.escape(b"A\x0eB\\C\nD\tE\rF\x01") == "A\\x0EB\\\\C\\nD\\tE\\rF\\x01"
+    assert CODEC.escape("Ação".encode('cp1252')) == "Ação"
+
+def test_bytes_sem_cp1252_viram_hex():
+    # 0x81, 0x8D, 0x8F, 0x90 e 0x9D não existem no cp1252
+    assert CODEC.escape(b"\x81\x8d") == "\\x81\\x8D"
+
+def test_unescape_inverte_o_escape():
+    # Gravado como no CellTable.encode_new_text: cp1252, com fallback para latin-1
+    for code in TODOS_OS_BYTES:
+        raw = bytes([code])
+        text = CODEC.unescape(CODEC.escape(raw))
+        try:
+            back = text.encode('cp1252')
+        except UnicodeEncodeError:
+            back = text.encode('latin-1')
+        assert back == raw, code
+
+def test_escape_many_igual_ao_escape():
+    raws = [b"um\x0e", b"", b"dois\\tres", TODOS_OS_BYTES]
+    assert CODEC.escape_many(raws) == [CODEC.escape(raw) for raw in raws]
+    assert CODEC.escape_many([]) == []
+
+def test_unescape_many_igual_ao_unescape():
+    texts = ["um\\x0E", "", "dois\\\\x0Etres", "a\\nb"]
+    assert CODEC.unescape_many(texts) == [CODEC.unescape(text) for text in texts]
+
+def test_barra_dupla_e_sempre_literal():
+    assert CODEC.unescape("\\\\x0E") == "\\x0E"
+    assert CODEC.unescape("\\\\\\x0E") == "\\\x0e"
+    assert CODEC.unescape("fim\\") == "fim\\"
+    assert CODEC.unescape("\\q") == "\\q"
+
+def test_regra_antiga_so_difere_com_barra_dupla():
+    assert CODEC.unescape_legacy("\\\\x0E") == "\x0e"
+    assert CODEC.legacy_differs("\\\\x0E")
+    assert CODEC.legacy_differs("C:\\\\new")
+    assert not CODEC.legacy_differs("\\\\ sozinha")
+    assert not CODEC.legacy_differs("Code\\x0Eend\\n")
+
+def test_outro_encoding():
+    codec = EscapeCodec('latin-1')
+    assert codec.escape(b"\x81") == "\x81"
@@ -0,0 +1,68 @@
+"""AhoCorasick e Glossary (termos EN exigidos em PT, palavra inteira)"""
+import random
+
+from nucleo_traducao.glossario import AhoCorasick, Glossary, descrever_termos, anotar_glossario
+
+def ocorrencias_ingenuas(patterns, text):
+    return sorted((start, start + len(pattern), index)
+                  for index, pattern in enumerate(patterns)
+                  for start in range(len(text) - len(pattern) + 1)
+                  if text.startswith(pattern, start))
+
+def test_aho_corasick_acha_sobrepostas():
+    patterns = ["he", "she", "his", "hers"]
+    assert sorted(AhoCorasick(patterns).iter("ushers")) == [(1, 4, 1), (2, 4, 0), (2, 6, 3)]
+
+def test_aho_corasick_igual_a_busca_ingenua():
+    rng = random.Random(7)
+    for _ in range(200):
+        patterns = list({"".join(rng.choice("ab") for _ in range(rng.randint(1, 4))) for _ in range(5)})
+        text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 30)))
+        assert sorted(AhoCorasick(patterns).iter(text)) == ocorrencias_ingenuas(patterns, text)
+
+GLOSSARIO = Glossary([
+    ("farm", ["fazenda"]),
+    ("city", ["cidade"]),
+    ("housing", ["habitaç*", "moradia"]),
+])
+
+def faltando(original, traducao):
+    return [en for en, pts in GLOSSARIO.check(original, traducao)]
+
+def test_termo_presente_e_ausente():
+    assert faltando("Build a farm", "Construa uma fazenda") == []
+    assert faltando("Build a farm", "Construa um sítio") == ["farm"]
+
+def test_termo_en_palavra_inteira_com_plural():
+    assert faltando("Farms and cities", "Fazendas e cidades") == []
+    assert faltando("Farmer", "Fazendeiro") == []
+    assert faltando("[city_name] grows", "[city_name] cresce") == []
+
+def test_traducao_pt_palavra_inteira():
+    # "cidade" dentro de "cidadela" não conta; plural com "s"/"es" conta
+    assert faltando("The city", "A cidadela") == ["city"]
+    assert faltando("Two farms", "Duas fazendas") == []
+
+def test_prefixo_alternativas_e_acentos():
+    assert faltando("Housing", "Habitação") == []
+    assert faltando("Housing", "habitacoes") == []
+    assert faltando("Housing", "Moradias") == []
+    assert faltando("Housing", "Casas") == ["housing"]
+
+def test_escapes_separam_palavras():
+    assert faltando("@118farm\\x0E", "@118fazenda\\x0E") == []
+    assert faltando("@118farm\\x0E", "@118sitio\\x0E") == ["farm"]
+
+def test_celula_sem_traducao_nao_e_conferida():
+    assert GLOSSARIO.check("Build a farm", "") == []
+
+def test_load_e_anotacao(tmp_path):
+    path = tmp_path / "glossario.txt"
+    path.write_text("# comentário\nfarm = fazenda | sítio\n\nsem igual\n", encoding="utf-8")
+    glossary = Glossary.load(str(path))
+    assert glossary.terms == [("farm", ["fazenda", "sítio"])]
+
+    missing = glossary.check("A farm", "Uma granja")
+    assert descrever_termos(missing) == "farm → fazenda | sítio"
+    block = "OFFSET: 0x0\nCELULA: 1\nORIGINAL [6 chars]: A farm\nTRADUÇÃO:\nUma granja"
+    assert "GLOSSÁRIO: farm → fazenda | sítio\nTRADUÇÃO:" in anotar_glossario(block, missing)
@@ -0,0 +1,87 @@
+"""WordIndex (palavras, "|", prefixo) e TrigramIndex (trecho e regex)"""
+import re
+
+import pytest
+
+from nucleo_traducao.indices import WordIndex, TrigramIndex, literais_obrigatorios, remover_acentos
+
+CELULAS = {
+    1: ("Build a farm", "Construa uma fazenda"),
+    2: ("Farm or house", "Fazenda ou casa"),
+    3: ("@118Hygiene\x0E", "@118Higiene\x0E"),
+    4: ("Houses", ""),
+}
+
+@pytest.fixture
+def palavras():
+    index = WordIndex()
+    for cell_id, (original, translation) in CELULAS.items():
+        index.add(("EmperorText", cell_id), original, translation)
+    return index
+
+@pytest.fixture
+def trigramas():
+    index = TrigramIndex()
+    for cell_id, (original, translation) in CELULAS.items():
+        index.add(cell_id, original, translation)
+    return index
+
+def ids(keys):
+    return sorted(cell_id for asset, cell_id in keys)
+
+def test_remover_acentos():
+    assert remover_acentos("Ação é") == "ACAO E"
+
+def test_termos_sao_e(palavras):
+    assert ids(palavras.query("farm")) == [1, 2]
+    assert ids(palavras.query("farm build")) == [1]
+
+def test_barra_vertical_e_ou(palavras):
+    assert ids(palavras.query("build | house")) == [1, 2]
+    assert ids(palavras.query("build farm | casa")) == [1, 2]
+    assert ids(palavras.query("nada | houses")) == [4]
+
+def test_ou_e_or_sao_palavras(palavras):
+    assert ids(palavras.query("or")) == [2]
+    assert ids(palavras.query("ou")) == [2]
+
+def test_prefixo_e_acentos(palavras):
+    assert ids(palavras.query("hous*")) == [2, 4]
+    assert ids(palavras.query("fazênda")) == [1, 2]
+
+def test_campo(palavras):
+    assert ids(palavras.query("fazenda", field='original')) == []
+    assert ids(palavras.query("fazenda", field='translation')) == [1, 2]
+
+def test_reindexa_campo(palavras):
+    palavras.set_field(("EmperorText", 4), 'translation', "Casas")
+    assert ids(palavras.query("casas")) == [4]
+    palavras.set_field(("EmperorText", 2), 'translation', "")
+    assert ids(palavras.query("casa")) == []
+    assert ids(palavras.query("fazenda")) == [1]
+
+def test_trecho(trigramas):
+    assert list(trigramas.search("@118")) == [3]
+    assert list(trigramas.search("\x0e")) == [3]
+    assert list(trigramas.search("FAZ")) == [1, 2]
+    assert list(trigramas.search("ouse", field='original')) == [2, 4]
+
+def test_regex(trigramas):
+    assert list(trigramas.search(r"farm\b")) == []
+    assert list(trigramas.search(r"farm\b", regex=True)) == [1, 2]
+    assert list(trigramas.search(r"^H.*s$", regex=True)) == [4]
+    assert list(trigramas.search(r"uma|casa", regex=True, field='translation')) == [1, 2]
+
+def test_regex_invalido_falha_na_chamada(trigramas):
+    with pytest.raises(re.error):
+        trigramas.search("(", regex=True)
+
+def test_reindexa_trigramas(trigramas):
+    trigramas.set_field(1, 'translation', "Construa um sítio")
+    assert list(trigramas.search("fazenda")) == [2]
+    assert list(trigramas.search("sítio")) == [1]
+
+def test_literais_obrigatorios():
+    assert literais_obrigatorios(r"Build \d+ farms?") == ["Build ", " farm"]
+    assert literais_obrigatorios("a|b") is None
+    assert literais_obrigatorios(r"(opcional)? texto") == [" texto"]
@@ -0,0 +1,60 @@
+"""distancia_edicao (contra a programação dinâmica) e memória de tradução exata"""
+import random
+
+from nucleo_traducao.memoria import distancia_edicao, TranslationMemory, FuzzyMemory
+from nucleo_traducao.registros import TranslationStatus
+
+def levenshtein_pd(a, b):
+    """Referência: matriz de edição completa, uma linha por vez"""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+def test_casos_conhecidos():
+    assert distancia_edicao("kitten", "sitting") == 3
+    assert distancia_edicao("", "abc") == 3
+    assert distancia_edicao("abc", "") == 3
+    assert distancia_edicao("", "") == 0
+    assert distancia_edicao("Build %d farms", "Build %d houses") == 5
+
+def test_igual_a_programacao_dinamica():
+    rng = random.Random(2024)
+    for _ in range(500):
+        a = "".join(rng.choice("abcã ") for _ in range(rng.randint(0, 12)))
+        b = "".join(rng.choice("abcã ") for _ in range(rng.randint(0, 12)))
+        assert distancia_edicao(a, b) == levenshtein_pd(a, b), (a, b)
+
+def test_textos_longos():
+    # Mais de 64 caracteres: o bit-paralelo usa inteiros grandes
+    rng = random.Random(5)
+    for _ in range(20):
+        a = "".join(rng.choice("ab") for _ in range(rng.randint(60, 150)))
+        b = "".join(rng.choice("ab") for _ in range(rng.randint(60, 150)))
+        assert distancia_edicao(a, b) == levenshtein_pd(a, b)
+
+def test_simetrica():
+    assert distancia_edicao("fazenda", "fazendas") == distancia_edicao("fazendas", "fazenda") == 1
+
+def test_duplicatas_recebem_rascunho():
+    memory = TranslationMemory()
+    for cell_id, original in ((1, "Farm"), (2, "House"), (3, "Farm"), (4, "Farm")):
+        memory.add(cell_id, original)
+    status = TranslationStatus()
+    for cell_id in (1, 2, 3):
+        status.set(cell_id, TranslationStatus.NAO_TRADUZIDA)
+    status.set(4, TranslationStatus.VALIDADA)
+    assert memory.duplicates(1) == [3, 4]
+    # Só as duplicatas ainda não traduzidas recebem o rascunho
+    assert memory.propagate(status, {1: "Fazenda"}) == {3: "Fazenda"}
+    assert memory.propagate(status, {2: ""}) == {}
+
+def test_memoria_aproximada_sugere_parecido():
+    fuzzy = FuzzyMemory()
+    fuzzy.add(1, "Build %d farms", "Construa %d fazendas")
+    fuzzy.add(2, "Open the granary", "Abra o celeiro")
+    suggestions = fuzzy.suggest("Build %d houses")
+    assert [translation for score, original, translation, key in suggestions] == ["Construa %d fazendas"]
@@ -0,0 +1,101 @@
+"""Formato _TRADUZIR: leitor, TranslationStore e persistência do TranslationStatus"""
+import pickle
+
+from nucleo_traducao.registros import (ler_registros, formatar_bloco, TranslationStore, TranslationStatus,
+                                       anotar_sugestoes)
+
+TRADUZIR = (
+    "# Arquivo de tradução Emperor Text\n"
+    "# texto traduzido\n\n"
+    "OFFSET: 0x00001F5C\n"
+    "CELULA: 1  GRUPO: 1\n"
+    "ORIGINAL [4 chars]: Farm\n"
+    "TRADUÇÃO:\n"
+    "Fazenda\n\n"
+    "OFFSET: 0x00001F61\n"
+    "CELULA: 2  GRUPO: 1\n"
+    "ORIGINAL [8 chars]:   Houses\n"
+    "TRADUÇÃO:\n\n"
+    "OFFSET: 0x00001F6A\n"
+    "CELULA: 3  REFERÊNCIAS: L1[S2], L2[S1]\n"
+    "ORIGINAL [11 chars]: Code\\x0Eend\n"
+    "TRADUÇÃO:\n\n"
+)
+
+def test_ler_registros():
+    records = list(ler_registros(TRADUZIR.splitlines()))
+    assert [r['cell_id'] for r in records] == [1, 2, 3]
+    assert records[0]['translation'] == "Fazenda"
+    assert records[0]['offset'] == 0x1F5C
+    # Espaços no início do original fazem parte do texto
+    assert records[1]['original'] == "  Houses"
+    assert records[2]['refs'] == "REFERÊNCIAS: L1[S2], L2[S1]"
+
+def test_formatar_bloco_e_o_inverso_do_leitor():
+    for record in ler_registros(TRADUZIR.splitlines()):
+        block = formatar_bloco(record)
+        assert block == record['block']
+        assert next(ler_registros(block.split("\n")))['translation'] == record['translation']
+
+def test_store_altera_so_o_bloco_da_celula():
+    store = TranslationStore(TRADUZIR)
+    assert len(store) == 3 and 2 in store
+    assert store.set_translation(2, "Casas") == ""
+    assert store.set_translation(1, "Sítio") == "Fazenda"
+    assert store.set_translation(9, "x") is None
+    assert store.get(2)['translation'] == "Casas"
+
+    content = store.serialize()
+    assert content == (TRADUZIR.replace("Fazenda", "Sítio")
+                       .replace("  Houses\nTRADUÇÃO:\n", "  Houses\nTRADUÇÃO:\nCasas\n"))
+    assert TranslationStore(content).get(1)['translation'] == "Sítio"
+
+def test_store_troca_bloco():
+    store = TranslationStore(TRADUZIR)
+    block = store.block_of(3).replace("TRADUÇÃO:", "TRADUÇÃO:\nCódigo\\x0Efim")
+    assert store.replace_block(3, block)
+    assert store.get(3)['translation'] == "Código\\x0Efim"
+    assert not store.replace_block(7, block)
+
+def test_anotar_sugestoes():
+    block = formatar_bloco(next(ler_registros(TRADUZIR.splitlines())))
+    annotated = anotar_sugestoes(block, [(0.8, "Farms", "Fazendas", ("EmperorMM", 5))])
+    assert "SUGESTÃO 80% EmperorMM [Farms]: Fazendas\nTRADUÇÃO:" in annotated
+
+def status_de(store):
+    return TranslationStatus.from_store(store)
+
+def test_status_do_store():
+    status = status_de(TranslationStore(TRADUZIR))
+    assert status.get(1) == TranslationStatus.RASCUNHO
+    assert status.get(2) == TranslationStatus.NAO_TRADUZIDA
+    assert status.get(99) == TranslationStatus.AUSENTE
+    assert status.next_batch(5) == [2, 3]
+    assert status.next_batch(1, accept=lambda cell_id: cell_id != 2) == [3]
+    assert status.summary() == "1/3 traduzidas | 0 validadas | 0 no binário | 2 restantes"
+
+def test_status_mantem_o_validado_do_anterior():
+    store = TranslationStore(TRADUZIR)
+    previous = status_de(store)
+    previous.set(1, TranslationStatus.NO_BINARIO)
+    assert TranslationStatus.from_store(store, previous).get(1) == TranslationStatus.NO_BINARIO
+
+def test_status_persistido(tmp_path):
+    path = str(tmp_path / "base.status")
+    status = status_de(TranslationStore(TRADUZIR))
+    status.set(3, TranslationStatus.VALIDADA)
+    status.set(5, TranslationStatus.NAO_TRADUZIDA)
+    status.save(path, (10, 20, 0))
+
+    stamp, loaded = TranslationStatus.load(path)
+    assert stamp == (10, 20, 0)
+    assert bytes(loaded.states) == bytes(status.states)
+    assert loaded.counts == status.counts
+
+def test_status_invalido_e_ignorado(tmp_path):
+    path = tmp_path / "base.status"
+    assert TranslationStatus.load(str(path)) == (None, None)
+    for lixo in (b"lixo", pickle.dumps(["lista"]), pickle.dumps({'version': -1}),
+                 pickle.dumps({'version': 1, 'stamp': None, 'states': 5})):
+        path.write_bytes(lixo)
+        assert TranslationStatus.load(str(path)) == (None, None)
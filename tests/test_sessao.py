@@ -0,0 +1,149 @@
+"""TranslatorSession: extração, diário (replay/compact), status persistido e gravação no .eng"""
+import json
+import os
+
+from nucleo_traducao.registros import ler_registros, TranslationStatus
+
+from conftest import GRUPOS_TEXTO, TextFile, TranslatorSession, montar_eng_texto, bloco
+
+def outra_sessao(sessao):
+    """Sessão nova sobre os mesmos arquivos (como a linha de comando ao lado da interface)"""
+    return TranslatorSession(TextFile, sessao.bin_file, sessao.base_file, asset=sessao.asset,
+                             shared_file=sessao.shared_file, glossary_file=sessao.glossary_file)
+
+def colar(sessao, *blocos):
+    updates, rejected = sessao.validate_paste("\n".join(blocos).split("\n"))
+    assert rejected == []
+    return sessao.merge_batch(updates)
+
+def test_extracao_cria_o_base_e_e_idempotente(sessao):
+    store = sessao.translations()
+    assert len(store) == 8
+    assert store.get(4)['original'] == "@118Hygiene\x0E"
+    assert sessao.add_missing_cells() == (8, 8, 0)
+
+def test_extracao_so_acrescenta_as_que_faltam(sessao):
+    with open(sessao.base_file, encoding="utf-8") as f:
+        content = f.read()
+    # Corta as células 7 e 8: a extração as acrescenta sem mexer nas outras
+    sessao.write_base(content[:content.index("OFFSET: 0x00001F91")])
+    assert sessao.add_missing_cells() == (8, 6, 2)
+    assert [r['cell_id'] for r in sessao.iter_records()] == list(range(1, 9))
+
+def test_extracao_nao_preenche_pela_memoria(sessao):
+    colar(sessao, bloco(1, "Farm", "Fazenda"))
+    sessao.compact()
+    os.remove(sessao.base_file)
+    sessao.add_missing_cells()
+    # A memória compartilhada já conhece "Farm", mas extrair não traduz nada
+    assert all(not r['translation'] for r in sessao.iter_records())
+
+def test_colagem_rejeita_original_e_codigos(sessao):
+    updates, rejected = sessao.validate_paste(
+        (bloco(2, "Houses", "Casas") + bloco(5, "Barn", "Celeiro") + bloco(4, "@118Hygiene\x0E", "Higiene")).split("\n"))
+    assert updates == {2: "Casas"}
+    assert [cell_id for cell_id, message in rejected] == [5, 4]
+
+def test_mesclagem_vai_para_o_diario(sessao):
+    drafts, problems = colar(sessao, bloco(2, "Houses", "Casas"), bloco(1, "Farm", "Sítio"))
+    # A célula 6 tem o mesmo original da 1 e vira rascunho; "Sítio" não tem "fazenda"
+    assert drafts == {6: "Sítio"}
+    assert [cell_id for cell_id, block, missing in problems] == [1]
+
+    with open(sessao.journal_file, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+    assert [entry['cell'] for entry in entries] == [2, 1, 6]
+    # O BASE em si não é regravado a cada mesclagem
+    with open(sessao.base_file, encoding="utf-8") as f:
+        assert all(not r['translation'] for r in ler_registros(f.read().splitlines()))
+
+def test_outra_sessao_reaplica_o_diario(sessao):
+    colar(sessao, bloco(2, "Houses", "Casas"))
+    outra = outra_sessao(sessao)
+    assert outra.translations().get(2)['translation'] == "Casas"
+
+    # Mesclagem de outro processo: só o trecho novo do diário é reaplicado
+    colar(outra, bloco(5, "Granary", "Celeiro"))
+    assert sessao.translations().get(5)['translation'] == "Celeiro"
+
+def test_linha_incompleta_do_diario_fica_para_depois(sessao):
+    colar(sessao, bloco(2, "Houses", "Casas"))
+    block = sessao.translations().block_of(5).replace("TRADUÇÃO:", "TRADUÇÃO:\nCeleiro")
+    line = json.dumps({'cell': 5, 'block': block}, ensure_ascii=False) + "\n"
+    with open(sessao.journal_file, "a", encoding="utf-8") as f:
+        f.write(line[:20])
+
+    outra = outra_sessao(sessao)
+    assert outra.translations().get(2)['translation'] == "Casas"
+    assert outra.translations().get(5)['translation'] == ""
+
+    with open(sessao.journal_file, "a", encoding="utf-8") as f:
+        f.write(line[20:])
+    assert outra.translations().get(5)['translation'] == "Celeiro"
+
+def test_compactar_incorpora_o_diario(sessao):
+    colar(sessao, bloco(2, "Houses", "Casas"))
+    assert sessao.compact()
+    assert not os.path.exists(sessao.journal_file)
+    assert not sessao.compact()
+    with open(sessao.base_file, encoding="utf-8") as f:
+        assert "ORIGINAL [6 chars]: Houses\nTRADUÇÃO:\nCasas\n" in f.read()
+    assert outra_sessao(sessao).translations().get(2)['translation'] == "Casas"
+
+def test_status_persistido_sem_remontar(sessao, capsys):
+    colar(sessao, bloco(2, "Houses", "Casas"), bloco(1, "Farm", "Fazenda"))
+    capsys.readouterr()
+
+    status = outra_sessao(sessao).status()
+    assert "remontado" not in capsys.readouterr().out
+    assert status.get(2) == status.get(1) == TranslationStatus.VALIDADA
+    assert status.get(6) == TranslationStatus.RASCUNHO
+    assert status.get(3) == TranslationStatus.NAO_TRADUZIDA
+
+def test_status_remontado_se_o_base_mudou_por_fora(sessao, capsys):
+    colar(sessao, bloco(2, "Houses", "Casas"))
+    sessao.compact()
+    with open(sessao.base_file, encoding="utf-8") as f:
+        content = f.read()
+    with open(sessao.base_file, "w", encoding="utf-8") as f:
+        f.write(content.replace("Granary\nTRADUÇÃO:\n", "Granary\nTRADUÇÃO:\nCeleiro\n"))
+    capsys.readouterr()
+
+    status = outra_sessao(sessao).status()
+    assert "remontado" in capsys.readouterr().out
+    # O validado continua validado; a editada à mão fica como rascunho
+    assert status.get(2) == TranslationStatus.VALIDADA
+    assert status.get(5) == TranslationStatus.RASCUNHO
+
+def test_preencher_pela_memoria_e_explicito(sessao):
+    with open(sessao.base_file, encoding="utf-8") as f:
+        content = f.read()
+    sessao.write_base(content.replace("ORIGINAL [4 chars]: Farm\nTRADUÇÃO:\n", "ORIGINAL [4 chars]: Farm\nTRADUÇÃO:\nFazenda\n", 1))
+    status = sessao.status()
+    status.set(1, TranslationStatus.VALIDADA)
+
+    assert sessao.fill_from_memory() == {6: "Fazenda"}
+    assert sessao.status().get(6) == TranslationStatus.RASCUNHO
+    assert sessao.fill_from_memory() == {}
+
+def test_gravar_so_o_validado(sessao):
+    colar(sessao, bloco(2, "Houses", "Casas"), bloco(1, "Farm", "Fazenda"))
+    updates = sessao.validated_updates()
+    # O rascunho da célula 6 não vai para o binário
+    assert updates == {1: "Fazenda", 2: "Casas"}
+
+    assert sessao.apply_updates(updates) == (2, 0)
+    problems, plan, report = sessao.prepare_build()
+    assert problems == []
+    assert sessao.build(plan)
+    assert not sessao.has_pending()
+
+    grupos = [list(grupo) for grupo in GRUPOS_TEXTO]
+    grupos[0][:2] = ["Fazenda", "Casas"]
+    with open(sessao.bin_file, "rb") as f:
+        assert f.read() == montar_eng_texto(grupos)
+
+    status = sessao.status()
+    assert status.get(1) == status.get(2) == TranslationStatus.NO_BINARIO
+    assert status.get(6) == TranslationStatus.RASCUNHO
+    assert sessao.validated_updates() == {}
@@ -0,0 +1,35 @@
+"""validar_codigos: códigos de controle entre o ORIGINAL e a TRADUÇÃO"""
+from nucleo_traducao.validacao import codigos_de_controle, validar_codigos, anotar_codigos
+
+def test_codigos_iguais():
+    assert validar_codigos("@118Hygiene\\x0E: %d [city_name]", "@118Higiene\\x0E: %d [city_name]") == ([], [])
+
+def test_link_e_escape_faltando_sao_erro():
+    erros, avisos = validar_codigos("@118Hygiene\\x0E", "Higiene")
+    assert erros == ["faltando escape \\x0E", "faltando link @118"]
+    assert avisos == []
+
+def test_codigo_sobrando_e_contagem():
+    erros, avisos = validar_codigos("@L texto", "@L @L texto %s %s")
+    assert erros == ["sobrando código @L", "sobrando formato %s (2x)"]
+
+def test_numero_diferente_e_so_aviso():
+    assert validar_codigos("Build 5 farms", "Construa 6 fazendas") == ([], ["faltando número 5", "sobrando número 6"])
+
+def test_marcador_trocado():
+    erros, avisos = validar_codigos("[city_name]", "[nome_cidade]")
+    assert erros == ["faltando marcador [city_name]", "sobrando marcador [nome_cidade]"]
+
+def test_caractere_nulo_e_erro():
+    erros, avisos = validar_codigos("Farm", "Faz\x00enda")
+    assert erros == ["caractere nulo (\\x00) na tradução"]
+    assert validar_codigos("Farm", "") == ([], [])
+
+def test_multiconjunto():
+    assert codigos_de_controle("@P@P 10")[('format', '@P')] == 2
+    assert codigos_de_controle(None) == {}
+
+def test_anotacao_antes_da_traducao():
+    block = "CELULA: 1\nORIGINAL [4 chars]: @118\nTRADUÇÃO:\nx"
+    assert anotar_codigos(block, ["faltando link @118"], ["faltando número 5"]).split("\n")[2:4] == [
+        "CÓDIGOS: faltando link @118", "AVISO: faltando número 5"]
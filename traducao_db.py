@@ -0,0 +1,50 @@
+"""Linha de comando do banco SQLite opcional com as células de tradução do Emperor
+
+O banco (TranslationDB) fica em nucleo_traducao/banco.py; aqui só os comandos para
+importar/exportar o formato _TRADUZIR.txt e o EmperorEventmsg.txt e ver o progresso.
+
+Uso:
+    python traducao_db.py importar traducao.db EmperorText EmperorText_TRADUZIR.txt
+    python traducao_db.py exportar traducao.db EmperorText EmperorText_TRADUZIR.txt
+    python traducao_db.py importar-eventmsg traducao.db EmperorEventmsg.txt
+    python traducao_db.py exportar-eventmsg traducao.db EmperorEventmsg.txt
+    python traducao_db.py estatisticas traducao.db
+"""
+import sys
+
+from nucleo_traducao.banco import TranslationDB
+
+# ---------------- LINHA DE COMANDO ---------------- #
+
+def main(argv):
+    if len(argv) < 2:
+        print(__doc__)
+        return 1
+
+    command, db_path = argv[0], argv[1]
+    db = TranslationDB(db_path)
+    try:
+        if command == "importar" and len(argv) == 4:
+            count = db.import_traduzir(argv[2], argv[3])
+            print(f"✓ {count} células de {argv[3]} importadas como {argv[2]}")
+        elif command == "exportar" and len(argv) == 4:
+            count = db.export_traduzir(argv[2], argv[3])
+            print(f"✓ {count} células de {argv[2]} exportadas para {argv[3]}")
+        elif command == "importar-eventmsg" and len(argv) == 3:
+            count = db.import_eventmsg(argv[2])
+            print(f"✓ {count} frases de {argv[2]} importadas")
+        elif command == "exportar-eventmsg" and len(argv) == 3:
+            count = db.export_eventmsg(argv[2])
+            print(f"✓ {count} frases traduzidas gravadas em {argv[2]}")
+        elif command == "estatisticas":
+            for asset, (total, traduzidas) in db.stats().items():
+                print(f"{asset}: {traduzidas}/{total} traduzidas ({total - traduzidas} restantes)")
+        else:
+            print(__doc__)
+            return 1
+    finally:
+        db.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,24 @@
+import sys
+
+from nucleo_traducao.cli import executar_cli
+from nucleo_traducao.emperor_mm import ZeusTextFile
+from nucleo_traducao.sessao import TranslatorSession
+
+BASE = "Traducao-MM-Emperor/EmperorMM_TRADUZIR.txt"
+MAX = 50
+BUILD_IDLE_MS = 30000  # Grava o binário após 30s sem novas mesclagens
+SHARED_TM_FILE = "memoria_traducao.jsonl"  # Memória de tradução compartilhada com as outras ferramentas (None desliga)
+GLOSSARY_FILE = "glossario.txt"  # Termos EN → PT exigidos (um por linha: termo = tradução | alternativa)
+ASSET = "EmperorMM"  # Nome deste arquivo no banco SQLite
+DB_FILE = None  # Banco SQLite opcional (traducao_db.py), ex.: "traducao.db"
+BIN_FILE = "Traducao-MM-Emperor/EmperorMM.eng"
+TITULO = "Emperor Translator MM Helper - EXTRATOR COMPLETO"
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Com argumentos o script roda pela linha de comando (nucleo_traducao.cli), sem tkinter/pyperclip
+        sys.exit(executar_cli(ZeusTextFile, BASE, ASSET, sys.argv[1:], BIN_FILE, DB_FILE, SHARED_TM_FILE, GLOSSARY_FILE, MAX))
+    
+    from nucleo_traducao.interface import abrir_interface
+    abrir_interface(TranslatorSession(ZeusTextFile, BIN_FILE, BASE, DB_FILE, ASSET, SHARED_TM_FILE, GLOSSARY_FILE),
+                    TITULO, MAX, BUILD_IDLE_MS)